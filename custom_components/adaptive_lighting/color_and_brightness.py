@@ -7,7 +7,7 @@ import colorsys
 import datetime
 import logging
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, timedelta
 from enum import Enum
 from functools import cached_property, partial
@@ -37,6 +37,9 @@ class SunEvent(str, Enum):
 _ORDER = (SunEvent.SUNRISE, SunEvent.NOON, SunEvent.SUNSET, SunEvent.MIDNIGHT)
 _ALLOWED_ORDERS = {_ORDER[i:] + _ORDER[:i] for i in range(len(_ORDER))}
 
+# Number of per-day event tables kept by `SunEvents` before evicting the oldest
+_EVENT_TABLE_CACHE_SIZE = 4
+
 utcnow: partial[datetime.datetime] = partial(datetime.datetime.now, UTC)
 utcnow.__doc__ = "Get now in UTC time."
 
@@ -58,6 +61,13 @@ class SunEvents:
     sunrise_offset: datetime.timedelta = datetime.timedelta()
     sunset_offset: datetime.timedelta = datetime.timedelta()
     timezone: datetime.tzinfo = UTC
+    # Validated (timestamps, events) of yesterday, today and tomorrow, keyed by
+    # the UTC date. The settings are frozen, so a change of offsets or times
+    # creates a new instance (and thereby a fresh cache).
+    _event_tables: dict[
+        datetime.date,
+        tuple[list[float], list[tuple[SunEvent, float]]],
+    ] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def sunrise(self, dt: datetime.date) -> datetime.datetime:
         """Return the (adjusted) sunrise time for the given datetime."""
@@ -159,18 +169,40 @@ class SunEvents:
             _LOGGER.error(msg)
             raise ValueError(msg)
 
+    def event_table(
+        self,
+        date: datetime.date,
+    ) -> tuple[list[float], list[tuple[SunEvent, float]]]:
+        """Return the sorted sun events around the given UTC date.
+
+        The table spans the day before until the day after `date` and is
+        computed (and validated) only once per date.
+        """
+        table = self._event_tables.get(date)
+        if table is not None:
+            return table
+        midnight = datetime.datetime.combine(date, datetime.time(), tzinfo=UTC)
+        events = sorted(
+            (
+                event
+                for days in [-1, 0, 1]
+                for event in self.sun_events(midnight + timedelta(days=days))
+            ),
+            key=lambda x: x[1],
+        )
+        table = ([ts for _, ts in events], events)
+        if len(self._event_tables) >= _EVENT_TABLE_CACHE_SIZE:
+            del self._event_tables[min(self._event_tables)]
+        self._event_tables[date] = table
+        return table
+
     def prev_and_next_events(
         self,
         dt: datetime.datetime,
     ) -> list[tuple[SunEvent, float]]:
         """Get the previous and next sun event."""
-        events = [
-            event
-            for days in [-1, 0, 1]
-            for event in self.sun_events(dt + timedelta(days=days))
-        ]
-        events = sorted(events, key=lambda x: x[1])
-        i_now = bisect.bisect([ts for _, ts in events], dt.timestamp())
+        timestamps, events = self.event_table(dt.astimezone(UTC).date())
+        i_now = bisect.bisect(timestamps, dt.timestamp())
         return events[i_now - 1 : i_now + 1]
 
     def sun_position(self, dt: datetime.datetime) -> float:
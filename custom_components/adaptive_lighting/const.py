@@ -254,6 +254,17 @@ DOCS[CONF_SKIP_REDUNDANT_COMMANDS] = (
     "Disable if physical light states get out of sync with HA's recorded state."
 )
 
+CONF_BATCH_ADAPTATION_CALLS, DEFAULT_BATCH_ADAPTATION_CALLS = (
+    "batch_adaptation_calls",
+    False,
+)
+DOCS[CONF_BATCH_ADAPTATION_CALLS] = (
+    "Combine adaptation commands with identical brightness, color and "
+    "transition into a single `light.turn_on` call for multiple lights. "
+    "Reduces the load on bridges (e.g., Zigbee or Hue) when many lights adapt "
+    "at the same time. 📦"
+)
+
 CONF_INTERCEPT, DEFAULT_INTERCEPT = "intercept", True
 DOCS[CONF_INTERCEPT] = (
     "Intercept and adapt `light.turn_on` calls to enabling instantaneous color "
@@ -298,6 +309,8 @@ DOCS[CONF_USE_DEFAULTS] = (
 )
 
 TURNING_OFF_DELAY = 5
+# Time (seconds) during which identical adaptation calls are collected into one
+BATCH_ADAPTATION_WINDOW = 0.05
 
 DOCS_MANUAL_CONTROL = {
     CONF_ENTITY_ID: "The `entity_id` of the switch in which to (un)mark the "
@@ -402,6 +415,7 @@ VALIDATION_TUPLES: list[tuple[str, Any, Any]] = [
         DEFAULT_SKIP_REDUNDANT_COMMANDS,
         bool,
     ),
+    (CONF_BATCH_ADAPTATION_CALLS, DEFAULT_BATCH_ADAPTATION_CALLS, bool),
     (CONF_INTERCEPT, DEFAULT_INTERCEPT, bool),
     (CONF_MULTI_LIGHT_INTERCEPT, DEFAULT_MULTI_LIGHT_INTERCEPT, bool),
     (CONF_INCLUDE_CONFIG_IN_ATTRIBUTES, DEFAULT_INCLUDE_CONFIG_IN_ATTRIBUTES, bool),
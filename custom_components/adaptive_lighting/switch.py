@@ -89,10 +89,12 @@ from .const import (
     ATTR_ADAPT_BRIGHTNESS,
     ATTR_ADAPT_COLOR,
     ATTR_ADAPTIVE_LIGHTING_MANAGER,
+    BATCH_ADAPTATION_WINDOW,
     CONF_ADAPT_DELAY,
     CONF_ADAPT_ONLY_ON_BARE_TURN_ON,
     CONF_ADAPT_UNTIL_SLEEP,
     CONF_AUTORESET_CONTROL,
+    CONF_BATCH_ADAPTATION_CALLS,
     CONF_BRIGHTNESS_MODE,
     CONF_BRIGHTNESS_MODE_TIME_DARK,
     CONF_BRIGHTNESS_MODE_TIME_LIGHT,
@@ -227,22 +229,16 @@ def _switches_with_lights(
     expand_light_groups: bool = True,
 ) -> AdaptiveSwitches:
     """Get all switches that control at least one of the lights passed."""
-    config_entries = hass.config_entries.async_entries(DOMAIN)
-    data = hass.data[DOMAIN]
-    switches: AdaptiveSwitches = []
+    manager = hass.data[DOMAIN].get(ATTR_ADAPTIVE_LIGHTING_MANAGER)
+    if manager is None:  # no switch has been set up yet
+        return []
     all_check_lights = (
         _expand_light_groups(hass, lights) if expand_light_groups else set(lights)
     )
-    for config in config_entries:
-        entry = data.get(config.entry_id)
-        if entry is None:  # entry might be disabled and therefore missing
-            continue
-        switch = data[config.entry_id][SWITCH_DOMAIN]
-        switch._expand_light_groups(hass=hass)
-        # Check if any of the lights are in the switch's lights
-        if set(switch.lights) & set(all_check_lights):
-            switches.append(switch)
-    return switches
+    switches: set[AdaptiveSwitch] = set()
+    for light in all_check_lights:
+        switches.update(manager.switches_by_light.get(light, ()))
+    return list(switches)
 
 
 class NoSwitchFoundError(ValueError):
@@ -863,6 +859,12 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         # To count the number of `Context` instances
         self._context_cnt: int = 0
 
+        # Combines identical adaptation calls if `batch_adaptation_calls` is set
+        self._adaptation_call_batcher = _AdaptationCallBatcher(
+            hass,
+            BATCH_ADAPTATION_WINDOW,
+        )
+
         # Set in self._update_attrs_and_maybe_adapt_lights
         self._settings: dict[str, Any] = {}
 
@@ -933,6 +935,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
         self._adapt_only_on_bare_turn_on = data[CONF_ADAPT_ONLY_ON_BARE_TURN_ON]
         self._auto_reset_manual_control_time = data[CONF_AUTORESET_CONTROL]
         self._skip_redundant_commands = data[CONF_SKIP_REDUNDANT_COMMANDS]
+        self._batch_adaptation_calls = data[CONF_BATCH_ADAPTATION_CALLS]
         self._intercept = data[CONF_INTERCEPT]
         self._multi_light_intercept = data[CONF_MULTI_LIGHT_INTERCEPT]
         if not data[CONF_INTERCEPT] and data[CONF_MULTI_LIGHT_INTERCEPT]:
@@ -1024,6 +1027,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
     async def async_will_remove_from_hass(self) -> None:
         """Remove the listeners upon removing the component."""
         self._remove_listeners()
+        self.manager.remove_switch_lights(self)
 
     def _expand_light_groups(self, hass: HomeAssistant | None = None) -> None:
         hass = hass or self.hass
@@ -1034,6 +1038,7 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             self._auto_reset_manual_control_time,
         )
         self.lights = list(all_lights)
+        self.manager.update_switch_lights(self, self.lights)
 
     async def _setup_listeners(self, _: Event[NoEventData] | None = None) -> None:
         _LOGGER.debug("%s: Called '_setup_listeners'", self._name)
@@ -1357,6 +1362,13 @@ class AdaptiveSwitch(SwitchEntity, RestoreEntity):
             )
             light = service_data[ATTR_ENTITY_ID]
             self.manager.last_service_data[light] = service_data
+            if self._batch_adaptation_calls:
+                # Still a task per light, so cancellation works per light
+                await self._adaptation_call_batcher.async_call(
+                    service_data,
+                    data.context,
+                )
+                continue
             await self.hass.services.async_call(
                 LIGHT_DOMAIN,
                 SERVICE_TURN_ON,
@@ -1693,6 +1705,9 @@ class AdaptiveLightingManager:
         assert hass is not None
         self.hass = hass
         self.lights: set[str] = set()
+        # Reverse index of light → switches that control it (after expanding groups)
+        self.switches_by_light: dict[str, set[AdaptiveSwitch]] = {}
+        self._lights_by_switch: dict[AdaptiveSwitch, set[str]] = {}
 
         # Tracks 'light.turn_off' service calls
         self.turn_off_event: dict[str, Event] = {}
@@ -1773,6 +1788,26 @@ class AdaptiveLightingManager:
         for remove in self.listener_removers:
             remove()
 
+    def update_switch_lights(self, switch: AdaptiveSwitch, lights: list[str]) -> None:
+        """Update the light → switches index with the (expanded) lights of a switch."""
+        new_lights = set(lights)
+        old_lights = self._lights_by_switch.get(switch, set())
+        for light in old_lights - new_lights:
+            switches = self.switches_by_light.get(light)
+            if switches is None:
+                continue
+            switches.discard(switch)
+            if not switches:
+                del self.switches_by_light[light]
+        for light in new_lights - old_lights:
+            self.switches_by_light.setdefault(light, set()).add(switch)
+        self._lights_by_switch[switch] = new_lights
+
+    def remove_switch_lights(self, switch: AdaptiveSwitch) -> None:
+        """Remove a switch from the light → switches index."""
+        self.update_switch_lights(switch, [])
+        del self._lights_by_switch[switch]
+
     def set_proactively_adapting(self, context_id: str, entity_id: str) -> None:
         """Declare the adaptation with context_id as proactively adapting,
         and associate it to an entity_id.
@@ -2471,6 +2506,12 @@ class AdaptiveLightingManager:
         old_state = event.data.get("old_state")
         new_state = event.data.get("new_state")
 
+        if new_state is not None and _is_light_group(new_state):
+            # A light that was unavailable during setup turned out to be a group,
+            # expand it so its members end up in the light → switches index.
+            for switch in list(self.switches_by_light.get(entity_id, ())):
+                switch._expand_light_groups()
+
         new_on = (
             new_state if new_state is not None and new_state.state == STATE_ON else None
         )
@@ -2877,6 +2918,98 @@ class AdaptiveLightingManager:
         return False
 
 
+class _AdaptationCallBatcher:
+    """Combine identical adaptation `light.turn_on` calls of multiple lights.
+
+    Every light keeps its own adaptation task, which submits its service data
+    here and waits until the calls collected during `window` seconds are sent.
+    Calls with the same context and the same service data (apart from the
+    entity_id) are sent as a single multi-light `light.turn_on` call.
+    """
+
+    def __init__(self, hass: HomeAssistant, window: float) -> None:
+        """Initialize the batcher."""
+        self.hass = hass
+        self.window = window
+        # (context.id, service data without entity_id) → (context, data, futures)
+        self._pending: dict[
+            tuple[str, tuple[tuple[str, Any], ...]],
+            tuple[Context, ServiceData, dict[str, asyncio.Future[None]]],
+        ] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def async_call(self, service_data: ServiceData, context: Context) -> None:
+        """Queue the `light.turn_on` call and wait until it has been sent."""
+        light = service_data[ATTR_ENTITY_ID]
+        data = {k: v for k, v in service_data.items() if k != ATTR_ENTITY_ID}
+        key = (
+            context.id,
+            tuple(
+                (k, tuple(v) if isinstance(v, list) else v)
+                for k, v in sorted(data.items())
+            ),
+        )
+        _, _, futures = self._pending.setdefault(key, (context, data, {}))
+        if (previous := futures.get(light)) is not None and not previous.done():
+            previous.set_result(None)  # superseded by this call
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        futures[light] = future
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(self.window, self._flush)
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The adaptation of this light was cancelled, don't send it anymore
+            if futures.get(light) is future:
+                del futures[light]
+            raise
+
+    @callback
+    def _flush(self) -> None:
+        """Send the collected calls, one per distinct service data."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        for context, data, futures in pending.values():
+            futures = {  # noqa: PLW2901
+                light: future for light, future in futures.items() if not future.done()
+            }
+            if futures:
+                self.hass.async_create_task(self._async_send(context, data, futures))
+
+    async def _async_send(
+        self,
+        context: Context,
+        data: ServiceData,
+        futures: dict[str, asyncio.Future[None]],
+    ) -> None:
+        lights = list(futures)
+        service_data = {
+            **data,
+            ATTR_ENTITY_ID: lights[0] if len(lights) == 1 else lights,
+        }
+        _LOGGER.debug(
+            "Sending batched 'light.turn_on' with 'service_data': %s"
+            " with context.id='%s'",
+            service_data,
+            context.id,
+        )
+        try:
+            await self.hass.services.async_call(
+                LIGHT_DOMAIN,
+                SERVICE_TURN_ON,
+                service_data,
+                context=context,
+            )
+        except Exception as e:  # noqa: BLE001
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future in futures.values():
+            if not future.done():
+                future.set_result(None)
+
+
 class _AsyncSingleShotTimer:
     def __init__(self, delay: float, callback: Callable[[], None | Any]) -> None:
         """Initialize the timer."""
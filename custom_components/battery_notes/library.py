@@ -6,7 +6,7 @@ import asyncio
 import json
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import Any, Final, NamedTuple, cast
 
 from homeassistant.core import HomeAssistant
@@ -28,6 +28,9 @@ LIBRARY_BATTERY_TYPE: Final[str] = "battery_type"
 LIBRARY_BATTERY_QUANTITY: Final[str] = "battery_quantity"
 LIBRARY_MISSING: Final[str] = "##MISSING##"
 
+LIBRARY_INDEX_FILE: Final[str] = "library.index.json"
+LIBRARY_INDEX_VERSION: Final[int] = 1
+
 DATA_LIBRARY: HassKey[Library] = HassKey(f"{DOMAIN}_library")
 
 
@@ -57,10 +60,148 @@ class LibraryDevice:
         )
 
 
+LIBRARY_INDEX_FIELDS: Final[tuple[str, ...]] = tuple(
+    library_field.name for library_field in fields(LibraryDevice)
+)
+
+
+@dataclass
+class ManufacturerIndex:
+    """Library devices of a manufacturer, indexed by casefolded model.
+
+    Devices are stored with their position in the library, so lookups return them
+    in library order.
+    """
+
+    exact: dict[str, list[tuple[int, LibraryDevice]]] = field(default_factory=dict)
+    startswith: dict[str, list[tuple[int, LibraryDevice]]] = field(
+        default_factory=dict
+    )
+    startswith_lengths: set[int] = field(default_factory=set)
+    endswith: dict[str, list[tuple[int, LibraryDevice]]] = field(
+        default_factory=dict
+    )
+    endswith_lengths: set[int] = field(default_factory=set)
+    contains: list[tuple[str, int, LibraryDevice]] = field(default_factory=list)
+
+    def add(self, position: int, library_device: LibraryDevice) -> None:
+        """Add a library device to the index."""
+        model = library_device.model.casefold()
+        match library_device.model_match_method:
+            case None | "":
+                self.exact.setdefault(model, []).append((position, library_device))
+            case "startswith":
+                self.startswith.setdefault(model, []).append(
+                    (position, library_device)
+                )
+                self.startswith_lengths.add(len(model))
+            case "endswith":
+                self.endswith.setdefault(model, []).append((position, library_device))
+                self.endswith_lengths.add(len(model))
+            case "contains":
+                self.contains.append((model, position, library_device))
+
+    def find(self, model: str) -> list[LibraryDevice]:
+        """Get the library devices matching the casefolded model, in library order."""
+        matches = list(self.exact.get(model, ()))
+        for length in self.startswith_lengths:
+            if length <= len(model):
+                matches.extend(self.startswith.get(model[:length], ()))
+        for length in self.endswith_lengths:
+            if length <= len(model):
+                matches.extend(self.endswith.get(model[len(model) - length :], ()))
+        # Contains matches when the model is a part of the library model
+        matches.extend(
+            (position, library_device)
+            for library_model, position, library_device in self.contains
+            if model in library_model
+        )
+        matches.sort(key=lambda match: match[0])
+        return [library_device for _, library_device in matches]
+
+
+def _build_manufacturer_indexes(
+    library_devices: list[LibraryDevice],
+) -> dict[str, ManufacturerIndex]:
+    """Index the library devices by casefolded manufacturer and model."""
+    indexes: dict[str, ManufacturerIndex] = {}
+    for position, library_device in enumerate(library_devices):
+        manufacturer = library_device.manufacturer.casefold()
+        if manufacturer not in indexes:
+            indexes[manufacturer] = ManufacturerIndex()
+        indexes[manufacturer].add(position, library_device)
+    return indexes
+
+
+def _library_sources(library_files: list[str]) -> list[list[Any]] | None:
+    """Get the path, modification time and size of the library files."""
+    sources: list[list[Any]] = []
+    for library_file in library_files:
+        try:
+            stat = os.stat(library_file)
+        except OSError:
+            return None
+        sources.append([library_file, stat.st_mtime_ns, stat.st_size])
+    return sources
+
+
+def _load_library_index(
+    index_file: str, sources: list[list[Any]]
+) -> list[LibraryDevice] | None:
+    """Load the parsed library devices, if the index is up to date with the library files."""
+    try:
+        with open(index_file, encoding="utf-8") as file:
+            index_data = json.load(file)
+        if (
+            index_data.get("version") != LIBRARY_INDEX_VERSION
+            or index_data.get("sources") != sources
+        ):
+            return None
+        return [
+            LibraryDevice(**dict(zip(LIBRARY_INDEX_FIELDS, row, strict=True)))
+            for row in index_data[LIBRARY_DEVICES]
+        ]
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        json.JSONDecodeError,
+        AttributeError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ) as err:
+        _LOGGER.debug("Ignoring invalid library index at %s: %s", index_file, err)
+        return None
+
+
+def _save_library_index(
+    index_file: str,
+    sources: list[list[Any]],
+    library_devices: list[LibraryDevice],
+) -> None:
+    """Save the parsed library devices along with the library files they came from."""
+    index_data = {
+        "version": LIBRARY_INDEX_VERSION,
+        "sources": sources,
+        LIBRARY_DEVICES: [
+            [getattr(library_device, name) for name in LIBRARY_INDEX_FIELDS]
+            for library_device in library_devices
+        ],
+    }
+    try:
+        temp_file = f"{index_file}.tmp"
+        with open(temp_file, mode="w", encoding="utf-8") as file:
+            json.dump(index_data, file, separators=(",", ":"))
+        os.replace(temp_file, index_file)
+    except OSError as err:
+        _LOGGER.debug("Unable to save library index at %s: %s", index_file, err)
+
+
 class Library:  # pylint: disable=too-few-public-methods
     """Hold all known battery types."""
 
-    _manufacturer_devices: dict[str, list[LibraryDevice]] = {}
+    _manufacturer_indexes: dict[str, ManufacturerIndex] = {}
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Init."""
@@ -89,14 +230,48 @@ class Library:  # pylint: disable=too-few-public-methods
             with open(library_file, encoding="utf-8") as file:
                 return cast(dict[str, Any], json.load(file))
 
-        new_manufacturer_devices: dict[str, list[LibraryDevice]] = {}
+        new_library_devices: list[LibraryDevice] = []
+        library_files: list[str] = []
+        save_index = True
+
+        json_default_path = self.hass.config.path(
+            STORAGE_DIR, "battery_notes", "library.json"
+        )
+        json_index_path = self.hass.config.path(
+            STORAGE_DIR, "battery_notes", LIBRARY_INDEX_FILE
+        )
 
-        # User Library
         domain_config = self.hass.data.get(MY_KEY)
         if domain_config and domain_config.user_library != "":
-            json_user_path = self.hass.config.path(
-                STORAGE_DIR, "battery_notes", domain_config.user_library
+            library_files.append(
+                self.hass.config.path(
+                    STORAGE_DIR, "battery_notes", domain_config.user_library
+                )
             )
+        library_files.append(json_default_path)
+
+        # Parsed and indexed libraries, saved when they were last loaded
+        sources = await self.hass.async_add_executor_job(
+            _library_sources, library_files
+        )
+        if sources is not None:
+            index_devices = await self.hass.async_add_executor_job(
+                _load_library_index, json_index_path, sources
+            )
+            if index_devices is not None:
+                _LOGGER.debug(
+                    "Loaded %s devices from library index at %s",
+                    len(index_devices),
+                    json_index_path,
+                )
+                self._manufacturer_indexes = _build_manufacturer_indexes(
+                    index_devices
+                )
+                return
+
+        # User Library
+        if domain_config and domain_config.user_library != "":
+            json_user_path = library_files[0]
             _LOGGER.debug("Using user library file at %s", json_user_path)
 
             try:
@@ -104,12 +279,10 @@ class Library:  # pylint: disable=too-few-public-methods
                     _load_library_json, json_user_path
                 )
 
-                for json_device in user_json_data["devices"]:
-                    library_device = LibraryDevice.from_json(json_device)
-                    manufacturer = library_device.manufacturer.casefold()
-                    if manufacturer not in new_manufacturer_devices:
-                        new_manufacturer_devices[manufacturer] = []
-                    new_manufacturer_devices[manufacturer].append(library_device)
+                new_library_devices.extend(
+                    LibraryDevice.from_json(json_device)
+                    for json_device in user_json_data["devices"]
+                )
                 _LOGGER.debug("Loaded %s user devices", len(user_json_data["devices"]))
 
             except FileNotFoundError:
@@ -139,29 +312,35 @@ class Library:  # pylint: disable=too-few-public-methods
                     json_user_path,
                     err,
                 )
+                # Keep parsing the user library until it's fixed
+                save_index = False
 
         # Default Library
-        json_default_path = self.hass.config.path(
-            STORAGE_DIR, "battery_notes", "library.json"
-        )
-
         _LOGGER.debug("Using library file at %s", json_default_path)
 
         try:
             default_json_data = await self.hass.async_add_executor_job(
                 _load_library_json, json_default_path
             )
-            for json_device in default_json_data["devices"]:
-                library_device = LibraryDevice.from_json(json_device)
-                manufacturer = library_device.manufacturer.casefold()
-                if manufacturer not in new_manufacturer_devices:
-                    new_manufacturer_devices[manufacturer] = []
-                new_manufacturer_devices[manufacturer].append(library_device)
+            new_library_devices.extend(
+                LibraryDevice.from_json(json_device)
+                for json_device in default_json_data["devices"]
+            )
             _LOGGER.debug(
                 "Loaded %s default devices", len(default_json_data[LIBRARY_DEVICES])
             )
 
-            self._manufacturer_devices = new_manufacturer_devices
+            self._manufacturer_indexes = _build_manufacturer_indexes(
+                new_library_devices
+            )
+
+            if save_index and sources is not None:
+                await self.hass.async_add_executor_job(
+                    _save_library_index,
+                    json_index_path,
+                    sources,
+                    new_library_devices,
+                )
 
         except FileNotFoundError:
             _LOGGER.error(
@@ -181,7 +360,7 @@ class Library:  # pylint: disable=too-few-public-methods
     ) -> DeviceBatteryDetails | None:
         """Create a battery details object from the JSON devices data."""
 
-        if not bool(self._manufacturer_devices):
+        if not bool(self._manufacturer_indexes):
             return None
 
         # Test only
@@ -198,17 +377,15 @@ class Library:  # pylint: disable=too-few-public-methods
         partial_matching_devices = None
         fully_matching_devices = None
 
-        manufacturer_devices = self._manufacturer_devices.get(
+        manufacturer_index = self._manufacturer_indexes.get(
             device_to_find.manufacturer.casefold(), None
         )
-        if not manufacturer_devices:
+        if not manufacturer_index:
             return None
 
-        matching_devices = [
-            x
-            for x in manufacturer_devices
-            if self.device_basic_match(x, device_to_find)
-        ]
+        matching_devices = manufacturer_index.find(
+            str(device_to_find.model or "").casefold()
+        )
 
         if matching_devices and len(matching_devices) > 1:
             partial_matching_devices = [
@@ -261,7 +438,7 @@ class Library:  # pylint: disable=too-few-public-methods
     def is_loaded(self) -> bool:
         """Library loaded successfully."""
 
-        return bool(self._manufacturer_devices) and not self._is_loading
+        return bool(self._manufacturer_indexes) and not self._is_loading
 
     def device_basic_match(
         self, library_device: LibraryDevice, device_to_find: ModelInfo
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Coroutine
 from typing import Any
 from pathlib import Path
 
@@ -41,6 +42,13 @@ class BlueprintStudioApiView(HomeAssistantView):
         self.ai.hass = hass
         self.file.hass = hass
 
+    async def _git_tree_action(self, action: Coroutine[Any, Any, web.Response]) -> web.Response:
+        """Run a git action that can change the working tree, then rescan the file listings."""
+        try:
+            return await action
+        finally:
+            self.file.invalidate()
+
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET requests."""
         params = request.query
@@ -52,7 +60,8 @@ class BlueprintStudioApiView(HomeAssistantView):
 
         if action == "list_files":
             show_hidden = params.get("show_hidden", "false").lower() == "true"
-            files = await hass.async_add_executor_job(self.file.list_files, show_hidden)
+            force_refresh = params.get("force", "false").lower() == "true"
+            files = await hass.async_add_executor_job(self.file.list_files, show_hidden, force_refresh)
             return json_response(files)
         if action == "list_all":
             show_hidden = params.get("show_hidden", "false").lower() == "true"
@@ -60,7 +69,8 @@ class BlueprintStudioApiView(HomeAssistantView):
             items = await hass.async_add_executor_job(self.file.list_all, show_hidden, force_refresh)
             return json_response(items)
         if action == "list_git_files":
-            items = await hass.async_add_executor_job(self.file.list_git_files)
+            force_refresh = params.get("force", "false").lower() == "true"
+            items = await hass.async_add_executor_job(self.file.list_git_files, force_refresh)
             return json_response(items)
         if action == "read_file":
             path = params.get("path")
@@ -150,24 +160,18 @@ class BlueprintStudioApiView(HomeAssistantView):
         if action == "git_status": return await self.git.get_status(data.get("fetch", False))
         if action == "git_log": return await self.git.get_log(data.get("count", 20))
         if action == "git_diff_commit": return await self.git.diff_commit(data.get("hash"))
-        if action == "git_pull": 
-            response = await self.git.pull()
-            if response.status == 200: self.file._file_cache = None
-            return response
+        if action == "git_pull": return await self._git_tree_action(self.git.pull())
         if action == "git_push": return await self.git.push(data.get("commit_message", "Update via Blueprint Studio"))
         if action == "git_push_only": return await self.git.push_only()
         if action == "git_commit": return await self.git.commit(data.get("commit_message", "Update via Blueprint Studio"))
         if action == "git_show": return await self.git.show(data.get("path"))
-        if action == "git_init": 
-            response = await self.git.init()
-            if response.status == 200: self.file._file_cache = None
-            return response
+        if action == "git_init": return await self._git_tree_action(self.git.init())
         if action == "git_add_remote": return await self.git.add_remote(data.get("name", "origin"), data.get("url"))
         if action == "git_remove_remote": return await self.git.remove_remote(data.get("name"))
-        if action == "git_delete_repo": return await self.git.delete_repo()
+        if action == "git_delete_repo": return await self._git_tree_action(self.git.delete_repo())
         if action == "git_repair_index": return await self.git.repair_index()
         if action == "git_rename_branch": return await self.git.rename_branch(data.get("old_name"), data.get("new_name"))
-        if action == "git_merge_unrelated": return await self.git.merge_unrelated(data.get("remote", "origin"), data.get("branch", "main"))
+        if action == "git_merge_unrelated": return await self._git_tree_action(self.git.merge_unrelated(data.get("remote", "origin"), data.get("branch", "main")))
         if action == "git_force_push": 
             remote = data.get("remote", "origin")
             auth = "gitea" if remote == "gitea" else "github"
@@ -175,14 +179,12 @@ class BlueprintStudioApiView(HomeAssistantView):
         if action == "git_hard_reset": 
             remote = data.get("remote", "origin")
             auth = "gitea" if remote == "gitea" else "github"
-            response = await self.git.hard_reset(remote, data.get("branch", "main"), auth_provider=auth)
-            if response.status == 200: self.file._file_cache = None
-            return response
+            return await self._git_tree_action(self.git.hard_reset(remote, data.get("branch", "main"), auth_provider=auth))
         if action == "git_delete_remote_branch": return await self.git.delete_remote_branch(data.get("branch"))
-        if action == "git_abort": return await self.git.abort()
+        if action == "git_abort": return await self._git_tree_action(self.git.abort())
         if action == "git_stage": return await self.git.stage(data.get("files", []))
         if action == "git_unstage": return await self.git.unstage(data.get("files", []))
-        if action == "git_reset": return await self.git.reset(data.get("files", []))
+        if action == "git_reset": return await self._git_tree_action(self.git.reset(data.get("files", [])))
         if action == "git_clean_locks": return await self.git.clean_locks()
         if action == "git_stop_tracking": return await self.git.stop_tracking(data.get("files", []))
         if action == "git_get_remotes": return await self.git.get_remotes()
@@ -193,7 +195,7 @@ class BlueprintStudioApiView(HomeAssistantView):
         
         # Gitea Specific
         if action == "gitea_status": return await self.git.get_status(data.get("fetch", False), remote="gitea", auth_provider="gitea")
-        if action == "gitea_pull": return await self.git.pull(remote="gitea", auth_provider="gitea")
+        if action == "gitea_pull": return await self._git_tree_action(self.git.pull(remote="gitea", auth_provider="gitea"))
         if action == "gitea_push": return await self.git.push(data.get("commit_message", "Update via Blueprint Studio"), remote="gitea", auth_provider="gitea")
         if action == "gitea_push_only": return await self.git.push_only(remote="gitea", auth_provider="gitea")
         # Commit/Stage/Unstage/Reset are local operations, so we reuse git_commit etc. or assume they share the same repo state.
@@ -38,6 +38,9 @@ EXCLUDED_PATTERNS = {
     ".git_credential_helper",
 }
 
+# Seconds after which the file tree index is rebuilt, to pick up external changes
+FILE_INDEX_TTL = 30
+
 # Protected paths that cannot be deleted
 PROTECTED_PATHS = {
     "configuration.yaml",
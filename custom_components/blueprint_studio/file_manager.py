@@ -8,7 +8,9 @@ import os
 import shutil
 import zipfile
 import mimetypes
+import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -17,12 +19,147 @@ from homeassistant.core import HomeAssistant
 
 from .const import (
     ALLOWED_EXTENSIONS, BINARY_EXTENSIONS, ALLOWED_FILENAMES,
-    EXCLUDED_PATTERNS, PROTECTED_PATHS
+    EXCLUDED_PATTERNS, FILE_INDEX_TTL, PROTECTED_PATHS
 )
 from .util import json_response, json_message, get_safe_path
 
 _LOGGER = logging.getLogger(__name__)
 
+def _get_dir_size(path: Path) -> int:
+    """Get directory size."""
+    total = 0
+    try:
+        for entry in os.scandir(path):
+            if entry.is_file(): total += entry.stat().st_size
+            elif entry.is_dir(): total += _get_dir_size(Path(entry.path))
+    except (OSError, PermissionError): pass
+    return total
+
+class IndexedDir:
+    """Directory in the file tree index, with the total size of everything below it."""
+
+    __slots__ = ("dirs", "files", "size", "opaque")
+
+    def __init__(self, opaque: bool = False) -> None:
+        """Initialize indexed directory."""
+        self.dirs: dict[str, IndexedDir] = {}
+        self.files: dict[str, int] = {}
+        self.size = 0
+        # Only the size of opaque directories (symlinks) is indexed, not their contents
+        self.opaque = opaque
+
+class FileTreeIndex:
+    """In-memory index of a directory tree.
+
+    Directory sizes are aggregated bottom-up in a single scan. Paths marked as changed
+    are rescanned on the next listing, the whole tree is rescanned once the index is
+    older than FILE_INDEX_TTL to pick up external changes. .git directories are never
+    listed and not indexed at all.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize file tree index."""
+        self.root = root
+        self._tree: IndexedDir | None = None
+        self._last_scan: float = 0
+        self._listings: dict[Any, list[dict]] = {}
+        self._lock = threading.Lock()
+        # Changes are marked from the event loop, which shouldn't wait for a scan to finish
+        self._changed: set[tuple[str, ...]] = set()
+        self._changed_lock = threading.Lock()
+
+    def mark_changed(self, path: Path | None = None) -> None:
+        """Mark a path as changed, or the whole tree if no path is given."""
+        parts: tuple[str, ...] = ()
+        if path is not None:
+            try: parts = path.relative_to(self.root).parts
+            except ValueError: pass
+        with self._changed_lock:
+            self._changed.add(parts)
+
+    def listing(self, key: Any, build: Callable[[IndexedDir], list[dict]], force: bool = False) -> list[dict]:
+        """Get a listing built from the index, cached until the index changes."""
+        with self._lock:
+            self._update(force)
+            if key not in self._listings:
+                self._listings[key] = build(self._tree)
+            return self._listings[key]
+
+    def _update(self, force: bool) -> None:
+        """Bring the index up to date with the changed paths."""
+        with self._changed_lock:
+            changed, self._changed = self._changed, set()
+
+        if force or self._tree is None or () in changed or time.time() - self._last_scan >= FILE_INDEX_TTL:
+            self._tree = self._scan(self.root)
+            self._last_scan = time.time()
+            self._listings = {}
+            return
+
+        if changed:
+            for parts in sorted(changed, key=len):
+                self._update_path(parts)
+            self._listings = {}
+
+    def _scan(self, path: Path, opaque: bool = False) -> IndexedDir:
+        """Scan a directory, aggregating the sizes of its contents."""
+        node = IndexedDir(opaque)
+        if opaque:
+            node.size = _get_dir_size(path)
+            return node
+        try:
+            with os.scandir(path) as it: entries = list(it)
+        except OSError:
+            return node
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if entry.name == ".git": continue
+                    child = self._scan(Path(entry.path), entry.is_symlink())
+                    node.dirs[entry.name] = child
+                    node.size += child.size
+                    continue
+            except OSError: pass
+            try: size = entry.stat().st_size
+            except OSError: size = 0
+            node.files[entry.name] = size
+            node.size += size
+        return node
+
+    def _update_path(self, parts: tuple[str, ...]) -> None:
+        """Rescan a changed path and update the sizes of its ancestors."""
+        if ".git" in parts[:-1]: return
+        node = self._tree
+        ancestors = [node]
+        for depth, part in enumerate(parts[:-1]):
+            child = node.dirs.get(part)
+            if child is None or child.opaque:
+                # Rescan the first new or opaque directory as a whole
+                parts = parts[:depth + 1]
+                break
+            node = child
+            ancestors.append(node)
+
+        name = parts[-1]
+        path = self.root.joinpath(*parts)
+        old = node.dirs.pop(name, None)
+        old_size = old.size if old is not None else node.files.pop(name, 0)
+        new_size = 0
+        try:
+            if path.is_dir():
+                if name != ".git":
+                    child = self._scan(path, path.is_symlink())
+                    node.dirs[name] = child
+                    new_size = child.size
+            elif os.path.lexists(path):
+                try: new_size = path.stat().st_size
+                except OSError: new_size = 0
+                node.files[name] = new_size
+        except OSError: pass
+
+        for ancestor in ancestors:
+            ancestor.size += new_size - old_size
+
 class FileManager:
     """Class to handle file operations."""
 
@@ -30,8 +167,7 @@ class FileManager:
         """Initialize file manager."""
         self.hass = hass
         self.config_dir = config_dir
-        self._file_cache: dict[bool, list[dict]] = {}
-        self._last_cache_update: float = 0
+        self._index = FileTreeIndex(config_dir)
 
     def _is_file_allowed(self, path: Path) -> bool:
         """Check if file type/name is allowed."""
@@ -40,28 +176,23 @@ class FileManager:
                 return True
         except ValueError:
             pass
-        return (path.suffix.lower() in ALLOWED_EXTENSIONS or path.name in ALLOWED_FILENAMES)
+        return self._is_name_allowed(path.name)
+
+    def _is_name_allowed(self, name: str) -> bool:
+        """Check if file type/name is allowed outside of .storage."""
+        return (Path(name).suffix.lower() in ALLOWED_EXTENSIONS or name in ALLOWED_FILENAMES)
 
     def _is_protected(self, path: str) -> bool:
         """Check if path is protected."""
         parts = path.strip("/").split("/")
         return parts[0] in PROTECTED_PATHS or path.strip("/") in PROTECTED_PATHS
 
-    def _get_dir_size(self, path: Path) -> int:
-        """Get directory size."""
-        total = 0
-        try:
-            for entry in os.scandir(path):
-                if entry.is_file(): total += entry.stat().st_size
-                elif entry.is_dir(): total += self._get_dir_size(Path(entry.path))
-        except (OSError, PermissionError): pass
-        return total
+    def invalidate(self) -> None:
+        """Rescan the whole tree on the next listing, after changes made outside of the file manager."""
+        self._index.mark_changed()
 
     def _fire_update(self, action: str, path: str | None = None):
         """Fire a websocket update event."""
-        # Invalidate both caches on any change
-        self._file_cache = {}
-        
         if self.hass:
             self.hass.bus.async_fire("blueprint_studio_update", {
                 "action": action,
@@ -69,63 +200,41 @@ class FileManager:
                 "timestamp": time.time()
             })
 
-    def list_files(self, show_hidden: bool = False) -> list[dict]:
-        """List files recursively."""
+    def _list_tree(self, tree: IndexedDir, show_hidden: bool = False, git: bool = False) -> list[dict]:
+        """List the indexed files and folders, filtered for the editor or for git."""
         res = []
-        for root, dirs, files in os.walk(self.config_dir):
-            if not show_hidden: dirs[:] = [d for d in dirs if d not in EXCLUDED_PATTERNS and not d.startswith(".")]
-            else: dirs[:] = [d for d in dirs if d not in EXCLUDED_PATTERNS]
-            rel_root = Path(root).relative_to(self.config_dir)
-            for name in sorted(files):
-                file_path = Path(root) / name
-                if (not show_hidden and name.startswith(".")) or not self._is_file_allowed(file_path): continue
-                res.append({"path": str(rel_root / name if str(rel_root) != "." else name), "name": name, "type": "file"})
+
+        def visit(node: IndexedDir, rel_root: str, in_storage: bool) -> None:
+            for name, child in node.dirs.items():
+                if git:
+                    if name == ".git": continue
+                elif name in EXCLUDED_PATTERNS or (not show_hidden and name.startswith(".")): continue
+                path = f"{rel_root}/{name}" if rel_root else name
+                res.append({"path": path, "name": name, "type": "folder", "size": child.size})
+                visit(child, path, in_storage or name == ".storage")
+            for name, size in node.files.items():
+                if not git:
+                    if not show_hidden and name.startswith("."): continue
+                    if not (in_storage or name == ".storage" or self._is_name_allowed(name)): continue
+                res.append({"path": f"{rel_root}/{name}" if rel_root else name, "name": name, "type": "file", "size": size})
+
+        visit(tree, "", False)
         return sorted(res, key=lambda x: x["path"])
 
+    def list_files(self, show_hidden: bool = False, force: bool = False) -> list[dict]:
+        """List files recursively."""
+        return self._index.listing(("files", show_hidden), lambda tree: [
+            {"path": item["path"], "name": item["name"], "type": "file"}
+            for item in self._list_tree(tree, show_hidden) if item["type"] == "file"
+        ], force)
+
     def list_all(self, show_hidden: bool = False, force: bool = False) -> list[dict]:
         """List all files and folders."""
-        # Use cache if available and not too old (30s TTL as fallback) and not forced
-        if not force and show_hidden in self._file_cache and (time.time() - self._last_cache_update < 30):
-            return self._file_cache[show_hidden]
+        return self._index.listing(("all", show_hidden), lambda tree: self._list_tree(tree, show_hidden), force)
 
-        res = []
-        for root, dirs, files in os.walk(self.config_dir):
-            # Control recursion and filter directories
-            if not show_hidden:
-                dirs[:] = [d for d in dirs if d not in EXCLUDED_PATTERNS and not d.startswith(".")]
-            else:
-                dirs[:] = [d for d in dirs if d not in EXCLUDED_PATTERNS]
-
-            rel_root = Path(root).relative_to(self.config_dir)
-            for name in sorted(dirs):
-                res.append({"path": str(rel_root / name if str(rel_root) != "." else name), "name": name, "type": "folder", "size": self._get_dir_size(Path(root) / name)})
-            for name in sorted(files):
-                file_path = Path(root) / name
-                if (not show_hidden and name.startswith(".")) or not self._is_file_allowed(file_path): continue
-                try: size = file_path.stat().st_size
-                except: size = 0
-                res.append({"path": str(rel_root / name if str(rel_root) != "." else name), "name": name, "type": "file", "size": size})
-        
-        # Save to specific cache (hidden or visible)
-        self._file_cache[show_hidden] = sorted(res, key=lambda x: x["path"])
-        self._last_cache_update = time.time()
-
-        return self._file_cache[show_hidden]
-
-    def list_git_files(self) -> list[dict]:
+    def list_git_files(self, force: bool = False) -> list[dict]:
         """List all files for git management."""
-        res = []
-        for root, dirs, files in os.walk(self.config_dir):
-            if ".git" in dirs: dirs.remove(".git")
-            rel_root = Path(root).relative_to(self.config_dir)
-            for name in sorted(dirs):
-                res.append({"path": str(rel_root / name if str(rel_root) != "." else name), "name": name, "type": "folder", "size": self._get_dir_size(Path(root) / name)})
-            for name in sorted(files):
-                file_path = Path(root) / name
-                try: size = file_path.stat().st_size
-                except: size = 0
-                res.append({"path": str(rel_root / name if str(rel_root) != "." else name), "name": name, "type": "file", "size": size})
-        return sorted(res, key=lambda x: x["path"])
+        return self._index.listing(("git",), lambda tree: self._list_tree(tree, git=True), force)
 
     async def read_file(self, path: str) -> web.Response:
         """Read file content."""
@@ -156,6 +265,7 @@ class FileManager:
         if not safe_path or not self._is_file_allowed(safe_path): return json_message("Not allowed", status_code=403)
         try:
             await self.hass.async_add_executor_job(safe_path.write_text, content, "utf-8")
+            self._index.mark_changed(safe_path)
             self._fire_update("write", path)
             return json_response({"success": True, "mtime": safe_path.stat().st_mtime})
         except Exception as e: return json_message(str(e), status_code=500)
@@ -172,6 +282,7 @@ class FileManager:
 
             if is_base64: await self.hass.async_add_executor_job(safe_path.write_bytes, base64.b64decode(content))
             else: await self.hass.async_add_executor_job(safe_path.write_text, content, "utf-8")
+            self._index.mark_changed(safe_path)
             self._fire_update("create", path)
             return json_response({"success": True, "path": path})
         except Exception as e: return json_message(str(e), status_code=500)
@@ -182,6 +293,7 @@ class FileManager:
         if not safe_path or safe_path.exists(): return json_message("Not allowed or exists", status_code=403)
         try:
             await self.hass.async_add_executor_job(safe_path.mkdir, 0o755, True, True)
+            self._index.mark_changed(safe_path)
             self._fire_update("create_folder", path)
             return json_response({"success": True, "path": path})
         except Exception as e: return json_message(str(e), status_code=500)
@@ -194,6 +306,7 @@ class FileManager:
         try:
             if safe_path.is_dir(): await self.hass.async_add_executor_job(shutil.rmtree, safe_path)
             else: await self.hass.async_add_executor_job(safe_path.unlink)
+            self._index.mark_changed(safe_path)
             self._fire_update("delete", path)
             return json_response({"success": True})
         except Exception as e: return json_message(str(e), status_code=500)
@@ -205,6 +318,7 @@ class FileManager:
         try:
             if src.is_dir(): await self.hass.async_add_executor_job(shutil.copytree, src, dest)
             else: await self.hass.async_add_executor_job(shutil.copy2, src, dest)
+            self._index.mark_changed(dest)
             self._fire_update("copy", destination)
             return json_response({"success": True, "path": destination})
         except Exception as e: return json_message(str(e), status_code=500)
@@ -216,6 +330,8 @@ class FileManager:
         if not src or not dest or not src.exists() or dest.exists(): return json_message("Invalid path or exists", status_code=403)
         try:
             await self.hass.async_add_executor_job(src.rename, dest)
+            self._index.mark_changed(src)
+            self._index.mark_changed(dest)
             self._fire_update("rename", destination)
             return json_response({"success": True, "path": destination})
         except Exception as e: return json_message(str(e), status_code=500)
@@ -274,6 +390,7 @@ class FileManager:
         try:
             if is_base64: await self.hass.async_add_executor_job(safe_path.write_bytes, base64.b64decode(content))
             else: await self.hass.async_add_executor_job(safe_path.write_text, content, "utf-8")
+            self._index.mark_changed(safe_path)
             self._fire_update("upload", path)
             return json_response({"success": True, "path": path})
         except Exception as e: return json_message(str(e), status_code=500)
@@ -289,6 +406,7 @@ class FileManager:
                 for member in zf.namelist():
                     if not member.endswith("/") and self._is_file_allowed(safe_path / member):
                         zf.extract(member, safe_path)
+            self._index.mark_changed(safe_path)
             self._fire_update("upload_folder", path)
             return json_response({"success": True})
         except Exception as e: return json_message(str(e), status_code=500)
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from propcache.api import cached_property
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
@@ -39,6 +39,8 @@ class ApplianceApi:
         self.coordinator = coordinator
         self.initial_update = False
         self._entities: Dict[str, Entity] = {}
+        self._erd_entities: Dict[ErdCodeType, List[Entity]] = {}
+        self._unindexed_entities: List[Entity] = []
 
     @property
     def hass(self) -> HomeAssistant:
@@ -159,6 +161,28 @@ class ApplianceApi:
         for entity in entities:
             if entity.unique_id is not None and entity.unique_id not in self._entities:
                 self._entities[entity.unique_id] = entity
+                self._index_entity(entity)
+
+    def _index_entity(self, entity: Entity) -> None:
+        """Index the entity by the ERD codes its state depends on."""
+        codes = getattr(entity, "erd_dependencies", None)
+        if codes is None:
+            self._unindexed_entities.append(entity)
+            return
+        for code in codes:
+            self._erd_entities.setdefault(code, []).append(entity)
+
+    def get_entities_for_erd_codes(self, codes: Iterable[ErdCodeType]) -> List[Entity]:
+        """Get the entities whose state may have changed with the given ERD codes."""
+        entities: Dict[int, Entity] = {id(e): e for e in self._unindexed_entities}
+        for code in codes:
+            try:
+                code = self.appliance.translate_erd_code(code)
+            except:
+                pass
+            for entity in self._erd_entities.get(code, ()):
+                entities[id(entity)] = entity
+        return list(entities.values())
 
     def try_get_erd_value(self, code: ErdCodeType):
         try:
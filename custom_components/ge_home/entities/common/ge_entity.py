@@ -1,10 +1,10 @@
 from datetime import timedelta
 from propcache.api import cached_property
-from typing import Optional, Any
+from typing import Optional, Any, Set
 
 from homeassistant.helpers.device_registry import DeviceInfo
 
-from gehomesdk import GeAppliance
+from gehomesdk import GeAppliance, ErdCodeType
 from ...devices import ApplianceApi
 
 class GeEntity:
@@ -63,6 +63,11 @@ class GeEntity:
     def added(self) -> bool:
         return self._added
 
+    @property
+    def erd_dependencies(self) -> Optional[Set[ErdCodeType]]:
+        """ERD codes the state depends on, None if it may depend on any of them"""
+        return None
+
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         self._added = True
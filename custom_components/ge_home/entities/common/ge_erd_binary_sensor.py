@@ -11,6 +11,7 @@ from .ge_erd_entity import GeErdEntity
 
 class GeErdBinarySensor(GeErdEntity, BinarySensorEntity):
     """GE Entity for binary sensors"""
+    _erd_code_state_only = True
 
     def __init__(
             self, 
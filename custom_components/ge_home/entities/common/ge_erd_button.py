@@ -11,6 +11,7 @@ from .ge_erd_entity import GeErdEntity
 
 class GeErdButton(GeErdEntity, ButtonEntity):
     """GE Entity for buttons"""
+    _erd_code_state_only = True
         
     def __init__(self, api: ApplianceApi, erd_code: ErdCodeType, erd_override: Optional[str] = None, entity_category: Optional[EntityCategory] = None):
         super().__init__(api, erd_code, erd_override=erd_override, entity_category=entity_category)
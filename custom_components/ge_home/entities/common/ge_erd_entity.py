@@ -1,6 +1,6 @@
 from datetime import timedelta
 from propcache.api import cached_property
-from typing import Optional, Any
+from typing import Optional, Any, Set
 
 from homeassistant.const import EntityCategory
 from gehomesdk import ErdCode, ErdCodeType, ErdCodeClass, ErdMeasurementUnits
@@ -13,6 +13,10 @@ from .ge_entity import GeEntity
 class GeErdEntity(GeEntity):
     """Parent class for GE entities tied to a specific ERD"""
 
+    # Set on classes whose state only depends on their own ERD. The flag is
+    # not inherited, as subclasses may read other ERDs.
+    _erd_code_state_only = False
+
     def __init__(
         self,
         api: ApplianceApi,
@@ -41,6 +45,12 @@ class GeErdEntity(GeEntity):
     def erd_code_class(self) -> ErdCodeClass:
         return self._erd_code_class
 
+    @property
+    def erd_dependencies(self) -> Optional[Set[ErdCodeType]]:
+        if not type(self).__dict__.get("_erd_code_state_only", False):
+            return None
+        return {self.erd_code, ErdCode.TEMPERATURE_UNIT}
+
     @property
     def erd_string(self) -> str:
         erd_code = self.erd_code
@@ -27,6 +27,7 @@ def to_hass_level(level):
 
 class GeErdLight(GeErdEntity, LightEntity):
     """Lights for ERD codes."""
+    _erd_code_state_only = True
 
     def __init__(self, api: ApplianceApi, erd_code: ErdCodeType, erd_override: Optional[str] = None, color_mode: ColorMode = ColorMode.BRIGHTNESS, entity_category: Optional[EntityCategory] = None):
         super().__init__(api, erd_code, erd_override, entity_category=entity_category)
@@ -17,6 +17,7 @@ _LOGGER = logging.getLogger(__name__)
 
 class GeErdNumber(GeErdEntity, NumberEntity):
     """GE Entity for numbers"""
+    _erd_code_state_only = True
 
     def __init__(
         self, 
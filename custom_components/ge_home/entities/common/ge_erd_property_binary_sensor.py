@@ -10,6 +10,8 @@ from .ge_erd_binary_sensor import GeErdBinarySensor
 
 class GeErdPropertyBinarySensor(GeErdBinarySensor):
     """GE Entity for property binary sensors"""
+    _erd_code_state_only = True
+
     def __init__(
             self, 
             api: ApplianceApi, 
@@ -11,6 +11,8 @@ from .ge_erd_sensor import GeErdSensor
 
 class GeErdPropertySensor(GeErdSensor):
     """GE Entity for sensors"""
+    _erd_code_state_only = True
+
     def __init__(   
         self, 
         api: ApplianceApi, 
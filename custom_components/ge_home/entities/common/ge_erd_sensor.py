@@ -14,6 +14,7 @@ _LOGGER = logging.getLogger(__name__)
 
 class GeErdSensor(GeErdEntity, SensorEntity):
     """GE Entity for sensors"""
+    _erd_code_state_only = True
 
     def __init__(
         self, 
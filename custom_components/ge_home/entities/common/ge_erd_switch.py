@@ -14,6 +14,7 @@ _LOGGER = logging.getLogger(__name__)
 
 class GeErdSwitch(GeErdEntity, SwitchEntity):
     """Switches for boolean ERD codes."""
+    _erd_code_state_only = True
 
     def __init__(
             self, 
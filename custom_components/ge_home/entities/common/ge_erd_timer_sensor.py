@@ -7,6 +7,7 @@ _LOGGER = logging.getLogger(__name__)
 
 class GeErdTimerSensor(GeErdSensor):
     """GE Entity for timer sensors"""
+    _erd_code_state_only = True
 
     async def set_timer(self, duration: timedelta):
         try:
@@ -73,6 +73,7 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
         self._last_persistent_log: float = 0.0
         self._retry_count: int = 0
         self._last_ha_refresh: float = 0.0
+        self._written_availability: Dict[str, bool] = {}
 
         self._reset_sync_state()
 
@@ -258,6 +259,7 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
 
         # clear the appliances
         self._appliance_apis.clear()
+        self._written_availability.clear()
 
         # reset the initialization
         self._all_initial_updates_received.clear()
@@ -306,6 +308,7 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
             while True:
                 if self._client and self._client.state != GeClientState.DISCONNECTED:
                     _LOGGER.debug("Client no longer disconnected, exiting worker")
+                    await self._refresh_ha_state()
                     return
 
                 self._retry_count += 1
@@ -316,6 +319,7 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
 
                 if self._client and self._client.state != GeClientState.DISCONNECTED:
                     _LOGGER.debug("Client became healthy before retry, exiting")
+                    await self._refresh_ha_state()
                     return
 
                 try:
@@ -327,6 +331,7 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
                     _LOGGER.warning(f"Reconnect attempt failed: {err}")
 
                 if self._client and self._client.state != GeClientState.DISCONNECTED:
+                    await self._refresh_ha_state()
                     return
 
                 if self._retry_count >= NOTIFY_AFTER_RETRIES:
@@ -384,7 +389,7 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.info(f"Could not find appliance {appliance.mac_addr} in known device list.")
             return
         
-        self._update_entity_state(api.entities)
+        self._update_appliance_state(api, update_data.keys())
 
     async def _on_appliance_list(self, _):
         """When we get an appliance list, mark it and maybe trigger all ready."""
@@ -418,6 +423,7 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
 
         self.last_update_success = True
         self._maybe_add_appliance_api(appliance)
+        self._update_appliance_state(self.appliance_apis[appliance.mac_addr])
         await self._async_maybe_trigger_all_ready()
         await self._start_periodic_updates()
 
@@ -431,6 +437,7 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
         """Set state upon connection."""
         self.last_update_success = True
         await self._stop_reconnect_worker()
+        await self._refresh_ha_state()
 
     #endregion  
 
@@ -556,16 +563,9 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
                     )
                     continue
 
-                for api in self.appliance_apis.values():
-                    try:
-                        if api.appliance is None:
-                            _LOGGER.debug(f"Appliance {api} is not valid, skipping update.")
-                            continue
-
-                        _LOGGER.debug(f"Requesting update for {api.appliance.mac_addr}")
-                        await api.appliance.async_request_update()
-                    except Exception as err:
-                        _LOGGER.debug(f"Poll update failed for [{api.appliance.mac_addr}]: {err}")
+                await asyncio.gather(
+                    *(self._request_appliance_update(api) for api in list(self.appliance_apis.values()))
+                )
 
         except asyncio.CancelledError:
             # Normal exit when shutting down
@@ -573,16 +573,40 @@ class GeHomeUpdateCoordinator(DataUpdateCoordinator):
 
         _LOGGER.debug("Stopped requesting periodic updates.")         
 
+    async def _request_appliance_update(self, api: ApplianceApi):
+        """Request an update for a single appliance, logging any failure."""
+        try:
+            if api.appliance is None:
+                _LOGGER.debug(f"Appliance {api} is not valid, skipping update.")
+                return
+
+            _LOGGER.debug(f"Requesting update for {api.appliance.mac_addr}")
+            await api.appliance.async_request_update()
+        except Exception as err:
+            _LOGGER.debug(f"Poll update failed for [{api.appliance.mac_addr}]: {err}")
+
     #endregion
 
     #region State Updates
 
     async def _refresh_ha_state(self):
         """ Performs a full refresh of all appliances """
-        entities = [
-            entity for api in self.appliance_apis.values() for entity in api.entities
-        ]
+        for api in list(self.appliance_apis.values()):
+            self._update_appliance_state(api)
+
+    def _update_appliance_state(self, api: ApplianceApi, erd_codes: Optional[Iterable[ErdCodeType]] = None):
+        """
+        Refreshes the entities of an appliance depending on the given ERD codes, or all of
+        them if no codes are given or the appliance availability changed since the last refresh
+        """
+        mac_addr = api.appliance.mac_addr
+        available = api.available
+        if erd_codes and self._written_availability.get(mac_addr) == available:
+            entities = api.get_entities_for_erd_codes(erd_codes)
+        else:
+            entities = api.entities
 
+        self._written_availability[mac_addr] = available
         self._update_entity_state(entities)
 
     def _update_entity_state(self, entities: List[Entity]):
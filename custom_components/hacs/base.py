@@ -37,7 +37,7 @@ from homeassistant.helpers.issue_registry import IssueSeverity, async_create_iss
 from homeassistant.loader import Integration
 from homeassistant.util import dt
 
-from .const import DOMAIN, TV, URL_BASE
+from .const import DEFAULT_CONCURRENT_TASKS, DOMAIN, TV, URL_BASE
 from .coordinator import HacsUpdateCoordinator
 from .data_client import HacsDataClient
 from .enums import (
@@ -45,6 +45,7 @@ from .enums import (
     HacsDisabledReason,
     HacsDispatchEvent,
     HacsGitHubRepo,
+    HacsQueuePriority,
     HacsStage,
     LovelaceMode,
 )
@@ -201,12 +202,33 @@ class HacsRepositories:
     _repositories_by_full_name: dict[str, HacsRepository] = field(default_factory=dict)
     _repositories_by_id: dict[str, HacsRepository] = field(default_factory=dict)
     _removed_repositories_by_full_name: dict[str, RemovedRepository] = field(default_factory=dict)
+    _repositories_by_category: dict[str, set[HacsRepository]] = field(default_factory=dict)
+    _serialized_repositories: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     @property
     def list_all(self) -> list[HacsRepository]:
         """Return a list of repositories."""
         return list(self._repositories)
 
+    def list_by_category(self, category: str) -> list[HacsRepository]:
+        """Return a list of repositories in a category."""
+        return list(self._repositories_by_category.get(category, ()))
+
+    def get_serialized(self, repository_id: str) -> dict[str, Any] | None:
+        """Get the cached websocket representation of a repository."""
+        return self._serialized_repositories.get(repository_id)
+
+    def set_serialized(self, repository_id: str, serialized: dict[str, Any]) -> None:
+        """Cache the websocket representation of a repository."""
+        self._serialized_repositories[repository_id] = serialized
+
+    def invalidate_serialized(self, repository_id: str | None = None) -> None:
+        """Drop the cached websocket representation of one or all repositories."""
+        if repository_id is None:
+            self._serialized_repositories.clear()
+        else:
+            self._serialized_repositories.pop(str(repository_id), None)
+
     @property
     def list_removed(self) -> list[RemovedRepository]:
         """Return a list of removed repositories."""
@@ -244,6 +266,7 @@ class HacsRepositories:
         if repository not in self._repositories:
             self._repositories.add(repository)
 
+        self._repositories_by_category.setdefault(repository.data.category, set()).add(repository)
         self._repositories_by_id[repo_id] = repository
         self._repositories_by_full_name[repository.data.full_name_lower] = repository
 
@@ -266,8 +289,12 @@ class HacsRepositories:
         if repository in self._repositories:
             self._repositories.remove(repository)
 
+        if category_repositories := self._repositories_by_category.get(repository.data.category):
+            category_repositories.discard(repository)
+
         self._repositories_by_id.pop(repo_id, None)
         self._repositories_by_full_name.pop(repository.data.full_name_lower, None)
+        self.invalidate_serialized(repo_id)
 
     def mark_default(self, repository: HacsRepository) -> None:
         """Mark a repository as default."""
@@ -280,6 +307,7 @@ class HacsRepositories:
             return
 
         self._default_repositories.add(repo_id)
+        self.invalidate_serialized(repo_id)
 
     def set_repository_id(self, repository: HacsRepository, repo_id: str):
         """Update a repository id."""
@@ -761,6 +789,10 @@ class HacsBase:
     @callback
     def async_dispatch(self, signal: HacsDispatchEvent, data: dict | None = None) -> None:
         """Dispatch a signal with data."""
+        if signal == HacsDispatchEvent.REPOSITORY and (
+            repository_id := (data or {}).get("repository_id")
+        ) is not None:
+            self.repositories.invalidate_serialized(repository_id)
         async_dispatcher_send(self.hass, signal, data)
 
     def set_active_categories(self) -> None:
@@ -801,7 +833,11 @@ class HacsBase:
                 repository = self.repositories.get_by_full_name(HacsGitHubRepo.INTEGRATION)
             elif not self.status.startup:
                 self.log.error("Scheduling update of hacs/integration")
-                self.queue.add(repository.common_update())
+                self.queue.add(
+                    repository.common_update(),
+                    HacsQueuePriority.HIGH,
+                    key=f"update/{repository.data.id}",
+                )
             if repository is None:
                 raise HacsException("Unknown error")
 
@@ -885,6 +921,7 @@ class HacsBase:
                     )
                     self.repositories.unregister(repository)
 
+        self.repositories.invalidate_serialized()
         self.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
         self.coordinators[category].async_update_listeners()
 
@@ -923,8 +960,10 @@ class HacsBase:
                 self.queue.pending_tasks,
             )
             if can_update != 0:
+                # Run fewer tasks at the same time when the rate limit is getting close
+                concurrency = max(1, min(DEFAULT_CONCURRENT_TASKS, can_update // 10))
                 try:
-                    await self.queue.execute(can_update)
+                    await self.queue.execute(can_update, concurrency=concurrency)
                 except HacsExecutionStillInProgress:
                     return
 
@@ -1005,8 +1044,11 @@ class HacsBase:
                 repository.data.category in self.common.categories
                 and not self.repositories.is_default(repository.data.id)
             ):
-                repositories_to_update += 1
-                self.queue.add(update_repository(repository))
+                if self.queue.add(
+                    update_repository(repository),
+                    key=f"update/{repository.data.id}",
+                ):
+                    repositories_to_update += 1
 
         async def update_coordinators() -> None:
             """Update all coordinators."""
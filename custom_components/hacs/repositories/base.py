@@ -174,6 +174,21 @@ class RepositoryData:
     stargazers_count: int = 0
     topics: list[str] = []
 
+    # Not attrs fields, set when data changed since it was last stored
+    # and since its websocket representation was last built
+    dirty = True
+    serialized_outdated = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and track if the data changed."""
+        if (
+            name not in ("dirty", "serialized_outdated")
+            and self.__dict__.get(name, value) != value
+        ):
+            object.__setattr__(self, "dirty", True)
+            object.__setattr__(self, "serialized_outdated", True)
+        object.__setattr__(self, name, value)
+
     @property
     def name(self):
         """Return the name."""
@@ -299,6 +314,12 @@ class RepositoryContent:
 class HacsRepository:
     """HacsRepository."""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and mark the websocket representation as outdated."""
+        object.__setattr__(self, name, value)
+        if (data := self.__dict__.get("data")) is not None:
+            object.__setattr__(data, "serialized_outdated", True)
+
     def __init__(self, hacs: HacsBase) -> None:
         """Set up HacsRepository."""
         self.hacs = hacs
@@ -8,14 +8,16 @@ from typing import Any
 
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
 
 from ..base import HacsBase
-from ..const import HACS_REPOSITORY_ID
+from ..const import HACS_REPOSITORY_ID, STORE_WRITE_DELAY
 from ..enums import HacsDisabledReason, HacsDispatchEvent
 from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
 from .logger import LOGGER
 from .path import is_safe
-from .store import async_load_from_store, async_save_to_store
+from .store import async_load_from_store, async_save_to_store, get_store_for_key
 
 EXPORTED_BASE_DATA = (
     ("new", False),
@@ -62,17 +64,43 @@ class HacsData:
         """Initialize."""
         self.logger = LOGGER
         self.hacs = hacs
-        self.content = {}
+        # Encoded store entries per repository id, see _async_store_content_and_repos
+        self._encoded_repositories: dict[str, tuple[dict, bytes, bytes]] = {}
+        self._cancel_scheduled_write = None
 
     async def async_force_write(self, _=None):
         """Force write."""
         await self.async_write(force=True)
 
     async def async_write(self, force: bool = False) -> None:
-        """Write content to the store files."""
+        """Write content to the store files.
+
+        Unless forced, the write is delayed so bursts of changes are written once.
+        """
         if not force and self.hacs.system.disabled:
             return
 
+        if force:
+            if self._cancel_scheduled_write is not None:
+                self._cancel_scheduled_write()
+                self._cancel_scheduled_write = None
+            await self._async_write()
+        elif self._cancel_scheduled_write is None:
+            self._cancel_scheduled_write = async_call_later(
+                self.hacs.hass, STORE_WRITE_DELAY, self._async_scheduled_write
+            )
+
+        for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
+            self.hacs.async_dispatch(event, {})
+
+    async def _async_scheduled_write(self, _=None) -> None:
+        """Write content to the store files after the write delay."""
+        self._cancel_scheduled_write = None
+        if not self.hacs.system.disabled:
+            await self._async_write()
+
+    async def _async_write(self) -> None:
+        """Write content to the store files."""
         self.logger.debug("<HacsData async_write> Saving data")
 
         # Hacs
@@ -85,34 +113,62 @@ class HacsData:
                 "ignored_repositories": self.hacs.common.ignored_repositories,
             },
         )
-        await self._async_store_experimental_content_and_repos()
         await self._async_store_content_and_repos()
 
     async def _async_store_content_and_repos(self, _=None):  # bb: ignore
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
+        """Store the main repos file and the experimental data file.
+
+        Only repositories which changed since the last write are encoded again,
+        the files are not written at all when no repository changed.
+        """
+        changed = False
+        repositories = []
+        experimental: dict[str, list[bytes]] = {}
+        stored_ids = set()
         for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_repository_data(repository)
-
-        await async_save_to_store(self.hacs.hass, "repositories", self.content)
-        for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
-            self.hacs.async_dispatch(event, {})
-
-    async def _async_store_experimental_content_and_repos(self, _=None):
-        """Store the main repos file and each repo that is out of date."""
-        # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_experimental_repository_data(repository)
+            if repository.data.category not in self.hacs.common.categories:
+                continue
+            repo_id = str(repository.data.id)
+            stored_ids.add(repo_id)
+            encoded = self._encoded_repositories.get(repo_id)
+            if (
+                encoded is None
+                or repository.data.dirty
+                or encoded[0] is not repository.repository_manifest.manifest
+            ):
+                encoded = (
+                    repository.repository_manifest.manifest,
+                    json_bytes(self.async_store_repository_data(repository)),
+                    json_bytes(self.async_store_experimental_repository_data(repository)),
+                )
+                self._encoded_repositories[repo_id] = encoded
+                repository.data.dirty = False
+                changed = True
+            repositories.append(b"%s:%s" % (json_bytes(repo_id), encoded[1]))
+            experimental.setdefault(repository.data.category, []).append(encoded[2])
+
+        for repo_id in set(self._encoded_repositories) - stored_ids:
+            del self._encoded_repositories[repo_id]
+            changed = True
+
+        if not changed:
+            self.logger.debug("<HacsData async_write> No repository changed since last write")
+            return
 
-        await async_save_to_store(self.hacs.hass, "data", {"repositories": self.content})
+        await get_store_for_key(self.hacs.hass, "repositories").async_save_encoded(
+            b"{%s}" % b",".join(repositories)
+        )
+        await get_store_for_key(self.hacs.hass, "data").async_save_encoded(
+            b'{"repositories":{%s}}'
+            % b",".join(
+                b"%s:[%s]" % (json_bytes(category), b",".join(entries))
+                for category, entries in experimental.items()
+            )
+        )
 
     @callback
     def async_store_repository_data(self, repository: HacsRepository) -> dict:
-        """Store the repository data."""
+        """Return the repository data to store."""
         data = {"repository_manifest": repository.repository_manifest.manifest}
 
         for key, default in (
@@ -128,13 +184,12 @@ class HacsData:
         if repository.data.last_fetched:
             data["last_fetched"] = repository.data.last_fetched.timestamp()
 
-        self.content[str(repository.data.id)] = data
+        return data
 
     @callback
-    def async_store_experimental_repository_data(self, repository: HacsRepository) -> None:
-        """Store the experimental repository data for non downloaded repositories."""
+    def async_store_experimental_repository_data(self, repository: HacsRepository) -> dict:
+        """Return the experimental repository data to store for non downloaded repositories."""
         data = {}
-        self.content.setdefault(repository.data.category, [])
 
         if repository.data.installed:
             data["repository_manifest"] = repository.repository_manifest.manifest
@@ -151,7 +206,7 @@ class HacsData:
                 if (value := getattr(repository.data, key, default)) != default:
                     data[key] = value
 
-        self.content[repository.data.category].append({"id": str(repository.data.id), **data})
+        return {"id": str(repository.data.id), **data}
 
     async def restore(self):
         """Restore saved data."""
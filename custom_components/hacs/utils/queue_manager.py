@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Coroutine
+import heapq
+import itertools
 import time
 
 from homeassistant.core import HomeAssistant
 
+from ..const import DEFAULT_CONCURRENT_TASKS
+from ..enums import HacsQueuePriority
 from ..exceptions import HacsExecutionStillInProgress
 from .logger import LOGGER
 
@@ -15,17 +19,25 @@ _LOGGER = LOGGER
 
 
 class QueueManager:
-    """The QueueManager class."""
+    """The QueueManager class.
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    Tasks are executed in priority order, a limited number at the same time.
+    Tasks added with a key are skipped while a task with the same key is pending.
+    """
+
+    def __init__(self, hass: HomeAssistant, concurrency: int = DEFAULT_CONCURRENT_TASKS) -> None:
         self.hass = hass
-        self.queue: list[Coroutine] = []
+        self.concurrency = concurrency
+        self.queue: list[tuple[int, int, str | None, Coroutine]] = []
         self.running = False
+        self._counter = itertools.count()
+        self._pending_keys: set[str] = set()
+        self._executing = 0
 
     @property
     def pending_tasks(self) -> int:
-        """Return a count of pending tasks in the queue."""
-        return len(self.queue)
+        """Return a count of pending tasks in the queue, including the executing ones."""
+        return len(self.queue) + self._executing
 
     @property
     def has_pending_tasks(self) -> bool:
@@ -34,13 +46,32 @@ class QueueManager:
 
     def clear(self) -> None:
         """Clear the queue."""
+        for _, _, _, task in self.queue:
+            task.close()
         self.queue = []
-
-    def add(self, task: Coroutine) -> None:
-        """Add a task to the queue."""
-        self.queue.append(task)
-
-    async def execute(self, number_of_tasks: int | None = None) -> None:
+        self._pending_keys = set()
+
+    def add(
+        self,
+        task: Coroutine,
+        priority: HacsQueuePriority = HacsQueuePriority.BACKGROUND,
+        key: str | None = None,
+    ) -> bool:
+        """Add a task to the queue, return False if it was skipped as duplicate."""
+        if key is not None:
+            if key in self._pending_keys:
+                _LOGGER.debug("<QueueManager> Task for %s is already queued", key)
+                task.close()
+                return False
+            self._pending_keys.add(key)
+        heapq.heappush(self.queue, (priority, next(self._counter), key, task))
+        return True
+
+    async def execute(
+        self,
+        number_of_tasks: int | None = None,
+        concurrency: int | None = None,
+    ) -> None:
         """Execute the tasks in the queue."""
         if self.running:
             _LOGGER.debug("<QueueManager> Execution is already running")
@@ -53,30 +84,46 @@ class QueueManager:
 
         _LOGGER.debug("<QueueManager> Checking out tasks to execute")
         local_queue = []
-
-        if number_of_tasks:
-            for task in self.queue[:number_of_tasks]:
-                local_queue.append(task)
-        else:
-            for task in self.queue:
-                local_queue.append(task)
-
-        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(local_queue))
+        for _ in range(min(number_of_tasks or len(self.queue), len(self.queue))):
+            local_queue.append(heapq.heappop(self.queue))
+        local_queue.reverse()
+        self._executing = len(local_queue)
+
+        async def _worker() -> None:
+            while local_queue:
+                _, _, key, task = local_queue.pop()
+                try:
+                    await task
+                except Exception as exception:  # pylint: disable=broad-except
+                    _LOGGER.error("<QueueManager> %s", exception)
+                finally:
+                    self._executing -= 1
+                    self._pending_keys.discard(key)
+
+        workers = max(1, min(concurrency or self.concurrency, len(local_queue)))
+        _LOGGER.debug(
+            "<QueueManager> Starting queue execution for %s tasks with %s workers",
+            len(local_queue),
+            workers,
+        )
         start = time.time()
-        result = await asyncio.gather(*local_queue, return_exceptions=True)
-        for entry in result:
-            if isinstance(entry, Exception):
-                _LOGGER.error("<QueueManager> %s", entry)
+        number_of_tasks = len(local_queue)
+        try:
+            await asyncio.gather(*(_worker() for _ in range(workers)))
+        finally:
+            # Left over when the execution is cancelled
+            for _, _, key, task in local_queue:
+                task.close()
+                self._pending_keys.discard(key)
+            local_queue.clear()
+            self._executing = 0
+            self.running = False
         end = time.time() - start
 
-        for task in local_queue:
-            self.queue.remove(task)
-
         _LOGGER.debug(
             "<QueueManager> Queue execution finished for %s tasks finished in %.2f seconds",
-            len(local_queue),
+            number_of_tasks,
             end,
         )
         if self.has_pending_tasks:
             _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", len(self.queue))
-        self.running = False
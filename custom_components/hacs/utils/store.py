@@ -1,8 +1,11 @@
 """Storage handers."""
 
-from homeassistant.helpers.json import JSONEncoder
+import os
+
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.helpers.storage import Store
 from homeassistant.util import json as json_util
+from homeassistant.util.file import write_utf8_file_atomic
 
 from ..const import VERSION_STORAGE
 from ..exceptions import HacsException
@@ -31,6 +34,21 @@ class HACSStore(Store):
             return None
         return data["data"]
 
+    async def async_save_encoded(self, encoded_data: bytes) -> None:
+        """Save data which is already JSON encoded."""
+        payload = b'{"version":%s,"minor_version":%s,"key":%s,"data":%s}' % (
+            json_bytes(self.version),
+            json_bytes(self.minor_version),
+            json_bytes(self.key),
+            encoded_data,
+        )
+        await self.hass.async_add_executor_job(self._write_encoded, payload)
+
+    def _write_encoded(self, payload: bytes) -> None:
+        """Write encoded data to disk."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        write_utf8_file_atomic(self.path, payload, private=True, mode="wb")
+
 
 def get_store_key(key):
     """Return the key to use with homeassistant.helpers.storage.Storage."""
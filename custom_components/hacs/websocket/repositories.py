@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..base import HacsBase
+    from ..repositories.base import HacsRepository
 
 
 @websocket_api.websocket_command(
@@ -35,45 +36,54 @@ async def hacs_repositories_list(
 ) -> None:
     """List repositories."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    connection.send_message(
-        websocket_api.result_message(
-            msg["id"],
-            [
-                {
-                    "authors": repo.data.authors,
-                    "available_version": repo.display_available_version,
-                    "installed_version": repo.display_installed_version,
-                    "config_flow": repo.data.config_flow,
-                    "can_download": repo.can_download,
-                    "category": repo.data.category,
-                    "country": repo.repository_manifest.country,
-                    "custom": not hacs.repositories.is_default(str(repo.data.id)),
-                    "description": repo.data.description,
-                    "domain": repo.data.domain,
-                    "downloads": repo.data.downloads,
-                    "file_name": repo.data.file_name,
-                    "full_name": repo.data.full_name,
-                    "hide": repo.data.hide,
-                    "homeassistant": repo.repository_manifest.homeassistant,
-                    "id": repo.data.id,
-                    "installed": repo.data.installed,
-                    "last_updated": repo.data.last_updated,
-                    "local_path": repo.content.path.local,
-                    "name": repo.display_name,
-                    "new": repo.data.new,
-                    "pending_upgrade": repo.pending_update,
-                    "stars": repo.data.stargazers_count,
-                    "state": repo.state,
-                    "status": repo.display_status,
-                    "topics": repo.data.topics,
-                }
-                for repo in hacs.repositories.list_all
-                if repo.data.category in msg.get("categories", hacs.common.categories)
-                and not repo.ignored_by_country_configuration
-                and repo.data.last_fetched
-            ],
-        )
-    )
+    result = []
+    for category in dict.fromkeys(msg.get("categories", hacs.common.categories)):
+        for repo in hacs.repositories.list_by_category(category):
+            if repo.ignored_by_country_configuration or not repo.data.last_fetched:
+                continue
+            repo_id = str(repo.data.id)
+            if (
+                repo.data.serialized_outdated
+                or (serialized := hacs.repositories.get_serialized(repo_id)) is None
+            ):
+                serialized = _serialize_repository(hacs, repo)
+                hacs.repositories.set_serialized(repo_id, serialized)
+                repo.data.serialized_outdated = False
+            result.append(serialized)
+
+    connection.send_message(websocket_api.result_message(msg["id"], result))
+
+
+def _serialize_repository(hacs: HacsBase, repo: HacsRepository) -> dict[str, Any]:
+    """Return the representation of a repository used by hacs/repositories/list."""
+    return {
+        "authors": repo.data.authors,
+        "available_version": repo.display_available_version,
+        "installed_version": repo.display_installed_version,
+        "config_flow": repo.data.config_flow,
+        "can_download": repo.can_download,
+        "category": repo.data.category,
+        "country": repo.repository_manifest.country,
+        "custom": not hacs.repositories.is_default(str(repo.data.id)),
+        "description": repo.data.description,
+        "domain": repo.data.domain,
+        "downloads": repo.data.downloads,
+        "file_name": repo.data.file_name,
+        "full_name": repo.data.full_name,
+        "hide": repo.data.hide,
+        "homeassistant": repo.repository_manifest.homeassistant,
+        "id": repo.data.id,
+        "installed": repo.data.installed,
+        "last_updated": repo.data.last_updated,
+        "local_path": repo.content.path.local,
+        "name": repo.display_name,
+        "new": repo.data.new,
+        "pending_upgrade": repo.pending_update,
+        "stars": repo.data.stargazers_count,
+        "state": repo.state,
+        "status": repo.display_status,
+        "topics": repo.data.topics,
+    }
 
 
 @websocket_api.websocket_command(
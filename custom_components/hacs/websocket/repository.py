@@ -50,6 +50,7 @@ async def hacs_repository_info(
         except Exception as exception:  # pylint: disable=broad-except
             repository.logger.error("%s %s", repository.string, exception)
         repository.updated_info = True
+        hacs.repositories.invalidate_serialized(str(repository.data.id))
 
     if repository.data.new:
         repository.data.new = False
@@ -453,7 +453,10 @@ class HubitatOptionsFlow(OptionsFlowWithConfigEntry):
 
         assert self.hub is not None
 
-        await self.hub.load_devices()
+        try:
+            await self.hub.load_devices()
+        finally:
+            await self.hub.close()
         devices = self.hub.devices
 
         # Store the list of devices in the config flow so that a config entry
@@ -550,6 +553,9 @@ async def _validate_input(user_input: dict[str, Any]) -> ValidatedInput:
         event_url = cv.url(event_url)
 
     hub = HubitatHub(host, app_id, token, port=port, event_url=event_url)
-    await hub.check_config()
+    try:
+        await hub.check_config()
+    finally:
+        await hub.close()
 
     return {"label": f"Hubitat ({get_hub_short_id(hub)})", "hub": hub}
@@ -9,6 +9,10 @@ from .hubitatmaker import DeviceAttribute, DeviceCapability
 
 DOMAIN = "hubitat"
 
+# Entity state writes triggered by hub events are coalesced over this many
+# seconds, so a burst of attribute events results in a single write
+STATE_WRITE_DELAY = 0.05
+
 
 class HassStateAttribute(StrEnum):
     ALARM = "alarm"
@@ -157,6 +157,8 @@ class HubitatEntity(HubitatBase, UpdateableEntity, ABC):
 
     def async_schedule_update_ha_state(self): ...
 
+    def async_write_ha_state(self) -> None: ...
+
     @cached_property
     def unique_id(self) -> str | None: ...
 
@@ -184,13 +186,20 @@ class HubitatEntity(HubitatBase, UpdateableEntity, ABC):
         """
         Handle a device event.
 
-        If this entity is enabled, reload the entity state from the underlying
-        device and tell HA that the state has updated.
+        If this entity is enabled, schedule a reload of the entity state from
+        the underlying device. Events arriving in a burst are coalesced into a
+        single state write.
         """
         _LOGGER.debug(f"handling event for {self} ({self.name}, {self.__class__})")
+        if self.enabled:
+            self._hub.schedule_state_write(self._write_state)
+
+    @callback
+    def _write_state(self) -> None:
+        """Reload the entity state and tell HA that the state has updated."""
         if self.enabled:
             self.load_state()
-            self.async_schedule_update_ha_state()
+            self.async_write_ha_state()
 
 
 class HubitatEventEmitter(HubitatBase):
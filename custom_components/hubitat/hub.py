@@ -16,9 +16,10 @@ from homeassistant.const import (
     CONF_TEMPERATURE_UNIT,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import area_registry, device_registry, entity_registry
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.event import async_call_later
 
 try:
     from homeassistant.helpers.discovery_flow import (
@@ -44,6 +45,7 @@ from .const import (
     H_CONF_SERVER_URL,
     H_CONF_SYNC_AREAS,
     PLATFORMS,
+    STATE_WRITE_DELAY,
     TEMP_F,
     TRIGGER_CAPABILITIES,
 )
@@ -95,6 +97,8 @@ class Hub(HasId):
     _is_connected: bool
     _retry_task_unsub: CALLBACK_TYPE | None
     _platforms_setup: bool
+    _pending_state_writes: dict[Callable[[], None], None]
+    _state_write_unsub: CALLBACK_TYPE | None
 
     def __init__(
         self,
@@ -138,6 +142,8 @@ class Hub(HasId):
         self._is_connected = False
         self._retry_task_unsub = None
         self._platforms_setup = False
+        self._pending_state_writes = {}
+        self._state_write_unsub = None
 
     @property
     def app_id(self) -> str:
@@ -279,10 +285,39 @@ class Hub(HasId):
         _LOGGER.debug("Setting hub temperature unit to %s", temp_unit)
         self._temperature_unit = temp_unit
 
+    @callback
+    def schedule_state_write(self, write_state: Callable[[], None]) -> None:
+        """Schedule an entity state write.
+
+        Writes scheduled within STATE_WRITE_DELAY of each other are run
+        together, and a write scheduled several times runs only once.
+        """
+        self._pending_state_writes[write_state] = None
+        if self._state_write_unsub is None:
+            self._state_write_unsub = async_call_later(
+                self.hass, STATE_WRITE_DELAY, self._write_pending_states
+            )
+
+    @callback
+    def _write_pending_states(self, _: Any) -> None:
+        """Run the scheduled entity state writes."""
+        self._state_write_unsub = None
+        pending_state_writes = self._pending_state_writes
+        self._pending_state_writes = {}
+        for write_state in pending_state_writes:
+            try:
+                write_state()
+            except Exception as e:
+                _LOGGER.warning(f"Error writing entity state: {e}")
+
     def stop(self) -> None:
         """Stop the hub."""
         if self._hub:
             self._hub.stop()
+        if self._state_write_unsub is not None:
+            self._state_write_unsub()
+            self._state_write_unsub = None
+        self._pending_state_writes = {}
         self._device_listeners = {}
         self._hub_device_listeners = []
 
@@ -378,8 +413,13 @@ class Hub(HasId):
             port=port,
             event_url=url,
             ssl_context=ssl_context,
+            in_loop_server=True,
         )
-        await hubitat_hub.start()
+        try:
+            await hubitat_hub.start()
+        except Exception:
+            await hubitat_hub.close()
+            raise
 
         # setup proxy Device representing the hub that can be used for linked
         # entities
@@ -535,6 +575,7 @@ class Hub(HasId):
             port=port,
             event_url=url,
             ssl_context=ssl_context,
+            in_loop_server=True,
         )
 
         # Create a placeholder device for the hub
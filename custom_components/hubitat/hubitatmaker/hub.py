@@ -26,6 +26,7 @@ Listener = Callable[[Event], None]
 
 MAX_REQUEST_ATTEMPT_COUNT = 3
 REQUEST_RETRY_DELAY_INTERVAL = 0.5
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
 
 _LOGGER = getLogger(__name__)
 
@@ -46,6 +47,7 @@ class Hub:
     mac: str
 
     _server: Server | None = None
+    _session: aiohttp.ClientSession | None = None
 
     def __init__(
         self,
@@ -55,6 +57,9 @@ class Hub:
         port: int | None = None,
         event_url: str | None = None,
         ssl_context: SSLContext | None = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        bulk_load: bool = True,
+        in_loop_server: bool = False,
     ):
         """Initialize a Hubitat hub interface.
 
@@ -74,6 +79,17 @@ class Hub:
         ssl_context:
           The SSLContext the event listener server will use. Passing in a SSLContext
           object will make the event listener server HTTPS only.
+        max_concurrent_requests:
+          The maximum number of Maker API requests that may be in flight at
+          the same time (optional). Keep this small to avoid overloading the
+          hub.
+        bulk_load:
+          If True (the default), refresh already loaded devices from the
+          devices/all listing in a single request, only fetching devices
+          individually when they're new or the listing is incomplete.
+        in_loop_server:
+          If True, run the event listener server on the event loop the hub is
+          started from instead of on a separate thread with its own loop.
         """
         if not host or not app_id or not access_token:
             raise InvalidConfig()
@@ -91,6 +107,9 @@ class Hub:
         self.token = access_token
         self.mac = ""
         self.ssl_context: SSLContext | None = ssl_context
+        self.max_concurrent_requests: int = max(1, max_concurrent_requests)
+        self.bulk_load: bool = bulk_load
+        self.in_loop_server: bool = in_loop_server
 
         self.set_host(host)
 
@@ -175,12 +194,30 @@ class Hub:
     async def load_devices(self, force_refresh: bool = False) -> None:
         """Load the current state of all devices."""
         if force_refresh or len(self._devices) == 0:
-            devices = cast(list[dict[str, Any]], await self._api_request("devices"))
+            if self.bulk_load:
+                devices = cast(
+                    list[dict[str, Any]], await self._api_request("devices/all")
+                )
+            else:
+                devices = cast(list[dict[str, Any]], await self._api_request("devices"))
             _LOGGER.debug("Loaded device list")
 
-            # load devices sequentially to avoid overloading the hub
+            to_load: list[str] = []
             for dev in devices:
-                await self._load_device(cast(str, dev["id"]), force_refresh)
+                device_id = str(dev["id"])
+                if self.bulk_load and self._update_device_from_listing(device_id, dev):
+                    continue
+                if force_refresh or device_id not in self._devices:
+                    to_load.append(device_id)
+
+            # the number of requests in flight is limited by the session to
+            # avoid overloading the hub
+            _ = await asyncio.gather(
+                *(self._load_device(device_id, True) for device_id in to_load)
+            )
+            _LOGGER.debug(
+                "Loaded %d devices (%d individually)", len(devices), len(to_load)
+            )
 
     async def start(self, force_refresh: bool = False) -> None:
         """Download initial state data, and start an event server if requested.
@@ -230,6 +267,24 @@ class Hub:
             _LOGGER.debug("Stopped event server")
         self._listeners = {}
 
+        if self._session:
+            session = self._session
+            self._session = None
+            try:
+                _ = asyncio.get_running_loop().create_task(session.close())
+            except RuntimeError:
+                _LOGGER.debug("No running loop, could not close the API session")
+
+    async def close(self) -> None:
+        """Close the session used for Maker API requests.
+
+        A new session will be opened if the hub is used again.
+        """
+        if self._session:
+            session = self._session
+            self._session = None
+            await session.close()
+
     async def refresh_device(self, device_id: str) -> None:
         """Refresh a device's state."""
         await self._load_device(device_id, force_refresh=True)
@@ -296,7 +351,7 @@ class Hub:
         self.port = port
         _LOGGER.info("Setting port to %s", port)
         if self._server:
-            self._server.stop()
+            await self._server.async_stop()
         await self._start_server()
 
     async def set_ssl_context(self, ssl_context: SSLContext | None) -> None:
@@ -314,7 +369,7 @@ class Hub:
             _LOGGER.debug("Enabling SSL for event listener server")
 
         if self._server:
-            self._server.stop()
+            await self._server.async_stop()
         await self._start_server()
 
     async def _check_api(self) -> None:
@@ -425,6 +480,32 @@ class Hub:
                 raise e
             _LOGGER.debug("Loaded device %s", device_id)
 
+    def _update_device_from_listing(
+        self, device_id: str, listing: dict[str, Any]
+    ) -> bool:
+        """Update a loaded device from its devices/all listing entry.
+
+        The listing only has the current attribute values, so this only works
+        for devices that are already loaded with the same attributes. Return
+        False if the device has to be fetched individually.
+        """
+        device = self._devices.get(device_id)
+        values = listing.get("attributes")
+        if device is None or not isinstance(values, dict):
+            return False
+
+        values = cast(dict[str, Any], values)
+        attributes = device.attributes
+        if any(name not in attributes for name in values):
+            return False
+
+        for name, value in values.items():
+            attribute = attributes[cast(DeviceAttribute, name)]
+            attribute.update_value(
+                _coerce_listing_value(attribute.value, value), attribute.unit
+            )
+        return True
+
     async def _load_hsm_status(self) -> None:
         """Load the current hub HSM status."""
         hsm = cast(dict[str, str], await self._api_request("hsm"))
@@ -437,6 +518,16 @@ class Hub:
         _LOGGER.debug("Loaded modes")
         self._modes = [Mode(m) for m in modes]
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session used for Maker API requests."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    ssl=False, limit=self.max_concurrent_requests
+                )
+            )
+        return self._session
+
     async def _api_request(  # pyright: ignore[reportAny]
         self, path: str, method: Literal["GET", "POST"] = "GET"
     ) -> Any:
@@ -446,13 +537,11 @@ class Hub:
         attempt = 0
         while attempt <= MAX_REQUEST_ATTEMPT_COUNT:
             attempt += 1
-            conn = aiohttp.TCPConnector(ssl=False)
             try:
-                async with aiohttp.request(
+                async with self._get_session().request(
                     method,
                     f"{self.api_url}/{path}",
                     params=params,
-                    connector=conn,
                 ) as resp:
                     if resp.status >= 400:
                         # retry on server errors or request timeout w/ increasing delay
@@ -511,8 +600,6 @@ class Hub:
                     continue
                 else:
                     raise e
-            finally:
-                await conn.close()
 
     async def _start_server(self) -> None:
         """Start an event listener server."""
@@ -523,10 +610,18 @@ class Hub:
             s.connect((self.host, 80))
             address = cast(str, s.getsockname()[0])
 
+        # Make sure a previous server has released its port
+        if self._server:
+            await self._server.async_stop()
+
         self._server = create_server(
-            self._process_event, address, self.port or 0, self.ssl_context
+            self._process_event,
+            address,
+            self.port or 0,
+            self.ssl_context,
+            in_loop=self.in_loop_server,
         )
-        self._server.start()
+        await self._server.async_start()
         _LOGGER.debug(
             "Listening on %s:%d with SSL %s",
             address,
@@ -550,6 +645,23 @@ def _open_socket(
         s.close()
 
 
+def _coerce_listing_value(current: Any, value: Any) -> Any:  # pyright: ignore[reportAny]
+    """Convert a devices/all attribute value to the type of the current value.
+
+    The listing reports every value as a string, where individual device
+    requests report numbers as numbers.
+    """
+    if isinstance(value, str) and isinstance(current, (int, float)):
+        try:
+            number = float(value)
+        except ValueError:
+            return value
+        if isinstance(current, int) and number.is_integer():
+            return int(number)
+        return number
+    return value  # pyright: ignore[reportAny]
+
+
 def _get_event_port(port: int | None, event_url: str | None) -> int | None:
     """Given an optional port and event URL, return the event port"""
     if port is not None:
@@ -2,7 +2,7 @@ import asyncio
 import threading
 from asyncio.base_events import Server as AsyncioServer
 from ssl import SSLContext
-from typing import Any, Callable, cast
+from typing import Any, Callable, cast, override
 
 from aiohttp import web
 
@@ -31,6 +31,7 @@ class Server:
         self.handle_event = handle_event
         self.ssl_context = ssl_context
         self._main_loop = asyncio.get_event_loop()
+        self._stopped = True
         self._runner: web.AppRunner
         self._startup_event: threading.Event
         self._server_loop: asyncio.AbstractEventLoop
@@ -45,6 +46,7 @@ class Server:
         app = web.Application()
         app.add_routes([web.post("/", self._handle_request)])
         self._runner = web.AppRunner(app)
+        self._stopped = False
 
         self._startup_event = threading.Event()
         self._server_loop = asyncio.new_event_loop()
@@ -54,8 +56,16 @@ class Server:
         # Wait for server to startup
         self._startup_event.wait()
 
+    async def async_start(self) -> None:
+        """Start the server."""
+        self.start()
+
     def stop(self) -> None:
         """Gracefully stop a running server."""
+        if self._stopped:
+            return
+        self._stopped = True
+
         # Call the server shutdown functions and wait for them to finish. These
         # must be called on the server thread's event loop.
         future = asyncio.run_coroutine_threadsafe(self._stop(), self._server_loop)
@@ -64,6 +74,10 @@ class Server:
         # Stop the server thread's event loop
         self._server_loop.call_soon_threadsafe(self._server_loop.stop)
 
+    async def async_stop(self) -> None:
+        """Stop the server and wait for it to be stopped."""
+        self.stop()
+
     async def _handle_request(self, request: web.Request) -> web.Response:
         """Handle an incoming request."""
         event = cast(dict[str, Any], await request.json())
@@ -103,11 +117,80 @@ class Server:
         await self._runner.cleanup()
 
 
+class LoopServer(Server):
+    """A server running on the event loop it was created from.
+
+    Requests are decoded and handled on that loop, so events don't have to
+    be passed between threads.
+    """
+
+    _stop_task: asyncio.Task[None] | None = None
+
+    @override
+    def start(self) -> None:
+        raise RuntimeError("LoopServer must be started with async_start")
+
+    @override
+    async def async_start(self) -> None:
+        """Start the server on the current event loop."""
+        # A previous run may still be releasing the port
+        await self.async_stop()
+
+        app = web.Application()
+        app.add_routes([web.post("/", self._handle_request)])
+        self._runner = web.AppRunner(app)
+        self._stopped = False
+        await self._runner.setup()
+
+        site = web.TCPSite(
+            self._runner, self.host, self.port, ssl_context=self.ssl_context
+        )
+        await site.start()
+
+        if self.port == 0:
+            site_server = cast(
+                AsyncioServer,
+                site._server,  # pyright: ignore[reportPrivateUsage]
+            )
+            sockets = list(site_server.sockets or [])
+            self.port = sockets[0].getsockname()[1]
+
+    @override
+    def stop(self) -> None:
+        """Stop the server in the background."""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._stop_task = self._main_loop.create_task(self._stop())
+
+    @override
+    async def async_stop(self) -> None:
+        """Stop the server and wait for it to be stopped."""
+        self.stop()
+        if self._stop_task:
+            await self._stop_task
+            self._stop_task = None
+
+    @override
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        """Handle an incoming request."""
+        event = cast(dict[str, Any], await request.json())
+        self.handle_event(event)
+        return web.Response(text="OK")
+
+
 def create_server(
     handle_event: EventCallback,
     host: str = "0.0.0.0",
     port: int = 0,
     ssl_context: SSLContext | None = None,
+    in_loop: bool = False,
 ) -> Server:
-    """Create a new server."""
+    """Create a new server.
+
+    If in_loop is True, the server runs on the current event loop rather than
+    on its own thread.
+    """
+    if in_loop:
+        return LoopServer(handle_event, host, port, ssl_context)
     return Server(handle_event, host, port, ssl_context)
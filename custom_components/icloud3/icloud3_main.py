@@ -321,6 +321,12 @@ class iCloud3:
             self.loop_ctrl_master_update_in_process_flag = True
             self._main_5sec_loop_icloud_prefetch_control()
 
+            # Write the pending Waze History updates and read the records for all
+            # device locations in one pass
+            if Gb.WazeHist and Gb.WazeHist.is_historydb_USED:
+                Gb.WazeHist.write_pending_updates()
+                Gb.WazeHist.prefetch_location_recds(Gb.Devices_by_devicename_tracked.values())
+
             for Device in Gb.Devices_by_devicename_tracked.values():
                 if self.loop_ctrl_device_update_in_process:
                     self._display_loop_control_msg('Tracked')
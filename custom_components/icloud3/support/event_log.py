@@ -36,6 +36,9 @@ from ..utils.time_util    import (time_to_12hrtime, datetime_now, time_now_secs,
 
 
 import time
+import heapq
+from collections import deque
+from itertools import islice
 import homeassistant.util.dt as dt_util
 
 
@@ -46,6 +49,8 @@ ELR_DEVICENAME = 0
 ELR_TIME = 1
 ELR_TEXT = 2
 MAX_EVLOG_RECD_LENGTH = 2000
+RECD_TYPES = ['Reg', 'Mon']         # Non-monitor and monitor event recd indexes
+EVLOG_VIEW_DEVICENAMES = ['*', '**', 'nodevices']   # Displayed with the selected device's recds
 
 # The text starts with a special character:
 # ^1^ - LightSeaGreen
@@ -85,7 +90,21 @@ class EventLog(object):
 
     def initialize(self):
         self.display_text_as         = {}
-        self.event_recds             = []   # Device event recds
+
+        # The event recds are kept in a monitor and a non-monitor index and in a monitor
+        # and non-monitor index for each devicename. Each index is newest recd first and
+        # holds (seq, recd) items. The seq is used to merge the indexes in time order.
+        self.event_recds_seq         = 0
+        self.event_recds_reg         = deque()  # Non-monitor event recds
+        self.event_recds_mon         = deque()  # Monitor event recds
+        self.event_recds_by_devicename = {}     # devicename: {'Reg': deque, 'Mon': deque}
+        self.last_event_recds        = deque(maxlen=8)  # Last recds added (duplicate recd check)
+
+        # Filtered and serialized recds of the device being displayed, newest recd first.
+        # New recds are added as they are posted. The view is rebuilt when the device or the
+        # filter settings change or recds are removed from the table.
+        self.evlog_view_key          = None
+        self.evlog_view_items        = deque()  # (recd, "['time', 'text']")
         self.startup_event_save_recd_flag = True
         self.startup_event_recds     = []   # All Event recds during startup
         self.event_recds_max_cnt     = EVENT_RECDS_MAX_CNT_BASE
@@ -149,8 +168,6 @@ class EventLog(object):
         self.evlog_attrs["names"]           = browser_refresh_msg
         self.evlog_attrs["logs"]            = []
 
-        self.devicename_cnts = {}
-
     def __repr__(self):
         return (f"<EventLog: {self.fnames_by_devicename}>")
 
@@ -269,8 +286,8 @@ class EventLog(object):
         # if a ^c^ start header is immediately follows an ^s^ header, the group is empty,
         # delete the ^s^ header and throw the current record (^c^ header) away.
         try:
-            if (devicename.startswith('*') is False and len(self.event_recds) > 8):
-                in_last_few_recds = [v for v in self.event_recds[:8] \
+            if (devicename.startswith('*') is False and self.event_recds_cnt > 8):
+                in_last_few_recds = [v for v in self.last_event_recds \
                                         if (v[ELR_DEVICENAME] == devicename \
                                             and v[ELR_TEXT] == event_text \
                                             and v[ELR_TEXT].startswith(EVLOG_TIME_RECD) is False
@@ -282,11 +299,11 @@ class EventLog(object):
                 # If this is an Update Completed msg
                 if event_text.startswith(EVLOG_UPDATE_END):
                     # Drop previous msg if it was an Update Started msg
-                    for idx in range(0, 8):
-                        if self.event_recds[idx][ELR_TEXT].startswith(EVLOG_UPDATE_START):
-                            self.event_recds[idx].pop()
+                    for event_recd in self.last_event_recds:
+                        if event_recd[ELR_TEXT].startswith(EVLOG_UPDATE_START):
+                            self._drop_event_recd_text(event_recd)
                             return
-                        if self.is_monitor_recd(self.event_recds[idx]) is False:
+                        if self.is_monitor_recd(event_recd) is False:
                             break
         except Exception as err:
             # log_exception(err)
@@ -496,6 +513,17 @@ class EventLog(object):
     def secs_since_refresh(self):
         return time_now_secs() - self.last_refresh_secs
 
+#------------------------------------------------------
+    @property
+    def event_recds(self):
+        ''' All event recds, newest recd first '''
+        return [recd for seq, recd in heapq.merge(self.event_recds_reg, self.event_recds_mon,
+                                                    key=lambda seq_recd: seq_recd[0], reverse=True)]
+
+    @property
+    def event_recds_cnt(self):
+        return len(self.event_recds_reg) + len(self.event_recds_mon)
+
 #------------------------------------------------------
     @staticmethod
     def log_update_time():
@@ -558,9 +586,6 @@ class EventLog(object):
     def _add_recd_to_event_recds(self, event_recd):
         """Add the event recd into the event table"""
 
-        if self.event_recds is None:
-            self.event_recds = CONTROL_RECD
-
         try:
             if len(event_recd) != 3:
                 log_warning_msg(f"INVALID EVLOG RECD (SHORT)-{event_recd}")
@@ -569,19 +594,42 @@ class EventLog(object):
                 log_warning_msg(f"INVALID EVLOG RECD (EMPTY TEXT)-{event_recd}")
                 return
 
-            evl_table_recd_cnt = len(self.event_recds)
-            if evl_table_recd_cnt >= self.event_recds_max_cnt:
-                self.devicename_cnts = {}
-                for elr_recd in self.event_recds:
-                    self._update_event_recds_device_cnt(elr_recd)
-
+            if self.event_recds_cnt >= self.event_recds_max_cnt:
                 self._shrink_event_recds(500)
 
         except Exception as err:
             log_exception(err)
             pass
 
-        self.event_recds.insert(0, event_recd)
+        self.event_recds_seq += 1
+        seq_recd  = (self.event_recds_seq, event_recd)
+        recd_type = 'Mon' if self.is_monitor_recd(event_recd) else 'Reg'
+
+        if recd_type == 'Mon':
+            self.event_recds_mon.appendleft(seq_recd)
+        else:
+            self.event_recds_reg.appendleft(seq_recd)
+
+        devicename = event_recd[ELR_DEVICENAME]
+        if devicename not in self.event_recds_by_devicename:
+            self.event_recds_by_devicename[devicename] = {'Reg': deque(), 'Mon': deque()}
+        self.event_recds_by_devicename[devicename][recd_type].appendleft(seq_recd)
+
+        self.last_event_recds.appendleft(event_recd)
+        self._add_recd_to_evlog_view(event_recd)
+
+#------------------------------------------------------
+    def _drop_event_recd_text(self, event_recd):
+        '''
+        Remove the text from a recd so it is not displayed (an Update Started recd
+        followed by an Update Completed recd) and remove it from the EvLog view
+        '''
+        event_recd.pop()
+
+        for view_item in self.evlog_view_items:
+            if view_item[0] is event_recd:
+                self.evlog_view_items.remove(view_item)
+                break
 
 #------------------------------------------------------
     def _save_startup_log_recd(self, Device, event_recd):
@@ -611,10 +659,9 @@ class EventLog(object):
 #------------------------------------------------------
     def _shrink_event_recds(self, shrink_cnt):
         '''
-        The table has reached the maximun number of records. Remove 40% of the
-        oldest device records and 60% of the monitor type records. Do not delete
-        '*'/system records unles it contains a '#' since it will be a retry or
-        authentication count recd:
+        The table has reached the maximun number of records. Remove the oldest monitor
+        type records and up to 40% of the oldest device records. If there are not
+        enough monitor records, remove more of the oldest device records.
 
         Parameters:
             - shrink_cnt: The total number of records to be deleted.
@@ -626,42 +673,35 @@ class EventLog(object):
             keep_nonmonitor_recd_pct = .40
 
             delete_device_recd_cnt = shrink_cnt * keep_nonmonitor_recd_pct
-            event_recds_recd_cnt   = len(self.event_recds)
+            event_recds_recd_cnt   = self.event_recds_cnt
             event_recds_target_cnt = self.event_recds_max_cnt - shrink_cnt
-            delete_cnt = 0
             delete_reg_cnt = 0
             delete_mon_cnt = 0
-            self.devicename_cnts = {}
-
-            # Go from end of table to front
-            for x in range(event_recds_recd_cnt-2, 2, -1):
-                elr_recd     = self.event_recds[x]
-                elr_text = elr_recd[ELR_TEXT]
-
-                # Delete monitor recds or 20% of regular device at end of table
-                if (self.is_monitor_recd(elr_text)
-                        or delete_cnt < delete_device_recd_cnt):
-                    delete_cnt += 1
-                    if self.is_monitor_recd(elr_text):
-                        delete_mon_cnt += 1
-                    else:
-                        delete_reg_cnt += 1
 
-                    del self.event_recds[x]
-                    self._update_event_recds_device_cnt(elr_recd)
+            # Go from the oldest recd to the newest
+            while self.event_recds_cnt > event_recds_target_cnt:
+                oldest_reg_seq = self.event_recds_reg[-1][0] if self.event_recds_reg else HIGH_INTEGER
+                oldest_mon_seq = self.event_recds_mon[-1][0] if self.event_recds_mon else HIGH_INTEGER
 
-                    if delete_cnt >= shrink_cnt:
-                        break
+                if (self.event_recds_mon
+                        and (oldest_mon_seq < oldest_reg_seq
+                            or delete_reg_cnt >= delete_device_recd_cnt)):
+                    self._delete_oldest_event_recd('Mon')
+                    delete_mon_cnt += 1
 
-            # If not enough recds were deleted, force deleting some
-            if len(self.event_recds) > event_recds_target_cnt:
-                delete_cnt += len(self.event_recds) - event_recds_target_cnt
-                del self.event_recds[event_recds_target_cnt:]
+                elif self.event_recds_reg:
+                    self._delete_oldest_event_recd('Reg')
+                    delete_reg_cnt += 1
 
+                else:
+                    break
+
+            delete_cnt = delete_reg_cnt + delete_mon_cnt
             if delete_cnt > 0:
+                self.evlog_view_key = None
                 self.post_event(f"{EVLOG_MONITOR}Event Log Table Size Reduced > "
                                 f"RecdCnt-{event_recds_recd_cnt}{RARROW}"
-                                f"{len(self.event_recds)}, "
+                                f"{self.event_recds_cnt}, "
                                 f"Deleted-{delete_cnt} "
                                 f"(DevInfo-{delete_reg_cnt}, "
                                 f"Monitor-{delete_mon_cnt})")
@@ -671,13 +711,14 @@ class EventLog(object):
             pass
 
 #------------------------------------------------------
-    def _update_event_recds_device_cnt(self, elr_recd):
-        devicename = elr_recd[ELR_DEVICENAME]
-        recd_type  = 'Mon' if self.is_monitor_recd(elr_recd) else 'Reg'
-        devicename_type = f"{devicename}-{recd_type}"
-        if devicename_type not in self.devicename_cnts:
-            self.devicename_cnts[devicename_type] = 0
-        self.devicename_cnts[devicename_type] += 1
+    def _delete_oldest_event_recd(self, recd_type):
+        '''
+        Delete the oldest monitor ('Mon') or non-monitor ('Reg') recd. It is also the
+        oldest recd of that type in the recd's devicename index.
+        '''
+        event_recds = self.event_recds_mon if recd_type == 'Mon' else self.event_recds_reg
+        seq, elr_recd = event_recds.pop()
+        self.event_recds_by_devicename[elr_recd[ELR_DEVICENAME]][recd_type].pop()
 
 #------------------------------------------------------
     def clear_greenbar_msg(self):
@@ -691,90 +732,144 @@ class EventLog(object):
 #------------------------------------------------------
     def _filtered_evlog_recds(self, devicename='', max_recds=HIGH_INTEGER, selected_devicename=None):
         '''
-        Extract the filtered records from the event_recdss and prepare them
-        for display
+        Get the filtered records from the EvLog view and return the string of the
+        resulting list to be passed to the Event Log
         '''
 
         if devicename == '':
             devicename = self.devicename
-        time_text_recds = self._extract_filtered_evlog_recds(devicename)
 
-        if Gb.display_gps_lat_long_flag is False:
-            time_text_recds = [self._apply_gps_filter(el_recd) for el_recd in time_text_recds]
+        # The evlog_startup_log_flag is set in the service_handler when Show
+        # Startup Log, Errors & Alerts is selected on the EvLog screen
+        if Gb.evlog_startup_log_flag:
+            self.greenbar_alert_msg=(   f"Start up log, alerts and èrrors"
+                                        f"{RARROW}Refresh to close")
+            time_text_recds = [el_recd[1:3] for el_recd in self.startup_event_recds
+                                        if (self.is_monitor_recd(el_recd) is False
+                                            or Gb.evlog_trk_monitors_flag)]
+            if Gb.display_gps_lat_long_flag is False:
+                time_text_recds = [self._apply_gps_filter(el_recd) for el_recd in time_text_recds]
+
+            time_text_items = [self._serialize_evlog_item(el_recd) for el_recd in time_text_recds]
+
+        else:
+            if Gb.EvLog.greenbar_alert_msg.startswith('Start up log'):
+                self.clear_greenbar_msg()
+
+            if self._evlog_view_key(devicename) != self.evlog_view_key:
+                self._build_evlog_view(devicename)
+
+            time_text_items = [view_item[1] for view_item in islice(self.evlog_view_items, max_recds)]
 
         if max_recds < HIGH_INTEGER:
-            recd_cnt = len(time_text_recds)
-            time_text_recds = time_text_recds[0:max_recds]
+            time_text_items = time_text_items[0:max_recds]
 
             refresh_msg = ( f"{EVLOG_HIGHLIGHT}Tap `Refresh` or select a device "
                             f"to display all of the events")
             refresh_recd = ['🔄',refresh_msg]
-            time_text_recds.insert(0, refresh_recd)
+            time_text_items.insert(0, self._serialize_evlog_item(refresh_recd))
 
         if self.greenbar_alert_msg != '':
             alert_msg = ( f"{EVLOG_HIGHLIGHT}{self.greenbar_alert_msg}")
             alert_recd = ['⚠️', alert_msg]
-            time_text_recds.insert(0, alert_recd)
+            time_text_items.insert(0, self._serialize_evlog_item(alert_recd))
 
-        time_text_recds.append(CONTROL_RECD)
-        time_text_recds_str = str(time_text_recds)
+        time_text_items.append(self._serialize_evlog_item(CONTROL_RECD))
+
+        return f"[{', '.join(time_text_items)}]"
+
+#--------------------------------------------------------------------
+    @staticmethod
+    def _serialize_evlog_item(elr_time_text):
+        '''
+        Convert the [time, text] item to the string used in the sensor attribute
+        '''
+        elr_time_text_str = str(elr_time_text)
 
         if Gb.evlog_trk_monitors_flag:
-            time_text_recds_str = time_text_recds_str.replace(EVLOG_MONITOR, EVLOG_BLUE)
+            elr_time_text_str = elr_time_text_str.replace(EVLOG_MONITOR, EVLOG_BLUE)
 
-        return time_text_recds_str
+        return elr_time_text_str
 
 #--------------------------------------------------------------------
-    def _extract_filtered_evlog_recds(self, devicename):
+    @staticmethod
+    def _evlog_view_key(devicename):
         '''
-        Build the event items attribute for the event log sensor. Each item record
-        is [device, time, state, zone, interval, travTime, dist, textMsg]
-        Select the items for the device or '*' and return the string of
-        the resulting list to be passed to the Event Log
+        The settings the EvLog view was built with. The view is rebuilt if they change.
         '''
+        Device = Gb.Devices_by_devicename.get(devicename)
 
-        # The evlog_startup_log_flag is set in the service_handler when Show
-        # Startup Log, Errors & Alerts is selected on the EvLog screen
-        if Gb.evlog_startup_log_flag:
-            self.greenbar_alert_msg=(   f"Start up log, alerts and èrrors"
-                                        f"{RARROW}Refresh to close")
-            el_recds = [el_recd[1:3] for el_recd in self.startup_event_recds
-                                        if (self.is_monitor_recd(el_recd) is False
-                                            or Gb.evlog_trk_monitors_flag)]
-            return el_recds
-
-        elif Gb.EvLog.greenbar_alert_msg.startswith('Start up log'):
-            self.clear_greenbar_msg()
+        return (devicename,
+                Gb.evlog_trk_monitors_flag,
+                Gb.display_gps_lat_long_flag,
+                Device.away_time_zone_offset if Device else 0,
+                Device.is_monitored if Device else False,
+                Device.primary_data_source if Device else '')
 
-        el_devicename_check = ['*', '**', 'nodevices', devicename]
+#--------------------------------------------------------------------
+    def _build_evlog_view(self, devicename):
+        '''
+        Build the event items of the EvLog view for the device. Each item record
+        is [device, time, state, zone, interval, travTime, dist, textMsg]
+        Select the items for the device or '*' from the devicename indexes. The
+        monitor recds are only used if they are being displayed.
+        '''
+        Device = Gb.Devices_by_devicename.get(devicename)
+        recd_types = RECD_TYPES if Gb.evlog_trk_monitors_flag else ['Reg']
 
-        if Device := Gb.Devices_by_devicename.get(devicename):
-            filter_record = (Device.primary_data_source == MOBAPP) \
-                                or Device.is_monitored
-        else:
-            Device = None
-            filter_record = False
+        event_recds_by_type = [self.event_recds_by_devicename[el_devicename][recd_type]
+                                    for el_devicename in set(EVLOG_VIEW_DEVICENAMES + [devicename])
+                                    if el_devicename in self.event_recds_by_devicename
+                                    for recd_type in recd_types]
 
         # Select devicename recds, keep time & test elements, drop devicename
         try:
             self.dist_to_devices_recd_found_flag = False
             self.apple_acct_auth_cnts_by_owner   = {}
 
-            el_recds = [self._master_reformat_text(el_recd, Device)
-                                            for el_recd in self.event_recds
-                                            if self._master_filter_recd(el_recd, devicename)]
-            return el_recds
+            self.evlog_view_items = deque(
+                    (el_recd, self._serialize_evlog_item(self._master_reformat_text(el_recd, Device)))
+                            for seq, el_recd in heapq.merge(*event_recds_by_type,
+                                                    key=lambda seq_recd: seq_recd[0], reverse=True)
+                            if self._master_filter_recd(el_recd, devicename))
 
         except IndexError:
-            for el_recd in self.event_recds:
-                if el_recd[ELR_DEVICENAME] not in el_devicename_check:
-                    continue
-                elif el_recd[ELR_DEVICENAME] in el_devicename_check:
-                    log_info_msg(f"{el_recd}")
-                elif len(el_recd) <= 3:
-                    log_info_msg(f"{el_recd}")
-
-        return []
+            self.evlog_view_items = deque()
+            for event_recds in event_recds_by_type:
+                for seq, el_recd in event_recds:
+                    if len(el_recd) <= 3:
+                        log_info_msg(f"{el_recd}")
+
+        self.evlog_view_key = self._evlog_view_key(devicename)
+
+#--------------------------------------------------------------------
+    def _add_recd_to_evlog_view(self, el_recd):
+        '''
+        Add a new recd to the EvLog view if it is displayed for the selected device
+        '''
+        if self.evlog_view_key is None:
+            return
+
+        devicename = self.evlog_view_key[0]
+        if el_recd[ELR_DEVICENAME] not in EVLOG_VIEW_DEVICENAMES + [devicename]:
+            return
+
+        # Only the last DistTo Devices and Apple Acct Auth recds are displayed.
+        # A new one can remove one that is already in the view, rebuild it.
+        elr_text = el_recd[ELR_TEXT]
+        if elr_text.startswith('DistTo Devices') or elr_text.startswith('Apple Acct Auth'):
+            self.evlog_view_key = None
+            return
+
+        try:
+            if self._master_filter_recd(el_recd, devicename):
+                Device = Gb.Devices_by_devicename.get(devicename)
+                self.evlog_view_items.appendleft(
+                        (el_recd, self._serialize_evlog_item(self._master_reformat_text(el_recd, Device))))
+
+        except Exception as err:
+            log_exception(err)
+            self.evlog_view_key = None
 
 #--------------------------------------------------------------------
     def _master_filter_recd(self, el_recd, devicename):
@@ -449,7 +449,8 @@ def _handle_global_action(global_action, action_option):
                         f"{CRLF_DOT}SELECT AGAIN TO STOP")
             post_event(event_msg)
             Gb.wazehist_recalculate_time_dist_flag = False
-            Gb.WazeHist.wazehist_recalculate_time_dist_all_zones()
+            Gb.WazeHist.write_pending_updates(force=True)
+            Gb.hass.add_job(Gb.WazeHist.wazehist_recalculate_time_dist_all_zones)
 
         else:
             Gb.wazehist_recalculate_time_dist_flag = True
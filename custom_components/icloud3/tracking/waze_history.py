@@ -17,6 +17,7 @@ from ..tracking.waze_route_calc_ic3 import WazeRouteCalculator, WRCError
 #--------------------------------------------------------------------
 import traceback
 import time
+import math
 import sqlite3
 from sqlite3 import Error
 import threading
@@ -106,27 +107,76 @@ CREATE_LOCATIONS_TABLE = '''
         usage_cnt    INTEGER DEFAULT (1)
     );'''
 
+# Indexes used by the location lookups, zone_id+lat_long_key for the exact match and
+# zone_id+latitude+longitude for the nearby location (bounding box) search
+CREATE_LOCATIONS_ZONE_KEY_INDEX = '''
+    CREATE INDEX IF NOT EXISTS locations_zone_id_lat_long_key
+        ON locations (zone_id, lat_long_key);'''
+
+CREATE_LOCATIONS_ZONE_GPS_INDEX = '''
+    CREATE INDEX IF NOT EXISTS locations_zone_id_latitude_longitude
+        ON locations (zone_id, latitude, longitude);'''
+
+# Get location record - [zone_id, lat_long_key]
+GET_LOCATION_RECORD = '''
+    SELECT * FROM locations
+        WHERE zone_id = ?
+            AND lat_long_key = ?
+        ORDER BY usage_cnt DESC
+        LIMIT 1
+    '''
+
+# Get location records near a location - [zone_id, lat_min, lat_max, long_min, long_max]
+GET_NEAR_LOCATION_RECORDS = '''
+    SELECT * FROM locations
+        WHERE zone_id = ?
+            AND latitude  BETWEEN ? AND ?
+            AND longitude BETWEEN ? AND ?
+    '''
+
+# Get location records for several zones and locations in one pass. The placeholders
+# are filled in by prefetch_location_recds - [zone_ids..., lat_long_keys...]
+GET_LOCATION_RECORDS_BATCH = '''
+    SELECT * FROM locations
+        WHERE zone_id IN ({zone_ids})
+            AND lat_long_key IN ({lat_long_keys})
+        ORDER BY usage_cnt
+    '''
+
+# A location within this distance of a location in the database reuses it's time/distance
+# (0 = only use an exact lat_long_key match)
+NEAR_LOCATION_RADIUS_KM = .015
+
 GET_LOCATIONS_TABLE_RECD_COUNT = '''
     SELECT count(*) FROM locations;
     '''
 
-# Add location record - [zone_id, lat_long_key, distance, travel_time, added,
+GET_LOCATIONS_TABLE_MAX_LOC_ID = '''
+    SELECT max(loc_id) FROM locations;
+    '''
+
+# Add location record - [loc_id, zone_id, lat_long_key, distance, travel_time, added,
 #                        last_used, usage_cnt]
 ADD_LOCATION_RECORD = '''
     INSERT INTO locations(
-        zone_id, lat_long_key, latitude, longitude,
+        loc_id, zone_id, lat_long_key, latitude, longitude,
         time, distance, added, last_used, usage_cnt)
-    VALUES(?,?,?,?,?,?,?,?,?)
+    VALUES(?,?,?,?,?,?,?,?,?,?)
     '''
 
-# Update locations table, location_data [last_used, usage_cnt, id]
+# Update locations table, location_data [last_used, usage_cnt increase, id]
 UPDATE_LOCATION_USED = '''
     UPDATE locations
         SET last_used = ? ,
-            usage_cnt = ?
+            usage_cnt = usage_cnt + ?
         WHERE loc_id = ?
     '''
 
+# Pending location adds and usage count updates are written to the database in one
+# transaction by write_pending_updates after this many seconds or pending updates
+WRITE_BEHIND_INTERVAL_SECS = 60
+WRITE_BEHIND_MAX_PENDING   = 100
+
 # DB Maintenance - Update locations table time & distance
 UPDATE_LOCATION_TIME_DISTANCE = '''
     UPDATE locations
@@ -161,6 +211,10 @@ DUPLICATE_LOCATION_RECDS_DELETE = '''
 class WazeRouteHistory(object):
     def __init__(self, wazehist_used, max_distance, track_direction):
 
+        # Write any pending updates and close the database if this is a restart
+        if getattr(self, 'connection', None):
+            self.close_waze_history_database()
+
         # Flags to control db maintenance
 
         self.WazeRouteCalc        = None
@@ -176,13 +230,18 @@ class WazeRouteHistory(object):
         self.sensor_map_recd_cnt  = 0
         self.track_latitude       = 0
         self.track_longitude      = 0
-        self.last_lat_long_key    = ''   # Last lat:long key read
-        self.last_location_recds  = []   # List of the last recds retrieved for the lat:long
+        self.location_recds_by_key = {}  # (zone_id, lat_long_key): location recd (None=not in db)
+                                         # from prefetch_location_recds for this 5-sec loop pass
+        self.pending_location_recds = {} # (zone_id, lat_long_key): location recd not written to the db yet
+        self.pending_usage_cnts     = {} # loc_id: [last_used, usage_cnt increase] not written to the db yet
+        self.pending_write_secs     = time.time()
+        self.next_loc_id            = 0  # loc_id assigned to the next location added
 
         self.track_direction_north_south_flag            = track_direction in ['north-south', 'north_south']
         self.is_refreshing_map_sensor                    = False
         self.wazehist_recalculate_time_dist_abort_flag   = False
         self.wazehist_recalculate_time_dist_running_flag = False
+        self.end_of_day_maintenance_running_flag         = False
 
         self.connection = None
         self.cursor     = None
@@ -211,12 +270,24 @@ class WazeRouteHistory(object):
         try:
             self.lock       = threading.Lock()
             self.lock.acquire(True)
-            self.connection = sqlite3.connect(self.wazehist_database, check_same_thread=False)
+            self.connection = sqlite3.connect(self.wazehist_database, check_same_thread=False,
+                                                timeout=30)
             self.cursor     = self.connection.cursor()
             self.lock.release()
 
+            # WAL lets the lookups read while the maintenance connection is writing
+            self._sql("PRAGMA journal_mode=WAL;")
+            self._sql("PRAGMA synchronous=NORMAL;")
+
             self._sql(CREATE_ZONES_TABLE)
             self._sql(CREATE_LOCATIONS_TABLE)
+            self._sql(CREATE_LOCATIONS_ZONE_KEY_INDEX)
+            self._sql(CREATE_LOCATIONS_ZONE_GPS_INDEX)
+
+            # Location records are added with the loc_id assigned here so it can be used
+            # before the pending records are written to the database
+            max_loc_id = self._sql(GET_LOCATIONS_TABLE_MAX_LOC_ID, fetchone=True)
+            self.next_loc_id = (max_loc_id[0] or 0) + 1 if max_loc_id else 1
 
         except:
             post_internal_error(traceback.format_exc)
@@ -232,6 +303,8 @@ class WazeRouteHistory(object):
         '''
         if self.connection is None: return
 
+        self.write_pending_updates(force=True)
+
         try:
             self.lock.acquire(True)
             self.connection.commit()
@@ -269,9 +342,12 @@ class WazeRouteHistory(object):
             log_exception(err)
 #--------------------------------------------------------------------
     def _execute(self, cursor, sql, fetchone=False, fetchall=False):
+        '''
+        Execute a sql stmt on a maintenance connection's cursor. The shared connection
+        lock is not used, sqlite handles the locking between the WAL connections.
+        '''
         try:
             records = None
-            self.lock.acquire(True)
             cursor.execute(sql)
 
             if fetchone:
@@ -279,12 +355,9 @@ class WazeRouteHistory(object):
             elif fetchall:
                 records = cursor.fetchall()
 
-            self.lock.release()
-
             return records
 
         except Exception as err:
-            self.lock.release()
             log_exception(err)
 
         return None
@@ -435,25 +508,115 @@ class WazeRouteHistory(object):
                 return (0, 0, 0)
 
             lat_long_key = (f"{latitude:.04f}:{longitude:.04f}")
-            if self.last_lat_long_key != lat_long_key:
-                criteria     = (f" lat_long_key='{lat_long_key}'")
-                orderby      = 'zone_id, usage_cnt DESC'
-                self.last_location_recds = self._get_all_records('locations', criteria=criteria, orderby=orderby)
+            record = self._get_location_recd(zone_id, lat_long_key, latitude, longitude)
 
-            if self.last_location_recds == []:
-                self.last_lat_long_key = ''
+            if record is None:
                 return (0, 0, 0)
 
-            self.last_lat_long_key = lat_long_key
-            for record in self.last_location_recds:
-                if record[LOC_ZONE_ID] == zone_id:
-                    return (record[LOC_TIME], record[LOC_DIST], record[LOC_ID])
+            return (record[LOC_TIME], record[LOC_DIST], record[LOC_ID])
 
+        except:
+            post_internal_error(traceback.format_exc)
             return (0, 0, 0)
 
+#--------------------------------------------------------------------
+    def _get_location_recd(self, zone_id, lat_long_key, latitude, longitude):
+        '''
+        Get the location record for the zone & lat:long key. Use the records read by
+        prefetch_location_recds if available, then the exact lat:long key and then the
+        nearest location within NEAR_LOCATION_RADIUS_KM.
+
+        Return: location record or None if not found
+        '''
+        key = (zone_id, lat_long_key)
+        if key in self.pending_location_recds:
+            record = self.pending_location_recds[key]
+        elif key in self.location_recds_by_key:
+            record = self.location_recds_by_key[key]
+        else:
+            record = self._sql(GET_LOCATION_RECORD, data=[zone_id, lat_long_key], fetchone=True)
+
+        if record is None and NEAR_LOCATION_RADIUS_KM > 0:
+            record = self._get_near_location_recd(zone_id, latitude, longitude)
+
+        return record
+
+#--------------------------------------------------------------------
+    def _get_near_location_recd(self, zone_id, latitude, longitude):
+        '''
+        Get the closest location record within NEAR_LOCATION_RADIUS_KM of the latitude/longitude.
+        The (zone_id, latitude, longitude) index limits the search to a small bounding box.
+        '''
+        lat_delta  = NEAR_LOCATION_RADIUS_KM / 111.32
+        long_delta = NEAR_LOCATION_RADIUS_KM / (111.32 * max(math.cos(math.radians(latitude)), .01))
+        box_data   = [zone_id, latitude - lat_delta, latitude + lat_delta,
+                                longitude - long_delta, longitude + long_delta]
+
+        records = self._sql(GET_NEAR_LOCATION_RECORDS, data=box_data, fetchall=True)
+        if not records:
+            return None
+
+        dist_km, record = min(
+                [(gps_distance_km((latitude, longitude), (record[LOC_LAT], record[LOC_LONG])), record)
+                            for record in records],
+                key=lambda dist_recd: dist_recd[0])
+
+        if dist_km > NEAR_LOCATION_RADIUS_KM:
+            return None
+
+        if self.wazehist_recalculate_time_dist_running_flag is False:
+            post_monitor_msg(   Gb.devicename,
+                                f"WazeHistDB > Near Location, "
+                                f"recdId={record[LOC_ID]}, "
+                                f"Zone-{record[LOC_ZONE_ID]}, "
+                                f"Dist-{dist_km*1000:.1f}m")
+        return record
+
+#--------------------------------------------------------------------
+    def prefetch_location_recds(self, Devices):
+        '''
+        Read the location records for the current location of all devices and their
+        tracked from zones with one query. The 5-sec loop calls this before the devices
+        are updated and get_location_time_dist uses these records.
+        '''
+        self.location_recds_by_key = {}
+
+        if (self.connection is None
+                or Gb.waze_history_database_used is False
+                or Gb.waze_history_max_distance == 0):
+            return
+
+        try:
+            keys = set()
+            for Device in Devices:
+                if Device.loc_data_latitude == 0 or Device.loc_data_longitude == 0:
+                    continue
+                lat_long_key = (f"{Device.loc_data_latitude:.04f}:{Device.loc_data_longitude:.04f}")
+                for from_zone in Device.FromZones_by_zone:
+                    zone_id = Gb.wazehist_zone_id.get(from_zone, 0)
+                    if zone_id > 0:
+                        keys.add((zone_id, lat_long_key))
+
+            if keys == set():
+                return
+
+            zone_ids      = list({zone_id for zone_id, _ in keys})
+            lat_long_keys = list({lat_long_key for _, lat_long_key in keys})
+            sql = GET_LOCATION_RECORDS_BATCH.format(
+                                zone_ids=','.join('?' * len(zone_ids)),
+                                lat_long_keys=','.join('?' * len(lat_long_keys)))
+            records = self._sql(sql, data=zone_ids + lat_long_keys, fetchall=True) or []
+
+            location_recds_by_key = {key: None for key in keys}
+            # Ordered by usage_cnt, the most used record of duplicates is saved last
+            for record in records:
+                location_recds_by_key[(record[LOC_ZONE_ID], record[LOC_LAT_LONG_KEY])] = record
+
+            self.location_recds_by_key = location_recds_by_key
+
         except:
             post_internal_error(traceback.format_exc)
-            return (0, 0, 0)
+            self.location_recds_by_key = {}
 
 #--------------------------------------------------------------------
     def add_location_record(self, zone_id, latitude, longitude, time, distance):
@@ -468,10 +631,16 @@ class WazeRouteHistory(object):
             longitude    = round(longitude, 6)
             datetime     = datetime_now()
 
-            location_data = [zone_id, lat_long_key, latitude, longitude,
-                                time, distance, datetime, datetime, 1]
+            # The record is written to the database by write_pending_updates
+            with self.lock:
+                location_id  = self.next_loc_id
+                self.next_loc_id += 1
 
-            location_id = self._add_record(ADD_LOCATION_RECORD, location_data)
+                location_recd = (location_id, zone_id, lat_long_key, latitude, longitude,
+                                    time, distance, datetime, datetime, 1)
+
+                self.pending_location_recds[(zone_id, lat_long_key)] = location_recd
+            self.location_recds_by_key[(zone_id, lat_long_key)] = location_recd
 
             self._update_sensor_ic3_wazehist_track(latitude, longitude)
 
@@ -493,44 +662,76 @@ class WazeRouteHistory(object):
             if location_id < 1:
                 return
 
-            sql = (f"SELECT * FROM locations WHERE loc_id={location_id}")
-
-
-            record = self._sql(sql, fetchone=True)
-            # self.lock.acquire(True)
-            # self.cursor.execute(sql)
-            # record = self.cursor.fetchone()
-            # self.lock.release()
-
-            cnt = record[LOC_USAGE_CNT] + 1
-            usage_data = [datetime_now(), cnt, location_id]
-
-            self._update_record(UPDATE_LOCATION_USED, usage_data)
-
-            record = self._sql(sql, fetchone=True)
-            # self.lock.acquire(True)
-            # self.cursor.execute(sql)
-            # record = self.cursor.fetchone()
-            # self.lock.release()
+            # The usage count is updated in the database by write_pending_updates
+            with self.lock:
+                usage_cnt = self.pending_usage_cnts.get(location_id, [None, 0])
+                self.pending_usage_cnts[location_id] = [datetime_now(), usage_cnt[1] + 1]
 
             if self.wazehist_recalculate_time_dist_running_flag is False:
                 post_monitor_msg(   Gb.devicename,
                                     f"WazeHistDB > Update Usage Cnt, "
                                     f"recdId={location_id}, "
-                                    f"Zone-{record[LOC_ZONE_ID]}, "
-                                    f"Time-{record[LOC_TIME]}, "
-                                    f"Dist-{record[LOC_DIST]}, "
-                                    f"Cnt-{cnt}")
+                                    f"PendingCnt-{usage_cnt[1] + 1}")
 
         except:
             post_internal_error(traceback.format_exc)
 
+#--------------------------------------------------------------------
+    def write_pending_updates(self, force=False):
+        '''
+        Write the pending location records and usage count updates to the database
+        in one transaction. The 5-sec loop calls this each pass, the updates are written
+        after WRITE_BEHIND_INTERVAL_SECS or when there are WRITE_BEHIND_MAX_PENDING
+        updates. force=True writes them now (closing the database, maintenance).
+        '''
+        if self.connection is None: return
+
+        pending_cnt = len(self.pending_location_recds) + len(self.pending_usage_cnts)
+        if pending_cnt == 0:
+            self.pending_write_secs = time.time()
+            return
+
+        if (force is False
+                and pending_cnt < WRITE_BEHIND_MAX_PENDING
+                and time.time() - self.pending_write_secs < WRITE_BEHIND_INTERVAL_SECS):
+            return
+
+        pending_location_recds = {}
+        usage_data = []
+        try:
+            with self.lock:
+                pending_location_recds = self.pending_location_recds
+                usage_data = [[last_used, cnt, loc_id]
+                                for loc_id, (last_used, cnt) in self.pending_usage_cnts.items()]
+                self.pending_write_secs     = time.time()
+
+                # The updates stay pending and are retried if the transaction fails
+                with self.connection:
+                    self.cursor.executemany(ADD_LOCATION_RECORD, pending_location_recds.values())
+                    self.cursor.executemany(UPDATE_LOCATION_USED, usage_data)
+
+                self.pending_location_recds = {}
+                self.pending_usage_cnts     = {}
+
+            post_monitor_msg(   f"WazeHistDB > Write Pending Updates, "
+                                f"Added-{len(pending_location_recds)}, "
+                                f"UsageCnts-{len(usage_data)}")
+
+        except Exception as err:
+            log_exception(err)
+            error_msg = (f"Error updating Waze History Database, "
+                        f"Added-{len(pending_location_recds)}, "
+                        f"UsageCnts-{len(usage_data)}")
+            log_error_msg(error_msg)
+
 #--------------------------------------------------------------------
     def compress_wazehist_database(self):
         """ Compress the WazeHist Database """
 
         if self.connection is None: return
 
+        self.write_pending_updates(force=True)
+
         # cursor = self.connection.cursor()
         vac_conn = sqlite3.connect(self.wazehist_database,
                                     check_same_thread=False,
@@ -546,6 +747,7 @@ class WazeRouteHistory(object):
                 self._execute(vac_cursor, DUPLICATE_LOCATION_RECDS_DELETE)
 
             self._execute(vac_cursor, "VACUUM;")
+            self._execute(vac_cursor, "PRAGMA wal_checkpoint(TRUNCATE);")
             vac_conn.commit()
 
         except Exception as err:
@@ -568,6 +770,23 @@ class WazeRouteHistory(object):
 #
 #<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
     def end_of_day_maintenance(self):
+        '''
+        Write the pending updates and start the maintenance tasks. They run in an
+        executor thread so the 5-sec tracking loop is not blocked.
+        '''
+        if self.connection is None: return
+
+        self.write_pending_updates(force=True)
+
+        if self.end_of_day_maintenance_running_flag:
+            post_event("Waze History > End-of-day maintenance is already running")
+            return
+
+        self.end_of_day_maintenance_running_flag = True
+        Gb.hass.add_job(self._end_of_day_maintenance_tasks)
+
+#--------------------------------------------------------------------
+    def _end_of_day_maintenance_tasks(self):
         try:
             waze_process = ''
 
@@ -590,7 +809,8 @@ class WazeRouteHistory(object):
                         f"Step-{waze_process}, "
                         f"Error-{err}")
             log_exception(err)
-            pass
+
+        self.end_of_day_maintenance_running_flag = False
 
 #--------------------------------------------------------------------
     def load_track_from_zone_table(self):
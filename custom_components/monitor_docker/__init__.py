@@ -32,6 +32,7 @@ from .const import (
     CONF_RENAME_ENITITY,
     CONF_RETRY,
     CONF_SENSORNAME,
+    CONF_STATS_STREAM,
     CONF_SWITCHENABLED,
     CONF_SWITCHNAME,
     CONF_BUTTONENABLED,
@@ -79,6 +80,7 @@ DOCKER_SCHEMA = vol.Schema(
         vol.Optional(CONF_CERTPATH, default=""): cv.string,
         vol.Optional(CONF_RETRY, default=DEFAULT_RETRY): cv.positive_int,
         vol.Optional(CONF_MEMORYCHANGE, default=100): cv.positive_int,
+        vol.Optional(CONF_STATS_STREAM, default=False): cv.boolean,
         vol.Optional(CONF_PRECISION_CPU, default=PRECISION): cv.positive_int,
         vol.Optional(CONF_PRECISION_MEMORY_MB, default=PRECISION): cv.positive_int,
         vol.Optional(
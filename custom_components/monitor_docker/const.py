@@ -25,6 +25,7 @@ CONF_PREFIX = "prefix"
 CONF_RENAME = "rename"
 CONF_RENAME_ENITITY = "rename_entity"
 CONF_RETRY = "retry"
+CONF_STATS_STREAM = "stats_stream"
 CONF_SENSORNAME = "sensorname"
 CONF_SWITCHENABLED = "switchenabled"
 CONF_SWITCHNAME = "switchname"
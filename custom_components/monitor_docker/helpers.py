@@ -2,6 +2,7 @@
 
 import asyncio
 import concurrent
+import inspect
 import logging
 import os
 from datetime import datetime, timezone
@@ -35,6 +36,7 @@ from .const import (
     CONF_PRECISION_MEMORY_PERCENTAGE,
     CONF_PRECISION_NETWORK_KB,
     CONF_PRECISION_NETWORK_MB,
+    CONF_STATS_STREAM,
     CONTAINER,
     CONTAINER_INFO_HEALTH,
     CONTAINER_INFO_IMAGE,
@@ -99,6 +101,11 @@ class DockerAPI:
         self._version1904 = None
         self._api: aiodocker.Docker = None
 
+        # CPU/memory of running containers, pushed by the containers themselves
+        self._stats_totals: dict[DockerContainerAPI, tuple[float, float]] = {}
+        self._total_cpu = 0.0
+        self._total_memory = 0.0
+
         _LOGGER.debug("[%s]: Helper version: %s", self._instance, VERSION)
 
         self._interval: int = config[CONF_SCAN_INTERVAL].seconds
@@ -214,6 +221,7 @@ class DockerAPI:
                 self._api,
                 cname,
                 version1904=self._version1904,
+                stats_listener=self._update_stats_totals,
             )
             await self._containers[cname].init()
 
@@ -472,7 +480,12 @@ class DockerAPI:
 
         # Create our Docker Container API
         self._containers[cname] = DockerContainerAPI(
-            self._config, self._api, cname, atInit=False, version1904=self._version1904
+            self._config,
+            self._api,
+            cname,
+            atInit=False,
+            version1904=self._version1904,
+            stats_listener=self._update_stats_totals,
         )
 
         # We should wait until container is attached
@@ -501,6 +514,7 @@ class DockerAPI:
             _LOGGER.debug("[%s] %s: Stopping Container Monitor", self._instance, cname)
             self._containers[cname].cancel_task()
             self._containers[cname].remove_entities()
+            self._update_stats_totals(self._containers[cname], None, None)
             await asyncio.sleep(0.1)
             del self._containers[cname]
         else:
@@ -537,33 +551,12 @@ class DockerAPI:
                 self._info[ATTR_VERSION_ARCH] = info.get("Architecture")
                 self._info[ATTR_VERSION_KERNEL] = info.get("KernelVersion")
 
-                self._info[DOCKER_STATS_CPU_PERCENTAGE] = 0.0
+                # Totals are kept up to date by the containers, see _update_stats_totals
+                self._info[DOCKER_STATS_CPU_PERCENTAGE] = self._total_cpu
                 self._info[DOCKER_STATS_1CPU_PERCENTAGE] = 0.0
-                self._info[DOCKER_STATS_MEMORY] = 0
+                self._info[DOCKER_STATS_MEMORY] = self._total_memory
                 self._info[DOCKER_STATS_MEMORY_PERCENTAGE] = 0.0
 
-                # Now go through all containers and get the cpu/memory stats
-                for container in self._containers.values():
-                    try:
-                        info = container.get_info()
-                        if info.get(CONTAINER_INFO_STATE) == "running":
-                            stats = container.get_stats()
-                            if stats.get(CONTAINER_STATS_CPU_PERCENTAGE) is not None:
-                                self._info[DOCKER_STATS_CPU_PERCENTAGE] += stats.get(
-                                    CONTAINER_STATS_CPU_PERCENTAGE
-                                )
-                            if stats.get(CONTAINER_STATS_MEMORY) is not None:
-                                self._info[DOCKER_STATS_MEMORY] += stats.get(
-                                    CONTAINER_STATS_MEMORY
-                                )
-                    except Exception as err:
-                        _LOGGER.error(
-                            "[%s]: run_docker_info memory/cpu of X (%s)",
-                            self._instance,
-                            str(err),
-                            exc_info=True,
-                        )
-
                 # Calculate memory percentage
                 if (
                     self._info[ATTR_MEMORY_LIMIT] is not None
@@ -669,6 +662,34 @@ class DockerAPI:
                 exc_info=True,
             )
 
+    #############################################################
+    def _update_stats_totals(
+        self,
+        container: "DockerContainerAPI",
+        cpu: float | None,
+        memory: float | None,
+    ) -> None:
+        """Replace the CPU/memory contribution of a container in the totals.
+
+        Called by a container after each stats update, with None values when
+        the container is not running (anymore).
+        """
+        old_cpu, old_memory = self._stats_totals.pop(container, (0.0, 0.0))
+        self._total_cpu -= old_cpu
+        self._total_memory -= old_memory
+
+        if cpu is not None or memory is not None:
+            cpu = cpu or 0.0
+            memory = memory or 0.0
+            self._stats_totals[container] = (cpu, memory)
+            self._total_cpu += cpu
+            self._total_memory += memory
+
+        # Avoid drift of the running sums, recalculate when nothing is left
+        if not self._stats_totals:
+            self._total_cpu = 0.0
+            self._total_memory = 0.0
+
     #############################################################
     def list_containers(self):
         return self._containers.keys()
@@ -699,6 +720,7 @@ class DockerContainerAPI:
         cname: str,
         atInit=True,
         version1904: bool | None = None,
+        stats_listener: Callable | None = None,
     ):
         self._config = config
         self._api = api
@@ -710,6 +732,10 @@ class DockerContainerAPI:
         self._busy = False
         self._atInit = atInit
         self._task: asyncio.Task | None = None
+        self._stats_stream = config.get(CONF_STATS_STREAM, False)
+        self._stats_task: asyncio.Task | None = None
+        self._stats_raw: dict[str, Any] | None = None
+        self._stats_listener = stats_listener
         self._subscribers: list[Callable] = []
         self._cpu_old: dict[str, int] = {}
         self._network_old: dict[str, int | datetime] = {}
@@ -785,8 +811,14 @@ class DockerContainerAPI:
 
                     # Only run stats if container is running
                     if self._info[CONTAINER_INFO_STATE] in ("running", "paused"):
-                        await self._run_container_stats()
+                        if self._stats_stream:
+                            self._run_container_stats_stream()
+                        else:
+                            await self._run_container_stats()
+                    else:
+                        self._cancel_stats_task()
 
+                    self._notify_stats_listener()
                     self._notify()
                 else:
                     _LOGGER.debug(
@@ -897,13 +929,6 @@ class DockerContainerAPI:
 
     #############################################################
     async def _run_container_stats(self) -> None:
-        # Initialize stats information
-        stats: dict[str, Any] = {}
-        stats["cpu"] = {}
-        stats["memory"] = {}
-        stats["network"] = {}
-        stats["read"] = {}
-
         # Get container stats, only interested in [0]
         rawarr = await self._container.stats(stream=False)
 
@@ -913,6 +938,82 @@ class DockerContainerAPI:
         except IndexError:
             return
 
+        self._process_container_stats(raw)
+
+    #############################################################
+    def _run_container_stats_stream(self) -> None:
+        """Use the latest sample of the stats stream, (re)start it if required."""
+
+        if self._stats_task is None or self._stats_task.done():
+            _LOGGER.debug(
+                "[%s] %s: Starting stats stream", self._instance, self._name
+            )
+            self._stats_task = asyncio.create_task(self._run_stats_stream())
+
+        # Nothing received yet, or no new sample since the previous interval
+        raw = self._stats_raw
+        if raw is None:
+            return
+
+        self._stats_raw = None
+        self._process_container_stats(raw)
+
+    #############################################################
+    async def _run_stats_stream(self) -> None:
+        """Keep the latest sample of the Docker stats stream.
+
+        The Docker daemon pushes a sample every second over one long-lived
+        request, we only store it and process it in the next _run interval.
+        """
+
+        try:
+            feed = self._container.stats(stream=True)
+            if inspect.isawaitable(feed):
+                feed = await feed
+            async for raw in feed:
+                self._stats_raw = raw
+        except (asyncio.CancelledError, concurrent.futures._base.CancelledError):
+            raise
+        except Exception as err:
+            _LOGGER.debug(
+                "[%s] %s: Stats stream ended (%s)",
+                self._instance,
+                self._name,
+                str(err),
+            )
+
+    #############################################################
+    def _cancel_stats_task(self) -> None:
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            self._stats_task = None
+            self._stats_raw = None
+
+    #############################################################
+    def _notify_stats_listener(self) -> None:
+        """Push CPU/memory of this container into the Docker totals."""
+
+        if self._stats_listener is None:
+            return
+
+        if self._info.get(CONTAINER_INFO_STATE) == "running":
+            self._stats_listener(
+                self,
+                self._stats.get(CONTAINER_STATS_CPU_PERCENTAGE),
+                self._stats.get(CONTAINER_STATS_MEMORY),
+            )
+        else:
+            self._stats_listener(self, None, None)
+
+    #############################################################
+    def _process_container_stats(self, raw: dict[str, Any]) -> None:
+        # Initialize stats information
+        stats: dict[str, Any] = {}
+        stats["cpu"] = {}
+        stats["memory"] = {}
+        stats["network"] = {}
+        stats["read"] = {}
+
         stats["read"] = parser.parse(raw["read"])
 
         # Gather CPU information
@@ -1207,6 +1308,8 @@ class DockerContainerAPI:
 
     #############################################################
     def cancel_task(self) -> None:
+        self._cancel_stats_task()
+
         if self._task is not None:
             _LOGGER.info(
                 "[%s] %s: Cancelling task for container info/stats",
@@ -16,7 +16,7 @@ from homeassistant.helpers.reload import (async_integration_yaml_config,
 
 from .const import (CONF_FORM_SUBMIT, CONF_LOG_RESPONSE, CONF_PARSER,
                     COORDINATOR, DOMAIN, PLATFORM_IDX, SCRAPER, SCRAPER_DATA,
-                    SCRAPER_IDX)
+                    SCRAPER_IDX, SHARED_REQUESTS)
 from .coordinator import (create_content_request_manager,
                           create_multiscrape_coordinator)
 from .file import create_file_manager
@@ -68,6 +68,7 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry):
 def _async_setup_shared_data(hass: HomeAssistant):
     """Create shared data for platform config and scraper coordinators."""
     hass.data[DOMAIN] = {key: [] for key in [SCRAPER_DATA, *PLATFORMS]}
+    hass.data[DOMAIN][SHARED_REQUESTS] = {}
 
 
 async def _async_process_config(hass: HomeAssistant, config) -> bool:
@@ -114,6 +114,7 @@ class MultiscrapeBinarySensor(MultiscrapeEntity, BinarySensorEntity):
 
         self._attr_unique_id = unique_id
         self._sensor_selector = sensor_selector
+        scraper.register_selector(sensor_selector)
 
     def _update_sensor(self):
         """Update state from the scraped data."""
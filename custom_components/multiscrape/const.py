@@ -33,6 +33,8 @@ CONF_FORM_SUBMIT_ONCE = "submit_once"
 CONF_FORM_RESUBMIT_ERROR = "resubmit_on_error"
 CONF_FORM_VARIABLES = "variables"
 CONF_LOG_RESPONSE = "log_response"
+CONF_CONDITIONAL_REQUEST = "conditional_request"
+CONF_SHARE_REQUEST = "share_request"
 CONF_EXTRACT = "extract"
 EXTRACT_OPTIONS = ["text", "content", "tag"]
 DEFAULT_PARSER = "lxml"
@@ -47,6 +49,7 @@ COORDINATOR = "coordinator"
 SCRAPER = "scraper"
 
 SCRAPER_DATA = "scraper"
+SHARED_REQUESTS = "shared_requests"
 
 METHODS = ["POST", "GET", "PUT"]
 DEFAULT_SEPARATOR = ","
@@ -61,8 +61,15 @@ class ContentRequestManager:
         if self._form_submitter:
             self._form_submitter.notify_scrape_exception()
 
-    async def get_content(self) -> str:
-        """Retrieve the content of a url and first submit a form if required."""
+    def reset_conditional_request(self):
+        """Make sure the next request retrieves the full content."""
+        self._http.reset_conditional_request()
+
+    async def get_content(self) -> str | None:
+        """Retrieve the content of a url and first submit a form if required.
+
+        Returns None if the content was not modified since the last request.
+        """
         resource = self._resource_renderer()
 
         if self._form_submitter:
@@ -87,6 +94,8 @@ class ContentRequestManager:
                 )
 
         response = await self._http.async_request("page", resource, cookies=self._cookies, variables=self._form_variables)
+        if response.status_code == 304:
+            return None
         return response.text
 
     @property
@@ -134,6 +143,8 @@ class MultiscrapeDataUpdateCoordinator(DataUpdateCoordinator):
         self.update_error = False
         self._resource = None
         self._retry: int = 0
+        self._content = None
+        self._data_version = 0
 
         if self._update_interval == timedelta(seconds=0):
             self._update_interval = None
@@ -142,8 +153,14 @@ class MultiscrapeDataUpdateCoordinator(DataUpdateCoordinator):
             "%s # Scan interval is %s", self._config_name, self._update_interval
         )
 
+        # The sensors are only updated when the data version changes, it does not
+        # change when the resource replies the content was not modified
         super().__init__(
-            hass, _LOGGER, name=DOMAIN, update_interval=self._update_interval
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=self._update_interval,
+            always_update=False,
         )
 
         async def _on_hass_start(_: Event) -> None:
@@ -163,7 +180,17 @@ class MultiscrapeDataUpdateCoordinator(DataUpdateCoordinator):
 
         try:
             response = await self._request_manager.get_content()
+            if response is None:
+                _LOGGER.debug(
+                    "%s # Content not modified since the last run. Skip updating the sensors.",
+                    self._config_name,
+                )
+                await self._scraper.set_content(self._content)
+                self._retry = 0
+                return self.data
+
             await self._scraper.set_content(response)
+            self._content = response
             _LOGGER.debug(
                 "%s # Data successfully refreshed. Sensors will now start scraping to update.",
                 self._config_name,
@@ -177,6 +204,7 @@ class MultiscrapeDataUpdateCoordinator(DataUpdateCoordinator):
                 ex,
             )
             self._scraper.reset()
+            self._request_manager.reset_conditional_request()
             self.update_error = True
             if self._update_interval is None:
                 self._async_unsub_refresh()
@@ -199,6 +227,9 @@ class MultiscrapeDataUpdateCoordinator(DataUpdateCoordinator):
                         self._config_name,
                     )
 
+        self._data_version += 1
+        return self._data_version
+
     async def _prepare_new_run(self):
         _LOGGER.debug(
             "%s # New run: start (re)loading data from resource", self._config_name
@@ -52,6 +52,8 @@ class MultiscrapeEntity(RestoreEntity):
 
         self.hass = hass
         self._attribute_selectors = attribute_selectors
+        for attr_selector in attribute_selectors.values():
+            scraper.register_selector(attr_selector)
 
         self._icon_template = icon_template
         if self._icon_template:
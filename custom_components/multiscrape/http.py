@@ -11,6 +11,8 @@ from homeassistant.const import (CONF_AUTHENTICATION, CONF_HEADERS,
                                  CONF_VERIFY_SSL, HTTP_DIGEST_AUTHENTICATION)
 from homeassistant.helpers.httpx_client import get_async_client
 
+from .const import (CONF_CONDITIONAL_REQUEST, CONF_SHARE_REQUEST, DOMAIN,
+                    SHARED_REQUESTS)
 from .util import create_dict_renderer, create_renderer
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,6 +29,8 @@ def create_http_wrapper(config_name, config, hass, file_manager):
     params = config.get(CONF_PARAMS)
     payload = config.get(CONF_PAYLOAD)
     method = config.get(CONF_METHOD)
+    conditional_request = config.get(CONF_CONDITIONAL_REQUEST, False)
+    share_request = config.get(CONF_SHARE_REQUEST, False)
 
     client = get_async_client(hass, verify_ssl)
     http = HttpWrapper(
@@ -39,6 +43,8 @@ def create_http_wrapper(config_name, config, hass, file_manager):
         params_renderer=create_dict_renderer(hass, params),
         headers_renderer=create_dict_renderer(hass, headers),
         data_renderer=create_renderer(hass, payload),
+        conditional_request=conditional_request,
+        share_request=share_request,
     )
     if username and password:
         http.set_authentication(username, password, auth_type)
@@ -59,6 +65,8 @@ class HttpWrapper:
         params_renderer: Callable = None,
         headers_renderer: Callable = None,
         data_renderer: Callable = None,
+        conditional_request: bool = False,
+        share_request: bool = False,
     ):
         """Initialize HttpWrapper."""
         _LOGGER.debug("%s # Initializing http wrapper", config_name)
@@ -72,6 +80,13 @@ class HttpWrapper:
         self._params_renderer = params_renderer
         self._headers_renderer = headers_renderer
         self._data_renderer = data_renderer
+        self._conditional_request = conditional_request
+        self._share_request = share_request
+        self._validators = {}
+
+    def reset_conditional_request(self):
+        """Forget the ETag/Last-Modified values so the next request gets the full content."""
+        self._validators = {}
 
     def set_authentication(self, username, password, auth_type):
         """Set http authentication."""
@@ -92,6 +107,10 @@ class HttpWrapper:
         # Merging params in multiscrape since httpx doesn't do it anymore: https://github.com/encode/httpx/issues/3433
         merged_resource = merge_url_with_params(resource, params)
 
+        conditional = self._conditional_request and method.upper() == "GET"
+        if conditional and merged_resource in self._validators:
+            headers = {**(headers or {}), **self._validators[merged_resource]}
+
         _LOGGER.debug(
             "%s # Executing %s-request with a %s to url: %s with headers: %s and cookies: %s.",
             self._config_name,
@@ -110,16 +129,18 @@ class HttpWrapper:
         response = None
 
         try:
-            response = await self._client.request(
-                method,
-                merged_resource,
-                headers=headers,
-                auth=self._auth,
-                data=data,
-                timeout=self._timeout,
-                follow_redirects=True,
-                cookies=cookies
-            )
+            if (
+                self._share_request
+                and context == "page"
+                and method.upper() == "GET"
+                and not cookies
+                and not self._auth
+            ):
+                response = await self._async_shared_request(merged_resource, headers, data)
+            else:
+                response = await self._async_client_request(
+                    method, merged_resource, headers, data, cookies
+                )
 
             _LOGGER.debug(
                 "%s # Response status code received: %s",
@@ -139,6 +160,9 @@ class HttpWrapper:
             # bit of a hack since httpx also raises an exception for redirects: https://github.com/encode/httpx/blob/c6c8cb1fe2da9380f8046a19cdd5aade586f69c8/CHANGELOG.md#0200-13th-october-2021
             if 400 <= response.status_code <= 599:
                 response.raise_for_status()
+
+            if conditional:
+                self._update_validators(merged_resource, response)
             return response
         except httpx.TimeoutException as ex:
             _LOGGER.debug(
@@ -171,6 +195,67 @@ class HttpWrapper:
             await self._handle_request_exception(context, response)
             raise
 
+    async def _async_client_request(self, method, resource, headers, data, cookies):
+        return await self._client.request(
+            method,
+            resource,
+            headers=headers,
+            auth=self._auth,
+            data=data,
+            timeout=self._timeout,
+            follow_redirects=True,
+            cookies=cookies
+        )
+
+    async def _async_shared_request(self, resource, headers, data):
+        """Execute a GET request or wait for an identical request that is still in flight."""
+        shared_requests = self._hass.data[DOMAIN][SHARED_REQUESTS]
+        # The client is part of the key, as it holds the SSL verification setting
+        key = (
+            id(self._client),
+            resource,
+            tuple(sorted((headers or {}).items())),
+            data,
+            self._timeout,
+        )
+
+        task = shared_requests.get(key)
+        if task is not None:
+            _LOGGER.debug(
+                "%s # Waiting for the response of an identical request to url: %s",
+                self._config_name,
+                resource,
+            )
+            return await asyncio.shield(task)
+
+        task = self._hass.async_create_task(
+            self._async_client_request("GET", resource, headers, data, None)
+        )
+        shared_requests[key] = task
+
+        def _remove_shared_request(_):
+            if shared_requests.get(key) is task:
+                del shared_requests[key]
+
+        task.add_done_callback(_remove_shared_request)
+        return await asyncio.shield(task)
+
+    def _update_validators(self, resource, response):
+        """Save the ETag/Last-Modified values of the response for the next request."""
+        if response.status_code == 304:
+            return
+
+        validators = {}
+        if etag := response.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+
+        if validators:
+            self._validators[resource] = validators
+        else:
+            self._validators.pop(resource, None)
+
     async def _handle_request_exception(self, context, response):
         try:
             if self._file_manager:
@@ -24,7 +24,8 @@ from homeassistant.const import (CONF_AUTHENTICATION, CONF_DEVICE_CLASS,
                                  HTTP_BASIC_AUTHENTICATION,
                                  HTTP_DIGEST_AUTHENTICATION)
 
-from .const import (CONF_ATTR, CONF_EXTRACT, CONF_FORM_INPUT,
+from .const import (CONF_ATTR, CONF_CONDITIONAL_REQUEST, CONF_EXTRACT,
+                    CONF_FORM_INPUT,
                     CONF_FORM_INPUT_FILTER, CONF_FORM_RESUBMIT_ERROR,
                     CONF_FORM_SELECT, CONF_FORM_SUBMIT, CONF_FORM_SUBMIT_ONCE,
                     CONF_FORM_VARIABLES, CONF_LOG_RESPONSE, CONF_ON_ERROR,
@@ -32,7 +33,8 @@ from .const import (CONF_ATTR, CONF_EXTRACT, CONF_FORM_INPUT,
                     CONF_ON_ERROR_VALUE, CONF_ON_ERROR_VALUE_DEFAULT,
                     CONF_ON_ERROR_VALUE_LAST, CONF_ON_ERROR_VALUE_NONE,
                     CONF_PARSER, CONF_PICTURE, CONF_SELECT, CONF_SELECT_LIST,
-                    CONF_SENSOR_ATTRS, CONF_SEPARATOR, CONF_STATE_CLASS,
+                    CONF_SENSOR_ATTRS, CONF_SEPARATOR, CONF_SHARE_REQUEST,
+                    CONF_STATE_CLASS,
                     DEFAULT_BINARY_SENSOR_NAME, DEFAULT_BUTTON_NAME,
                     DEFAULT_EXTRACT, DEFAULT_FORCE_UPDATE, DEFAULT_METHOD,
                     DEFAULT_PARSER, DEFAULT_SENSOR_NAME, DEFAULT_SEPARATOR,
@@ -68,6 +70,8 @@ INTEGRATION_SCHEMA = {
     vol.Optional(CONF_NAME): cv.string,
     vol.Optional(CONF_SCAN_INTERVAL): cv.time_period,
     vol.Optional(CONF_LOG_RESPONSE, default=False): cv.boolean,
+    vol.Optional(CONF_CONDITIONAL_REQUEST, default=False): cv.boolean,
+    vol.Optional(CONF_SHARE_REQUEST, default=False): cv.boolean,
     vol.Optional(CONF_SEPARATOR, default=DEFAULT_SEPARATOR): cv.string,
 }
 
@@ -1,7 +1,9 @@
 """Support for multiscrape requests."""
+import hashlib
 import logging
 
 from bs4 import BeautifulSoup
+from homeassistant.util.json import json_loads
 
 from .const import CONF_PARSER, CONF_SEPARATOR
 
@@ -44,7 +46,15 @@ class Scraper:
         self._parser = parser
         self._soup: BeautifulSoup = None
         self._data = None
+        self._json_variables = None
         self._separator = separator
+        self._selectors = []
+        # Cache of the last parsed content, kept when the scraper is reset so unchanged
+        # content is not parsed and scraped again
+        self._content_hash = None
+        self._parsed_soup = None
+        self._parsed_json_variables = None
+        self._selected = {}
         self.reset()
 
     @property
@@ -56,36 +66,58 @@ class Scraper:
         """Reset the scraper object."""
         self._data = None
         self._soup = None
+        self._json_variables = None
+
+    def register_selector(self, selector):
+        """Register a selector of a sensor or attribute to be selected after each content update."""
+        if not selector.just_value:
+            self._selectors.append(selector)
 
     @property
     def formatted_content(self):
         """Property for getting the content. HTML will be prettified."""
-        if self._soup:
+        if self._soup is not None:
             return self._soup.prettify()
         return self._data
 
     async def set_content(self, content):
         """Set the content to be scraped."""
         self._data = content
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+
+        if content_hash == self._content_hash:
+            _LOGGER.debug(
+                "%s # Content is unchanged since the last run. Skip parsing.",
+                self._config_name,
+            )
+            self._soup = self._parsed_soup
+            self._json_variables = self._parsed_json_variables
 
-        if content[0] in ["{", "["]:
+        elif content[0] in ["{", "["]:
             _LOGGER.debug(
                 "%s # Response seems to be json. Skip parsing with BeautifulSoup.",
                 self._config_name,
             )
+            self._set_parsed_content(
+                content_hash,
+                None,
+                await self._hass.async_add_executor_job(self._load_json, content),
+            )
+
         else:
             try:
                 _LOGGER.debug(
                     "%s # Loading the content in BeautifulSoup.",
                     self._config_name,
                 )
-                self._soup = await self._hass.async_add_executor_job(
-                    BeautifulSoup, self._data, self._parser
+                self._set_parsed_content(
+                    content_hash,
+                    await self._hass.async_add_executor_job(
+                        BeautifulSoup, self._data, self._parser
+                    ),
+                    None,
                 )
 
-                if self._file_manager:
-                    await self._async_file_log("page_soup", self._soup.prettify())
-
             except Exception as ex:
                 self.reset()
                 _LOGGER.error(
@@ -95,56 +127,139 @@ class Scraper:
                 )
                 raise
 
-    def scrape(self, selector, sensor, attribute=None, variables: dict = {}):
-        """Scrape based on given selector the data."""
-        # This is required as this function is called separately for sensors and attributes
-        log_prefix = f"{self._config_name} # {sensor}"
-        if attribute:
-            log_prefix = log_prefix + f"# {attribute}"
+        if self._soup is not None:
+            if self._file_manager:
+                await self._async_file_log("page_soup", self._soup.prettify())
 
-        if selector.just_value:
-            _LOGGER.debug("%s # Applying value_template only.", log_prefix)
-            result = selector.value_template.async_render_with_possible_json_value(
-                self._data, None, variables=variables
-            )
-            return selector.value_template._parse_result(result)
+            await self._async_select_all()
 
-        if self._data[0] in ["{", "["]:
-            raise ValueError(
-                "JSON cannot be scraped. Please provide a value template to parse JSON response."
+    def _set_parsed_content(self, content_hash, soup, json_variables):
+        self._soup = self._parsed_soup = soup
+        self._json_variables = self._parsed_json_variables = json_variables
+        self._content_hash = content_hash
+        self._selected = {}
+
+    @staticmethod
+    def _load_json(content):
+        """Parse the content and return the value_json template variable."""
+        try:
+            return {"value_json": json_loads(content)}
+        except (ValueError, TypeError):
+            return {}
+
+    async def _async_select_all(self):
+        """Select the values of all registered selectors in one executor job."""
+        select_keys = set()
+        for selector in self._selectors:
+            try:
+                select_keys.add(self._select_key(selector))
+            except Exception:  # pylint: disable=broad-except
+                # Template errors are logged when the selector is scraped
+                continue
+
+        select_keys.difference_update(self._selected)
+        if not select_keys:
+            return
+
+        _LOGGER.debug(
+            "%s # Selecting %s selectors in the executor",
+            self._config_name,
+            len(select_keys),
+        )
+        self._selected.update(
+            await self._hass.async_add_executor_job(
+                self._select, self._soup, select_keys
             )
+        )
 
+    @staticmethod
+    def _select_key(selector):
+        """Return the rendered css selector and the options that determine its value."""
         if selector.is_list:
-            tags = self._soup.select(selector.list)
+            return (selector.list, True, selector.attribute, selector.extract)
+        return (selector.element, False, selector.attribute, selector.extract)
+
+    def _select(self, soup, select_keys):
+        """Select the values for the selector keys, an error is kept to be raised when scraped."""
+        selected = {}
+        for select_key in select_keys:
+            try:
+                selected[select_key] = (self._select_value(soup, *select_key), None)
+            except Exception as ex:  # pylint: disable=broad-except
+                # Keep the error type and arguments, a raised exception holds on to its traceback
+                selected[select_key] = (None, (type(ex), ex.args))
+        return selected
+
+    def _select_value(self, soup, css_selector, is_list, attribute, extract):
+        log_prefix = f"{self._config_name} # {css_selector}"
+
+        if is_list:
+            tags = soup.select(css_selector)
             _LOGGER.debug("%s # List selector selected tags: %s",
                           log_prefix, tags)
-            if selector.attribute is not None:
+            if attribute is not None:
                 _LOGGER.debug(
                     "%s # Try to find attributes: %s",
                     log_prefix,
-                    selector.attribute,
+                    attribute,
                 )
-                values = [tag[selector.attribute] for tag in tags]
+                values = [tag[attribute] for tag in tags]
             else:
-                values = [self.extract_tag_value(tag, selector) for tag in tags]
+                values = [self._extract_tag_value(tag, extract) for tag in tags]
             value = self._separator.join(values)
             _LOGGER.debug("%s # List selector csv: %s", log_prefix, value)
 
         else:
-            tag = self._soup.select_one(selector.element)
+            tag = soup.select_one(css_selector)
             _LOGGER.debug("%s # Tag selected: %s", log_prefix, tag)
             if tag is None:
                 raise ValueError("Could not find a tag for given selector")
 
-            if selector.attribute is not None:
+            if attribute is not None:
                 _LOGGER.debug(
-                    "%s # Try to find attribute: %s", log_prefix, selector.attribute
+                    "%s # Try to find attribute: %s", log_prefix, attribute
                 )
-                value = tag[selector.attribute]
+                value = tag[attribute]
             else:
-                value = self.extract_tag_value(tag, selector)
+                value = self._extract_tag_value(tag, extract)
             _LOGGER.debug("%s # Selector result: %s", log_prefix, value)
 
+        return value
+
+    def scrape(self, selector, sensor, attribute=None, variables: dict = {}):
+        """Scrape based on given selector the data."""
+        # This is required as this function is called separately for sensors and attributes
+        log_prefix = f"{self._config_name} # {sensor}"
+        if attribute:
+            log_prefix = log_prefix + f"# {attribute}"
+
+        if selector.just_value:
+            _LOGGER.debug("%s # Applying value_template only.", log_prefix)
+            # The json content is parsed once and shared by all value templates
+            if self._json_variables is None:
+                self._json_variables = self._load_json(self._data)
+            try:
+                return selector.value_template.async_render(
+                    variables={**variables, "value": self._data, **self._json_variables},
+                    parse_result=True,
+                )
+            except Exception:  # pylint: disable=broad-except
+                return None
+
+        if self._data[0] in ["{", "["]:
+            raise ValueError(
+                "JSON cannot be scraped. Please provide a value template to parse JSON response."
+            )
+
+        select_key = self._select_key(selector)
+        if select_key not in self._selected:
+            self._selected.update(self._select(self._soup, [select_key]))
+
+        value, error = self._selected[select_key]
+        if error is not None:
+            ex_type, ex_args = error
+            raise ex_type(*ex_args)
+
         if value is not None and selector.value_template is not None:
             _LOGGER.debug(
                 "%s # Applying value_template on selector result", log_prefix)
@@ -160,14 +275,18 @@ class Scraper:
 
     def extract_tag_value(self, tag, selector):
         """Extract value from a tag."""
+        return self._extract_tag_value(tag, selector.extract)
+
+    @staticmethod
+    def _extract_tag_value(tag, extract):
         if tag.name in ("style", "script", "template"):
             return tag.string
         else:
-            if selector.extract == "text":
+            if extract == "text":
                 return tag.text
-            elif selector.extract == "content":
+            elif extract == "content":
                 return ''.join(map(str, tag.contents))
-            elif selector.extract == "tag":
+            elif extract == "tag":
                 return str(tag)
 
     async def _async_file_log(self, content_name, content):
@@ -122,6 +122,7 @@ class MultiscrapeSensor(MultiscrapeEntity, SensorEntity):
         self._attr_native_unit_of_measurement = unit_of_measurement
 
         self._sensor_selector = sensor_selector
+        scraper.register_selector(sensor_selector)
 
     def _update_sensor(self):
         """Update state from the scraper data."""
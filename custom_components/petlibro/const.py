@@ -22,6 +22,9 @@ PLATFORMS = ["sensor", "switch", "button", "binary_sensor", "number", "select",
 # Update interval for device data in seconds
 UPDATE_INTERVAL_SECONDS = 60  # You can adjust this value based on your needs
 
+# Interval in seconds for polling rarely changing device data (settings, plans, firmware)
+COLD_REFRESH_INTERVAL_SECONDS = 15 * 60
+
 
 class Gender(IntEnum):
     """Gender/sex options."""
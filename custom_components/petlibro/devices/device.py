@@ -1,18 +1,42 @@
 # Error Mode - Used for pulling API for new devices. Enable Error Mode and Disable Debug Mode.
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
 from logging import getLogger
-from typing import cast
+import time
+from typing import Any, cast
 
 from ..api import PetLibroAPI
 from .event import Event, EVENT_UPDATE
 from ..member import Member
-from ..const import DEFAULT_MAX_FEED_PORTIONS
+from ..const import COLD_REFRESH_INTERVAL_SECONDS, DEFAULT_MAX_FEED_PORTIONS
 
 
 _LOGGER = getLogger(__name__)
 
+# Set while the hub polls a device, refreshes outside of a poll (after a write) fetch every endpoint.
+_POLLING: ContextVar[bool] = ContextVar("petlibro_polling", default=False)
+
 
 class Device(Event):
+    # Endpoints with data that rarely changes, only polled every COLD_REFRESH_INTERVAL_SECONDS.
+    # Every other endpoint is polled on each update.
+    COLD_ENDPOINTS = frozenset({
+        "baseInfo",
+        "getAttributeSetting",
+        "getUpgrade",
+        "getDefaultMatrix",
+        "feedingPlan",
+        "wetFeedingPlan",
+    })
+    # Endpoints whose data is merged into the top level of the device data.
+    MERGED_ENDPOINTS = frozenset({"baseInfo", "realInfo", "getAttributeSetting"})
+    # Endpoints fetched after the others, as they depend on their data.
+    DEPENDENT_ENDPOINTS = frozenset({"feedingPlan"})
+    # Endpoints that default to a list instead of a dict.
+    LIST_ENDPOINTS = frozenset({"feedingPlan", "workRecord"})
+
     def __init__(self, data: dict, member: Member, api: PetLibroAPI):
         super().__init__()
         self._data: dict = {}
@@ -21,6 +45,7 @@ class Device(Event):
         
         self.feed_conv_factor = 1
         self.max_feed_portions = DEFAULT_MAX_FEED_PORTIONS
+        self._endpoint_refresh_times: dict[str, float] = {}
 
         self.update_data(data)
 
@@ -39,13 +64,73 @@ class Device(Event):
     async def refresh(self):
         """Refresh the device data from the API."""
         try:
-            data = {}
-            data.update(await self.api.device_base_info(self.serial))
-            data.update(await self.api.device_real_info(self.serial))
-            data.update(await self.api.device_attribute_settings(self.serial))
-            self.update_data(data)
+            await self._refresh_endpoints({})
         except Exception as e:
             _LOGGER.error(f"Failed to refresh device data: {e}")
+
+    async def poll(self) -> None:
+        """Refresh the device data, skipping cold endpoints that are not due yet."""
+        token = _POLLING.set(True)
+        try:
+            await self.refresh()
+        finally:
+            _POLLING.reset(token)
+
+    async def _refresh_endpoints(self, endpoints: dict[str, Callable[[str], Awaitable[Any]]]) -> None:
+        """Fetch the due endpoints concurrently and store their data under their key.
+
+        The base, real time and attribute settings info is always included and merged into
+        the device data. Data of endpoints that fail to load is kept until the next refresh,
+        the first error is raised once everything else has been stored.
+        """
+        fetchers: dict[str, Callable[[str], Awaitable[Any]]] = {
+            "baseInfo": self.api.device_base_info,
+            "realInfo": self.api.device_real_info,
+            "getAttributeSetting": self.api.device_attribute_settings,
+            **endpoints,
+        }
+        now = time.monotonic()
+        polling = _POLLING.get()
+        due = [key for key in fetchers if not polling or self._is_endpoint_due(key, now)]
+
+        error: BaseException | None = None
+        for keys in (
+            [key for key in due if key not in self.DEPENDENT_ENDPOINTS],
+            [key for key in due if key in self.DEPENDENT_ENDPOINTS],
+        ):
+            if not keys:
+                continue
+            results = await asyncio.gather(
+                *(fetchers[key](self.serial) for key in keys), return_exceptions=True
+            )
+            data: dict[str, Any] = {}
+            for key, result in zip(keys, results):  # noqa: B905
+                if isinstance(result, BaseException):
+                    error = error or result
+                    continue
+                self._endpoint_refresh_times[key] = now
+                if key in self.MERGED_ENDPOINTS:
+                    data.update(result or {})
+                if key in endpoints:
+                    data[key] = result or ([] if key in self.LIST_ENDPOINTS else {})
+            if data:
+                self.update_data(data)
+
+        if error is not None:
+            raise error
+
+    def _is_endpoint_due(self, key: str, now: float) -> bool:
+        """Whether the endpoint should be fetched when polling."""
+        if key not in self.COLD_ENDPOINTS:
+            return True
+        last_refresh = self._endpoint_refresh_times.get(key)
+        return last_refresh is None or now - last_refresh >= COLD_REFRESH_INTERVAL_SECONDS
+
+    async def _fetch_feeding_plan_list(self, serial: str) -> list:
+        """Fetch the feeding plans, they're only available while the feeding plan is enabled."""
+        if not self._data.get("enableFeedingPlan"):
+            return []
+        return await self.api.device_feeding_plan_list(serial)
             
     # def update_data(self, data: dict) -> None:
     #     """Save the device info from a data dictionary."""
@@ -22,9 +22,8 @@ class Feeder(Device):
     """Generic PETLIBRO feeder device"""
 
     async def refresh(self):
-        await super().refresh()
-        self.update_data({
-            "feedingPlanTodayNew": await self.api.device_feeding_plan_today_new(self.serial)
+        await self._refresh_endpoints({
+            "feedingPlanTodayNew": self.api.device_feeding_plan_today_new
         })
 
     @property
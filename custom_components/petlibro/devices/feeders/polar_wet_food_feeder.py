@@ -15,24 +15,14 @@ class PolarWetFoodFeeder(Device):
     async def refresh(self):
         """Refresh the device data from the API."""
         try:
-            await super().refresh()  # This calls the refresh method in GranaryFeeder (which also inherits from Device)
-    
-            # Fetch specific data for this device
-            grain_status = await self.api.device_grain_status(self.serial)
-            real_info = await self.api.device_real_info(self.serial)
-            attribute_settings = await self.api.device_attribute_settings(self.serial)
-            get_upgrade = await self.api.get_device_upgrade(self.serial)
-            wet_feeding_plan = await self.api.device_wet_feeding_plan(self.serial)
-            get_feeding_plan_today = await self.api.device_feeding_plan_today_new(self.serial)
-    
-            # Update internal data with fetched API data
-            self.update_data({
-                "grainStatus": grain_status or {},
-                "realInfo": real_info or {},
-                "getAttributeSetting": attribute_settings or {},
-                "getUpgrade": get_upgrade or {},
-                "wetFeedingPlan": wet_feeding_plan or {},
-                "getfeedingplantoday": get_feeding_plan_today or {}
+            # Fetches the due endpoints concurrently, along with the base device info
+            await self._refresh_endpoints({
+                "grainStatus": self.api.device_grain_status,
+                "realInfo": self.api.device_real_info,
+                "getAttributeSetting": self.api.device_attribute_settings,
+                "getUpgrade": self.api.get_device_upgrade,
+                "wetFeedingPlan": self.api.device_wet_feeding_plan,
+                "getfeedingplantoday": self.api.device_feeding_plan_today_new,
             })
         except PetLibroAPIError as err:
             _LOGGER.error(f"Error refreshing data for PolarWetFoodFeeder: {err}")
@@ -20,29 +20,16 @@ class SpaceSmartFeeder(Device):  # Inherit directly from Device
     async def refresh(self):
         """Refresh the device data from the API."""
         try:
-            await super().refresh()  # Call the refresh method from Device
-    
-            # Fetch specific data for this device
-            grain_status = await self.api.device_grain_status(self.serial)
-            real_info = await self.api.device_real_info(self.serial)
-            attribute_settings = await self.api.device_attribute_settings(self.serial)
-            get_upgrade = await self.api.get_device_upgrade(self.serial)
-            get_feeding_plan_today = await self.api.device_feeding_plan_today_new(self.serial)
-            get_work_record = await self.api.get_device_work_record(self.serial)
-            get_device_events = await self.api.device_events(self.serial)
-            feeding_plan_list = (await self.api.device_feeding_plan_list(self.serial)
-                if self._data.get("enableFeedingPlan") else [])
-    
-            # Update internal data with fetched API data
-            self.update_data({
-                "grainStatus": grain_status or {},
-                "realInfo": real_info or {},
-                "getAttributeSetting": attribute_settings or {},
-                "getfeedingplantoday": get_feeding_plan_today or {},
-                "feedingPlan": feeding_plan_list or [],
-                "getDeviceEvents": get_device_events or {},
-                "getUpgrade": get_upgrade or {},
-                "workRecord": get_work_record if get_work_record is not None else []
+            # Fetches the due endpoints concurrently, along with the base device info
+            await self._refresh_endpoints({
+                "grainStatus": self.api.device_grain_status,
+                "realInfo": self.api.device_real_info,
+                "getAttributeSetting": self.api.device_attribute_settings,
+                "getfeedingplantoday": self.api.device_feeding_plan_today_new,
+                "feedingPlan": self._fetch_feeding_plan_list,
+                "getDeviceEvents": self.api.device_events,
+                "getUpgrade": self.api.get_device_upgrade,
+                "workRecord": self.api.get_device_work_record,
             })
         except PetLibroAPIError as err:
             _LOGGER.error(f"Error refreshing data for SpaceSmartFeeder: {err}")
@@ -15,26 +15,15 @@ class Dockstream2SmartCordlessFountain(Device):
     async def refresh(self):
         """Refresh the device data from the API."""
         try:
-            await super().refresh()  # Call the refresh method from the parent class (Device)
-        
-            # Fetch real info from the API
-            real_info = await self.api.device_real_info(self.serial)
-            data_real_info = await self.api.device_data_real_info(self.serial)
-            attribute_settings = await self.api.device_attribute_settings(self.serial)
-            get_upgrade = await self.api.get_device_upgrade(self.serial)
-            get_work_record = await self.api.get_device_work_record(self.serial)
-            get_feeding_plan_today = await self.api.device_feeding_plan_today_new(self.serial)
-            get_drink_water = await self.api.get_device_drink_water(self.serial)
-
-            # Update internal data with fetched API data
-            self.update_data({
-                "realInfo": real_info or {},
-                "dataRealInfo": data_real_info or {},
-                "getDrinkWater": get_drink_water or {},
-                "getAttributeSetting": attribute_settings or {},
-                "getUpgrade": get_upgrade or {},
-                "getfeedingplantoday": get_feeding_plan_today or {},
-                "workRecord": get_work_record if get_work_record is not None else []
+            # Fetches the due endpoints concurrently, along with the base device info
+            await self._refresh_endpoints({
+                "realInfo": self.api.device_real_info,
+                "dataRealInfo": self.api.device_data_real_info,
+                "getDrinkWater": self.api.get_device_drink_water,
+                "getAttributeSetting": self.api.device_attribute_settings,
+                "getUpgrade": self.api.get_device_upgrade,
+                "getfeedingplantoday": self.api.device_feeding_plan_today_new,
+                "workRecord": self.api.get_device_work_record,
             })
 
         except PetLibroAPIError as err:
@@ -236,9 +236,11 @@ class PetLibroHub:
 
         try:
             _LOGGER.debug("Refreshing %s: %s", obj_type_str, identifier)
-            await obj.refresh()
             if is_member:
+                await obj.refresh()
                 self.member.force_refresh = False
+            else:
+                await obj.poll()
             self.last_refresh_times[identifier] = now
             _LOGGER.debug("Refresh complete for %s: %s", obj_type_str, identifier)
         except Exception:
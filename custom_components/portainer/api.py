@@ -3,11 +3,14 @@ from logging import getLogger
 from threading import Lock
 from typing import Any
 
-from requests import get as requests_get, post as requests_post
+from requests import Session
+from requests.adapters import HTTPAdapter
 from voluptuous import Optional
 
 from homeassistant.core import HomeAssistant
 
+from .const import DEFAULT_MAX_CONCURRENT_QUERIES
+
 _LOGGER = getLogger(__name__)
 
 
@@ -24,6 +27,7 @@ class PortainerAPI(object):
         api_key: str,
         use_ssl: bool = False,
         verify_ssl: bool = True,
+        max_connections: int = DEFAULT_MAX_CONCURRENT_QUERIES,
     ) -> None:
         """Initialize the Portainer API."""
         self._hass = hass
@@ -36,10 +40,29 @@ class PortainerAPI(object):
             self._ssl_verify = True
         self._url = f"{self._protocol}://{self._host}/api/"
 
+        # Keep-alive session, pool sized for concurrent endpoint queries
+        self._session = Session()
+        self._session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "X-API-Key": f"{self._api_key}",
+            }
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         self.lock = Lock()
         self._connected = False
         self._error = ""
 
+    # ---------------------------
+    #   close
+    # ---------------------------
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+
     # ---------------------------
     #   connected
     # ---------------------------
@@ -62,9 +85,13 @@ class PortainerAPI(object):
     def query(
         self, service: str, method: str = "get", params: dict[str, Any] | None = {}
     ) -> Optional(list):
-        """Retrieve data from Portainer."""
-        self.lock.acquire()
+        """Retrieve data from Portainer.
+
+        Safe to call from several executor threads at once, the lock only
+        guards the connection state.
+        """
         error = False
+        response = None
         try:
             _LOGGER.debug(
                 "Portainer %s query: %s, %s, %s",
@@ -74,23 +101,17 @@ class PortainerAPI(object):
                 params,
             )
 
-            headers = {
-                "Content-Type": "application/json",
-                "X-API-Key": f"{self._api_key}",
-            }
             if method == "get":
-                response = requests_get(
+                response = self._session.get(
                     f"{self._url}{service}",
-                    headers=headers,
                     params=params,
                     verify=self._ssl_verify,
                     timeout=10,
                 )
 
             elif method == "post":
-                response = requests_post(
+                response = self._session.post(
                     f"{self._url}{service}",
-                    headers=headers,
                     json=params,
                     verify=self._ssl_verify,
                     timeout=10,
@@ -117,16 +138,16 @@ class PortainerAPI(object):
                 errorcode,
             )
 
-            if errorcode != 500 and service != "reporting/get_data":
-                self._connected = False
+            with self.lock:
+                if errorcode != 500 and service != "reporting/get_data":
+                    self._connected = False
 
-            self._error = errorcode
-            self.lock.release()
+                self._error = errorcode
             return None
 
-        self._connected = True
-        self._error = ""
-        self.lock.release()
+        with self.lock:
+            self._connected = True
+            self._error = ""
 
         return data
 
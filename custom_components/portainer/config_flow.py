@@ -18,8 +18,10 @@ from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
+    CONF_MAX_CONCURRENT_QUERIES,
     DEFAULT_DEVICE_NAME,
     DEFAULT_HOST,
+    DEFAULT_MAX_CONCURRENT_QUERIES,
     DEFAULT_SSL,
     DEFAULT_SSL_VERIFY,
     DOMAIN,
@@ -78,6 +80,7 @@ class PortainerConfigFlow(ConfigFlow, domain=DOMAIN):
             conn, errorcode = await self.hass.async_add_executor_job(
                 api.connection_test
             )
+            await self.hass.async_add_executor_job(api.close)
             if not conn:
                 errors[CONF_HOST] = errorcode
                 _LOGGER.error("Portainer connection error (%s)", errorcode)
@@ -97,6 +100,7 @@ class PortainerConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_API_KEY: "",
                 CONF_SSL: DEFAULT_SSL,
                 CONF_VERIFY_SSL: DEFAULT_SSL_VERIFY,
+                CONF_MAX_CONCURRENT_QUERIES: DEFAULT_MAX_CONCURRENT_QUERIES,
             },
             errors=errors,
         )
@@ -116,6 +120,12 @@ class PortainerConfigFlow(ConfigFlow, domain=DOMAIN):
                     vol.Optional(
                         CONF_VERIFY_SSL, default=user_input[CONF_VERIFY_SSL]
                     ): bool,
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_QUERIES,
+                        default=user_input.get(
+                            CONF_MAX_CONCURRENT_QUERIES, DEFAULT_MAX_CONCURRENT_QUERIES
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
                 }
             ),
             errors=errors,
@@ -11,6 +11,9 @@ ATTRIBUTION = "Data provided by Portainer integration"
 
 SCAN_INTERVAL = 30
 
+CONF_MAX_CONCURRENT_QUERIES = "max_concurrent_queries"
+DEFAULT_MAX_CONCURRENT_QUERIES = 4
+
 DEFAULT_HOST = "10.0.0.1"
 
 DEFAULT_DEVICE_NAME = "Portainer"
@@ -1,7 +1,12 @@
 """Portainer coordinator."""
 from __future__ import annotations
 
-from asyncio import Lock as Asyncio_lock, wait_for as asyncio_wait_for
+from asyncio import (
+    Lock as Asyncio_lock,
+    Semaphore as Asyncio_semaphore,
+    gather as asyncio_gather,
+    wait_for as asyncio_wait_for,
+)
 from datetime import timedelta
 from logging import getLogger
 
@@ -17,12 +22,45 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, SCAN_INTERVAL
+from .const import (
+    CONF_MAX_CONCURRENT_QUERIES,
+    DEFAULT_MAX_CONCURRENT_QUERIES,
+    DOMAIN,
+    SCAN_INTERVAL,
+)
 from .apiparser import parse_api
 from .api import PortainerAPI
 
 _LOGGER = getLogger(__name__)
 
+CONTAINER_VALS = [
+    {"name": "Id", "default": "unknown"},
+    {"name": "Names", "default": "unknown"},
+    {"name": "Image", "default": "unknown"},
+    {"name": "State", "default": "unknown"},
+    {"name": "Ports", "default": "unknown"},
+    {
+        "name": "Network",
+        "source": "HostConfig/NetworkMode",
+        "default": "unknown",
+    },
+    {
+        "name": "Compose_Stack",
+        "source": "Labels/com.docker.compose.project",
+        "default": "",
+    },
+    {
+        "name": "Compose_Service",
+        "source": "Labels/com.docker.compose.service",
+        "default": "",
+    },
+    {
+        "name": "Compose_Version",
+        "source": "Labels/com.docker.compose.version",
+        "default": "",
+    },
+]
+
 
 # ---------------------------
 #   PortainerControllerData
@@ -46,12 +84,18 @@ class PortainerCoordinator(DataUpdateCoordinator):
 
         self.lock = Asyncio_lock()
 
+        max_queries = config_entry.data.get(
+            CONF_MAX_CONCURRENT_QUERIES, DEFAULT_MAX_CONCURRENT_QUERIES
+        )
+        self._query_semaphore = Asyncio_semaphore(max_queries)
+
         self.api = PortainerAPI(
             hass,
             config_entry.data[CONF_HOST],
             config_entry.data[CONF_API_KEY],
             config_entry.data[CONF_SSL],
             config_entry.data[CONF_VERIFY_SSL],
+            max_queries,
         )
 
         self._systemstats_errored = []
@@ -76,7 +120,7 @@ class PortainerCoordinator(DataUpdateCoordinator):
 
         try:
             await self.hass.async_add_executor_job(self.get_endpoints)
-            await self.hass.async_add_executor_job(self.get_containers)
+            await self.async_get_containers()
         except Exception as error:
             self.lock.release()
             raise UpdateFailed(error) from error
@@ -128,53 +172,47 @@ class PortainerCoordinator(DataUpdateCoordinator):
         del self.data["endpoints"][uid]["Snapshots"]
 
     # ---------------------------
-    #   get_containers
+    #   async_get_containers
     # ---------------------------
-    def get_containers(self) -> None:
-        self.data["containers"] = {}
-        for eid in self.data["endpoints"]:
-            self.data["containers"] = parse_api(
-                data=self.data["containers"],
-                source=self.api.query(
-                    f"endpoints/{eid}/docker/containers/json", "get", {"all": True}
-                ),
+    async def async_get_containers(self) -> None:
+        """Get containers of all endpoints, querying endpoints concurrently."""
+
+        async def async_query(eid):
+            async with self._query_semaphore:
+                return await self.hass.async_add_executor_job(
+                    self.api.query,
+                    f"endpoints/{eid}/docker/containers/json",
+                    "get",
+                    {"all": True},
+                )
+
+        endpoints = list(self.data["endpoints"])
+        sources = await asyncio_gather(*(async_query(eid) for eid in endpoints))
+        self.data["containers"] = await self.hass.async_add_executor_job(
+            self.parse_containers, dict(zip(endpoints, sources))
+        )
+
+    # ---------------------------
+    #   parse_containers
+    # ---------------------------
+    def parse_containers(self, sources: dict) -> dict:
+        """Parse container lists of all endpoints into one container table."""
+        containers = {}
+        for eid, source in sources.items():
+            endpoint_containers = parse_api(
+                data={},
+                source=source,
                 key="Id",
-                vals=[
-                    {"name": "Id", "default": "unknown"},
-                    {"name": "Names", "default": "unknown"},
-                    {"name": "Image", "default": "unknown"},
-                    {"name": "State", "default": "unknown"},
-                    {"name": "Ports", "default": "unknown"},
-                    {
-                        "name": "Network",
-                        "source": "HostConfig/NetworkMode",
-                        "default": "unknown",
-                    },
-                    {
-                        "name": "Compose_Stack",
-                        "source": "Labels/com.docker.compose.project",
-                        "default": "",
-                    },
-                    {
-                        "name": "Compose_Service",
-                        "source": "Labels/com.docker.compose.service",
-                        "default": "",
-                    },
-                    {
-                        "name": "Compose_Version",
-                        "source": "Labels/com.docker.compose.version",
-                        "default": "",
-                    },
-                ],
+                vals=CONTAINER_VALS,
                 ensure_vals=[
                     {"name": "Name", "default": "unknown"},
                     {"name": "EndpointId", "default": eid},
                 ],
             )
-            for cid in self.data["containers"]:
-                self.data["containers"][cid]["Environment"] = self.data["endpoints"][
-                    eid
-                ]["Name"]
-                self.data["containers"][cid]["Name"] = self.data["containers"][cid][
-                    "Names"
-                ][0][1:]
+            for container in endpoint_containers.values():
+                container["Environment"] = self.data["endpoints"][eid]["Name"]
+                container["Name"] = container["Names"][0][1:]
+
+            containers.update(endpoint_containers)
+
+        return containers
@@ -4,6 +4,7 @@ from datetime import timedelta
 from dataclasses import dataclass
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers import entity_registry as er
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -183,6 +184,7 @@ async def add_event_handlers(hass: HomeAssistant):
         if service in hass.data[DOMAIN].get(HASS_DATA_PARSED_SERVICE_LIST, []):
             _LOGGER.debug("Monitored service changed: %s", service)
             coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
+            coordinator.async_action_changed(service)
             await coordinator.async_refresh()
 
     async def async_on_state_changed(event):
@@ -202,8 +204,27 @@ async def add_event_handlers(hass: HomeAssistant):
             if new_state in checked_states or old_state in checked_states:
                 _LOGGER.debug("Monitored entity changed: %s", event.data["entity_id"])
                 coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
+                coordinator.async_entity_changed(event.data["entity_id"])
                 await coordinator.async_refresh()
 
+    async def async_on_entity_registry_updated(event):
+        """Refresh monitored entities when they are enabled, disabled or renamed."""
+        parsed_entity_list = hass.data[DOMAIN].get(HASS_DATA_PARSED_ENTITY_LIST, [])
+        changed = [
+            entity_id
+            for entity_id in (
+                event.data.get("entity_id"),
+                event.data.get("old_entity_id"),
+            )
+            if entity_id in parsed_entity_list
+        ]
+        if changed:
+            _LOGGER.debug("Monitored entity registry entry changed: %s", changed)
+            coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
+            for entity_id in changed:
+                coordinator.async_entity_changed(entity_id)
+            await coordinator.async_refresh()
+
     # hass is not started yet, schedule config parsing once it loaded
     if not hass.is_running:
         hass.bus.async_listen_once(
@@ -226,6 +247,11 @@ async def add_event_handlers(hass: HomeAssistant):
     )
     hdlr.append(hass.bus.async_listen(EVENT_SERVICE_REMOVED, async_on_service_changed))
     hdlr.append(hass.bus.async_listen(EVENT_STATE_CHANGED, async_on_state_changed))
+    hdlr.append(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, async_on_entity_registry_updated
+        )
+    )
     hass.data[DOMAIN][HASS_DATA_CANCEL_HANDLERS] = hdlr
 
 
@@ -16,11 +16,16 @@ DEFAULT_CHUNK_SIZE = 3500
 PACKAGE_NAME = "custom_components.watchman"
 REPORT_SERVICE_NAME = "report"
 
+PARSE_CACHE_STORAGE_KEY = f"{DOMAIN}.parse_cache"
+PARSE_CACHE_STORAGE_VERSION = 1
+
 HASS_DATA_PARSED_ENTITY_LIST = "entity_list"
 HASS_DATA_PARSED_SERVICE_LIST = "service_list"
 HASS_DATA_FILES_PARSED = "files_parsed"
+HASS_DATA_FILES_CACHED = "files_cached"
 HASS_DATA_FILES_IGNORED = "files_ignored"
 HASS_DATA_PARSE_DURATION = "parse_duration"
+HASS_DATA_PARSE_CACHE = "parse_cache"
 HASS_DATA_CANCEL_HANDLERS = "cancel_handlers"
 HASS_DATA_COORDINATOR = "coordinator"
 HASS_DATA_MISSING_ENTITIES = "entities_missing"
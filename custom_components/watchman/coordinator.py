@@ -10,6 +10,7 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from .utils.report import fill
 from .utils.parser import parse_config
 from .const import (
+    CONF_IGNORED_STATES,
     COORD_DATA_ENTITY_ATTRS,
     COORD_DATA_LAST_UPDATE,
     COORD_DATA_MISSING_ENTITIES,
@@ -25,8 +26,12 @@ from .const import (
 from .utils.utils import (
     renew_missing_entities_list,
     renew_missing_actions_list,
+    check_entity,
+    get_config,
     get_entity_state,
     get_entry,
+    get_ignored_states,
+    is_action,
 )
 from .utils.logger import _LOGGER
 
@@ -53,6 +58,15 @@ class WatchmanCoordinator(DataUpdateCoordinator):
             COORD_DATA_SERVICE_ATTRS: "",
             COORD_DATA_ENTITY_ATTRS: "",
         }
+        # entities and actions which changed since the last check
+        self._changed_entities = set()
+        self._changed_actions = set()
+        # parsed lists the missing sets were built from
+        self._checked_entity_list = None
+        self._checked_service_list = None
+        # sensor attributes of missing entities/actions keyed by id
+        self._entity_attrs = {}
+        self._service_attrs = {}
 
     async def _async_setup(self) -> None:
         """Do initialization logic."""
@@ -66,6 +80,98 @@ class WatchmanCoordinator(DataUpdateCoordinator):
             # first run, home assistant still loading
             # parse_config will be scheduled once HA is fully loaded
 
+    def async_entity_changed(self, entity_id: str) -> None:
+        """Mark monitored entity for recheck on the next update."""
+        self._changed_entities.add(entity_id)
+
+    def async_action_changed(self, action: str) -> None:
+        """Mark monitored action for recheck on the next update."""
+        self._changed_actions.add(action)
+
+    def _is_full_check_required(self) -> bool:
+        """Return True if missing sets should be rebuilt from scratch.
+
+        This is the case on the first check and after configuration files were
+        parsed again, as parse_config replaces parsed lists with new objects.
+        """
+        return (
+            self._checked_entity_list
+            is not self.hass.data[DOMAIN].get(HASS_DATA_PARSED_ENTITY_LIST)
+            or self._checked_service_list
+            is not self.hass.data[DOMAIN].get(HASS_DATA_PARSED_SERVICE_LIST)
+        )
+
+    def _full_check(self) -> None:
+        """Check every parsed entity and action."""
+        self._changed_entities.clear()
+        self._changed_actions.clear()
+        services_missing = renew_missing_actions_list(self.hass)
+        entities_missing = renew_missing_entities_list(self.hass)
+        self.hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES] = entities_missing
+        self.hass.data[DOMAIN][HASS_DATA_MISSING_SERVICES] = services_missing
+        self._checked_entity_list = self.hass.data[DOMAIN][
+            HASS_DATA_PARSED_ENTITY_LIST
+        ]
+        self._checked_service_list = self.hass.data[DOMAIN][
+            HASS_DATA_PARSED_SERVICE_LIST
+        ]
+        self._entity_attrs = {
+            entity: self._build_entity_attrs(entity) for entity in entities_missing
+        }
+        self._service_attrs = {
+            service: self._build_service_attrs(service)
+            for service in services_missing
+        }
+
+    def _incremental_check(self) -> None:
+        """Check only entities and actions which changed since the last update."""
+        _LOGGER.debug(
+            f"::coordinator:: Check {len(self._changed_entities)} changed entities "
+            f"and {len(self._changed_actions)} changed actions"
+        )
+        entities_missing = self.hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]
+        services_missing = self.hass.data[DOMAIN][HASS_DATA_MISSING_SERVICES]
+        parsed_entity_list = self._checked_entity_list
+        parsed_service_list = self._checked_service_list
+
+        changed_entities, self._changed_entities = self._changed_entities, set()
+        ignored_states = get_ignored_states(self.hass) if changed_entities else []
+        for entity in changed_entities:
+            entities_missing.pop(entity, None)
+            self._entity_attrs.pop(entity, None)
+            if entity in parsed_entity_list and check_entity(
+                self.hass, entity, ignored_states
+            ):
+                entities_missing[entity] = parsed_entity_list[entity]
+                self._entity_attrs[entity] = self._build_entity_attrs(entity)
+
+        changed_actions, self._changed_actions = self._changed_actions, set()
+        if "missing" in get_config(self.hass, CONF_IGNORED_STATES, []):
+            changed_actions = set()
+        for service in changed_actions:
+            services_missing.pop(service, None)
+            self._service_attrs.pop(service, None)
+            if service in parsed_service_list and not is_action(self.hass, service):
+                services_missing[service] = parsed_service_list[service]
+                self._service_attrs[service] = self._build_service_attrs(service)
+
+    def _build_entity_attrs(self, entity: str) -> dict[str, Any]:
+        """Build attributes of missing entity for missing_entities sensor."""
+        state, name = get_entity_state(self.hass, entity, friendly_names=True)
+        return {
+            "id": entity,
+            "state": state,
+            "friendly_name": name or "",
+            "occurrences": fill(self._checked_entity_list[entity], 0),
+        }
+
+    def _build_service_attrs(self, service: str) -> dict[str, Any]:
+        """Build attributes of missing action for missing_actions sensor."""
+        return {
+            "id": service,
+            "occurrences": fill(self._checked_service_list[service], 0),
+        }
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update Watchman sensors.
 
@@ -86,48 +192,21 @@ class WatchmanCoordinator(DataUpdateCoordinator):
                         )
                         entry.runtime_data.force_parsing = False
                     start_time = time.time()
-                    services_missing = renew_missing_actions_list(self.hass)
-                    entities_missing = renew_missing_entities_list(self.hass)
+                    if self._is_full_check_required():
+                        self._full_check()
+                    else:
+                        self._incremental_check()
                     self.hass.data[DOMAIN][HASS_DATA_CHECK_DURATION] = (
                         time.time() - start_time
                     )
-                    self.hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES] = (
-                        entities_missing
-                    )
-                    self.hass.data[DOMAIN][HASS_DATA_MISSING_SERVICES] = (
-                        services_missing
-                    )
-
-                    # build entity attributes map for missing_entities sensor
-                    entity_attrs = []
-                    parsed_entity_list = self.hass.data[DOMAIN][
-                        HASS_DATA_PARSED_ENTITY_LIST
+                    entities_missing = self.hass.data[DOMAIN][
+                        HASS_DATA_MISSING_ENTITIES
                     ]
-                    for entity in entities_missing:
-                        state, name = get_entity_state(
-                            self.hass, entity, friendly_names=True
-                        )
-                        entity_attrs.append(
-                            {
-                                "id": entity,
-                                "state": state,
-                                "friendly_name": name or "",
-                                "occurrences": fill(parsed_entity_list[entity], 0),
-                            }
-                        )
-
-                    # build service attributes map for missing_services sensor
-                    service_attrs = []
-                    parsed_service_list = self.hass.data[DOMAIN][
-                        HASS_DATA_PARSED_SERVICE_LIST
+                    services_missing = self.hass.data[DOMAIN][
+                        HASS_DATA_MISSING_SERVICES
                     ]
-                    for service in services_missing:
-                        service_attrs.append(
-                            {
-                                "id": service,
-                                "occurrences": fill(parsed_service_list[service], 0),
-                            }
-                        )
+                    entity_attrs = list(self._entity_attrs.values())
+                    service_attrs = list(self._service_attrs.values())
 
                     self.data = {
                         COORD_DATA_MISSING_ENTITIES: len(entities_missing),
@@ -7,6 +7,7 @@ import time
 import anyio
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
+from homeassistant.helpers.storage import Store
 
 from .logger import INDENT, _LOGGER
 from .utils import async_get_next_file, get_config
@@ -18,12 +19,17 @@ from ..const import (
     CONF_INCLUDED_FOLDERS,
     DEFAULT_HA_DOMAINS,
     DOMAIN,
+    HASS_DATA_FILES_CACHED,
     HASS_DATA_FILES_IGNORED,
     HASS_DATA_FILES_PARSED,
+    HASS_DATA_PARSE_CACHE,
     HASS_DATA_PARSE_DURATION,
     HASS_DATA_PARSED_ENTITY_LIST,
     HASS_DATA_PARSED_SERVICE_LIST,
     PARSER_STOP_WORDS,
+    PARSE_CACHE_STORAGE_KEY,
+    PARSE_CACHE_STORAGE_VERSION,
+    VERSION,
 )
 
 
@@ -38,27 +44,60 @@ async def parse_config(hass: HomeAssistant, reason=None):
         f"::parse_config:: called due to {reason} IGNORED_FILES={ignored_files}"
     )
 
-    parsed_entity_list, parsed_service_list, files_parsed, files_ignored = await parse(
-        hass, included_folders, ignored_files, hass.config.config_dir
+    store = Store(hass, PARSE_CACHE_STORAGE_VERSION, PARSE_CACHE_STORAGE_KEY)
+    if HASS_DATA_PARSE_CACHE not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][HASS_DATA_PARSE_CACHE] = await async_load_parse_cache(store)
+    cache = hass.data[DOMAIN][HASS_DATA_PARSE_CACHE]
+
+    (
+        parsed_entity_list,
+        parsed_service_list,
+        files_parsed,
+        files_cached,
+        files_ignored,
+    ) = await parse(
+        hass, included_folders, ignored_files, hass.config.config_dir, cache
     )
+    if files_parsed or cache.pop("dirty", False):
+        await store.async_save({"version": VERSION, "files": cache["files"]})
+
     hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST] = parsed_entity_list
     hass.data[DOMAIN][HASS_DATA_PARSED_SERVICE_LIST] = parsed_service_list
-    hass.data[DOMAIN][HASS_DATA_FILES_PARSED] = files_parsed
+    hass.data[DOMAIN][HASS_DATA_FILES_PARSED] = files_parsed + files_cached
+    hass.data[DOMAIN][HASS_DATA_FILES_CACHED] = files_cached
     hass.data[DOMAIN][HASS_DATA_FILES_IGNORED] = files_ignored
     hass.data[DOMAIN][HASS_DATA_PARSE_DURATION] = time.time() - start_time
     _LOGGER.debug(
-        f"{INDENT}Parsing took {hass.data[DOMAIN][HASS_DATA_PARSE_DURATION]:.2f}s."
+        f"{INDENT}Parsing took {hass.data[DOMAIN][HASS_DATA_PARSE_DURATION]:.2f}s., "
+        f"{files_parsed} files parsed, {files_cached} files taken from cache"
     )
 
 
+async def async_load_parse_cache(store):
+    """Load per-file parse results saved before the last restart.
+
+    Cache is discarded when watchman version changes, as parsing rules
+    could be different in the new version.
+    """
+    data = await store.async_load()
+    if not data or data.get("version") != VERSION:
+        return {"files": {}}
+    return {"files": data.get("files", {})}
+
+
 async def async_get_short_path(yaml_file, root):
     """Provide short path for unit test mocking."""
     return os.path.relpath(yaml_file, root)
 
 
-async def parse(hass, folders, ignored_files, root_path=None):
-    """Parse a yaml or json file for entities/services."""
+async def parse(hass, folders, ignored_files, root_path=None, cache=None):
+    """Parse a yaml or json file for entities/services.
+
+    Files with the same mtime and size as in the cache are not read again,
+    their entities and services are taken from the cache instead.
+    """
     parsed_files_count = 0
+    cached_files_count = 0
     entity_pattern = re.compile(
         r"(?:(?<=\s)|(?<=^)|(?<=\")|(?<=\'))([A-Za-z_0-9]*\s*:)?(?:\s*)?(?:states.)?"
         rf"(({"|".join([*Platform, *DEFAULT_HA_DOMAINS])})\.[A-Za-z_*0-9]+)"
@@ -69,6 +108,10 @@ async def parse(hass, folders, ignored_files, root_path=None):
     comment_pattern = re.compile(
         rf"(^\s*(?:{"|".join([*PARSER_STOP_WORDS])}):.*)|(\s*#.*)"
     )
+    if cache is None:
+        cache = {"files": {}}
+    cached_files = cache["files"]
+    seen_files = set()
     parsed_entity_list = {}
     parsed_service_list = {}
     parsed_files = []
@@ -80,26 +123,48 @@ async def parse(hass, folders, ignored_files, root_path=None):
             continue
 
         try:
-            lineno = 1
-            async with await anyio.open_file(
-                yaml_file, mode="r", encoding="utf-8"
-            ) as f:
-                async for line in f:
-                    line = re.sub(comment_pattern, "", line)
-                    for match in re.finditer(entity_pattern, line):
-                        typ, val = match.group(1), match.group(2)
-                        if (
-                            typ != "service:"
-                            and "*" not in val
-                            and not val.endswith(".yaml")
-                        ):
-                            add_entry(parsed_entity_list, val, short_path, lineno)
-                    for match in re.finditer(service_pattern, line):
-                        val = match.group(1)
-                        add_entry(parsed_service_list, val, short_path, lineno)
-                    lineno += 1
-            parsed_files_count += 1
-            parsed_files.append(short_path)
+            stat = await anyio.Path(yaml_file).stat()
+            seen_files.add(yaml_file)
+            cached = cached_files.get(yaml_file)
+            if (
+                cached
+                and cached["mtime"] == stat.st_mtime
+                and cached["size"] == stat.st_size
+            ):
+                cached_files_count += 1
+            else:
+                entities = []
+                services = []
+                lineno = 1
+                async with await anyio.open_file(
+                    yaml_file, mode="r", encoding="utf-8"
+                ) as f:
+                    async for line in f:
+                        line = re.sub(comment_pattern, "", line)
+                        for match in re.finditer(entity_pattern, line):
+                            typ, val = match.group(1), match.group(2)
+                            if (
+                                typ != "service:"
+                                and "*" not in val
+                                and not val.endswith(".yaml")
+                            ):
+                                entities.append([val, lineno])
+                        for match in re.finditer(service_pattern, line):
+                            services.append([match.group(1), lineno])
+                        lineno += 1
+                cached = {
+                    "mtime": stat.st_mtime,
+                    "size": stat.st_size,
+                    "entities": entities,
+                    "services": services,
+                }
+                cached_files[yaml_file] = cached
+                parsed_files_count += 1
+                parsed_files.append(short_path)
+            for val, lineno in cached["entities"]:
+                add_entry(parsed_entity_list, val, short_path, lineno)
+            for val, lineno in cached["services"]:
+                add_entry(parsed_service_list, val, short_path, lineno)
         except OSError as exception:
             _LOGGER.error("Unable to parse %s: %s", yaml_file, exception)
         except UnicodeDecodeError as exception:
@@ -108,6 +173,11 @@ async def parse(hass, folders, ignored_files, root_path=None):
                 yaml_file,
                 exception,
             )
+    # forget files which were removed or became ignored since the last run
+    for yaml_file in [f for f in cached_files if f not in seen_files]:
+        del cached_files[yaml_file]
+        cache["dirty"] = True
+
     # remove ignored entities and services from resulting lists
     ignored_items = get_config(hass, CONF_IGNORED_ITEMS, [])
     ignored_items = list(set(ignored_items + BUNDLED_IGNORED_ITEMS))
@@ -126,6 +196,7 @@ async def parse(hass, folders, ignored_files, root_path=None):
     }
 
     _LOGGER.debug(f"{INDENT}Parsed {parsed_files_count} files: {parsed_files}")
+    _LOGGER.debug(f"{INDENT}Took {cached_files_count} unchanged files from cache")
     _LOGGER.debug(
         f"{INDENT}Ignored {len(effectively_ignored_files)} files: {effectively_ignored_files}",
     )
@@ -137,6 +208,7 @@ async def parse(hass, folders, ignored_files, root_path=None):
         parsed_entity_list,
         parsed_service_list,
         parsed_files_count,
+        cached_files_count,
         len(effectively_ignored_files),
     )
 
@@ -19,6 +19,7 @@ from ..const import (
     CONF_HEADER,
     HASS_DATA_CHECK_DURATION,
     HASS_DATA_COORDINATOR,
+    HASS_DATA_FILES_CACHED,
     HASS_DATA_FILES_IGNORED,
     HASS_DATA_FILES_PARSED,
     HASS_DATA_MISSING_ENTITIES,
@@ -59,6 +60,7 @@ async def report(hass, render, chunk_size):
     entity_list = hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST]
     files_parsed = hass.data[DOMAIN][HASS_DATA_FILES_PARSED]
     files_ignored = hass.data[DOMAIN][HASS_DATA_FILES_IGNORED]
+    files_cached = hass.data[DOMAIN].get(HASS_DATA_FILES_CACHED, 0)
 
     rep = f"{header} \n"
     if services_missing:
@@ -93,8 +95,8 @@ async def report(hass, render, chunk_size):
 
     rep += f"\n-== Report created on {report_datetime}\n"
     rep += (
-        f"-== Parsed {files_parsed} files in {parse_duration:.2f}s., "
-        f"ignored {files_ignored} files \n"
+        f"-== Parsed {files_parsed} files ({files_cached} unchanged) in "
+        f"{parse_duration:.2f}s., ignored {files_ignored} files \n"
     )
     rep += f"-== Generated in: {render_duration:.2f}s. Validated in: {check_duration:.2f}s."
     report_chunks = []
@@ -177,30 +177,42 @@ def renew_missing_actions_list(hass):
     return services_missing
 
 
+def get_ignored_states(hass):
+    """Return list of states which should not be reported."""
+    return [
+        "unavail" if s == "unavailable" else s
+        for s in get_config(hass, CONF_IGNORED_STATES, [])
+    ]
+
+
+def check_entity(hass, entry, ignored_states):
+    """Return entity state if it should be reported as missing, None otherwise."""
+    if is_action(hass, entry):  # this is a service, not entity
+        _LOGGER.debug(f"{INDENT}entry {entry} is service, skipping")
+        return None
+    state, _ = get_entity_state(hass, entry)
+    if state in ignored_states:
+        _LOGGER.debug(
+            f"{INDENT}entry {entry} with state {state} skipped due to ignored_states"
+        )
+        return None
+    if state in ["missing", "unknown", "unavail", "disabled"]:
+        return state
+    return None
+
+
 def renew_missing_entities_list(hass):
     """Update list of missing entities when a service from a config file changed its state."""
     _LOGGER.debug("::check_entities:: Triaging list of found entities")
 
-    ignored_states = [
-        "unavail" if s == "unavailable" else s
-        for s in get_config(hass, CONF_IGNORED_STATES, [])
-    ]
+    ignored_states = get_ignored_states(hass)
     if DOMAIN not in hass.data or HASS_DATA_PARSED_ENTITY_LIST not in hass.data[DOMAIN]:
         _LOGGER.error(f"{INDENT}Entity list not found")
         raise Exception("Entity list not found")
     parsed_entity_list = hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST]
     entities_missing = {}
     for entry, occurrences in parsed_entity_list.items():
-        if is_action(hass, entry):  # this is a service, not entity
-            _LOGGER.debug(f"{INDENT}entry {entry} is service, skipping")
-            continue
-        state, _ = get_entity_state(hass, entry)
-        if state in ignored_states:
-            _LOGGER.debug(
-                f"{INDENT}entry {entry} with state {state} skipped due to ignored_states"
-            )
-            continue
-        if state in ["missing", "unknown", "unavail", "disabled"]:
+        if check_entity(hass, entry, ignored_states):
             entities_missing[entry] = occurrences
             _LOGGER.debug(f"{INDENT}entry {entry} added to the report")
     return entities_missing
@@ -38,6 +38,11 @@ class XTEntityDescriptorManager:
 
     entity_type = (type(EntityDescription(key="")), EntityDescription)
 
+    # Compiled (include, exclude) descriptors per platform, along with the
+    # descriptor sources they were compiled from
+    _compiled_descriptors: dict[tuple, tuple[list[Any], tuple[Any, Any]]] = {}
+    _category_keys: dict[int, tuple[Any, list[str]]] = {}
+
     @staticmethod
     def get_platform_descriptors(
         platform_descriptors: Any,
@@ -46,27 +51,45 @@ class XTEntityDescriptorManager:
         platform: Platform | None,
         key_fields: list[str | tuple[str, ...]] = ["key"],
     ) -> tuple[Any, Any]:
+        if platform is None:
+            return platform_descriptors, XTEntityDescriptorManager.get_empty_descriptor(
+                platform_descriptors
+            )
+        descriptors_to_merge = multi_manager.get_platform_descriptors_to_merge(platform)
+        descriptors_to_exclude = multi_manager.get_platform_descriptors_to_exclude(
+            platform
+        )
+        sources = [platform_descriptors, *descriptors_to_merge, None, *descriptors_to_exclude]
+        cache_key = (platform, descriptor_type, tuple(key_fields))
+        if compiled := XTEntityDescriptorManager._compiled_descriptors.get(cache_key):
+            compiled_sources, descriptors = compiled
+            if len(compiled_sources) == len(sources) and all(
+                compiled_source is source
+                for compiled_source, source in zip(compiled_sources, sources)
+            ):
+                return descriptors
+
         include_descriptors = platform_descriptors
         exclude_descriptors = XTEntityDescriptorManager.get_empty_descriptor(
             platform_descriptors
         )
-        if platform is not None:
-            for descriptors_to_add in multi_manager.get_platform_descriptors_to_merge(
-                platform
-            ):
-                include_descriptors = XTEntityDescriptorManager.merge_descriptors(
-                    include_descriptors, descriptors_to_add, key_fields, descriptor_type
-                )
-            for (
-                descriptors_to_exclude
-            ) in multi_manager.get_platform_descriptors_to_exclude(platform):
-                exclude_descriptors = XTEntityDescriptorManager.merge_descriptors(
-                    exclude_descriptors,
-                    descriptors_to_exclude,
-                    key_fields,
-                    descriptor_type,
-                )
-        return include_descriptors, exclude_descriptors
+        for descriptors_to_add in descriptors_to_merge:
+            include_descriptors = XTEntityDescriptorManager.merge_descriptors(
+                include_descriptors, descriptors_to_add, key_fields, descriptor_type
+            )
+        for descriptor_to_exclude in descriptors_to_exclude:
+            exclude_descriptors = XTEntityDescriptorManager.merge_descriptors(
+                exclude_descriptors,
+                descriptor_to_exclude,
+                key_fields,
+                descriptor_type,
+            )
+        descriptors = (include_descriptors, exclude_descriptors)
+        XTEntityDescriptorManager._compiled_descriptors[cache_key] = (
+            sources,
+            descriptors,
+        )
+        return descriptors
 
     @staticmethod
     def get_category_descriptors(descriptor_dict: dict[str, Any], category: str) -> Any:
@@ -85,6 +108,29 @@ class XTEntityDescriptorManager:
         return_list: list[str] = []
         if not category_content:
             return return_list
+        # Compiled categories are immutable tuples, their keys can be reused
+        memoize = isinstance(category_content, tuple) and key_fields == ["key"]
+        if memoize:
+            if cached := XTEntityDescriptorManager._category_keys.get(
+                id(category_content)
+            ):
+                if cached[0] is category_content:
+                    return cached[1]
+        return_list = XTEntityDescriptorManager._compute_category_keys(
+            category_content, key_fields
+        )
+        if memoize:
+            XTEntityDescriptorManager._category_keys[id(category_content)] = (
+                category_content,
+                return_list,
+            )
+        return return_list
+
+    @staticmethod
+    def _compute_category_keys(
+        category_content: Any, key_fields: list[str | tuple[str, ...]]
+    ) -> list[str]:
+        return_list: list[str] = []
         ref_type = XTEntityDescriptorManager._get_param_type(category_content)
         if (
             ref_type is XTEntityDescriptorManager.XTEntityDescriptorType.LIST
@@ -262,7 +308,7 @@ class XTEntityDescriptorManager:
             case XTEntityDescriptorManager.XTEntityDescriptorType.LIST:
                 return_list: list = []
                 var_type = XTEntityDescriptorManager.XTEntityDescriptorType.UNKNOWN
-                added_compound_keys: list[str] = []
+                added_compound_keys: set[str] = set()
                 if descriptors_to_add:
                     var_type = XTEntityDescriptorManager._get_param_type(
                         descriptors_to_add[0]
@@ -283,10 +329,10 @@ class XTEntityDescriptorManager:
                                 continue
                             if compound_key not in base_descr_keys:
                                 return_list.append(entity_to_add)
-                                added_compound_keys.append(compound_key)
+                                added_compound_keys.add(compound_key)
                             else:
                                 if base_entity := base_descr_keys[compound_key]:
-                                    added_compound_keys.append(compound_key)
+                                    added_compound_keys.add(compound_key)
                                     return_list.append(
                                         XTEntityDescriptorManager.merge_descriptor(
                                             base_entity, entity_to_add, entity_type
@@ -329,11 +375,15 @@ class XTEntityDescriptorManager:
     ) -> EntityDescription:
         if real_type is None:
             return base
-        base_dict = base.__dict__
-        if (
+        take_translation = (
             other.translation_placeholders is not None
             and base.translation_placeholders is None
-        ):
+        )
+        if type(base) is real_type and not take_translation:
+            # Descriptions are frozen, the base can be shared as is
+            return base
+        base_dict = dict(base.__dict__)
+        if take_translation:
             base_dict["translation_key"] = other.translation_key
             base_dict["translation_placeholders"] = other.translation_placeholders
         return real_type(**base_dict)
@@ -366,7 +416,7 @@ class XTEntityDescriptorManager:
                 return return_dict
             case XTEntityDescriptorManager.XTEntityDescriptorType.LIST:
                 return_list: list = []
-                exclude_keys: list[str] = []
+                exclude_keys: set[str] = set()
                 var_type = XTEntityDescriptorManager.XTEntityDescriptorType.UNKNOWN
                 if base_descriptors:
                     var_type = XTEntityDescriptorManager._get_param_type(
@@ -376,9 +426,9 @@ class XTEntityDescriptorManager:
                     match var_type:
                         case XTEntityDescriptorManager.XTEntityDescriptorType.ENTITY:
                             entity = cast(EntityDescription, descriptor)
-                            exclude_keys.append(entity.key)
+                            exclude_keys.add(entity.key)
                         case XTEntityDescriptorManager.XTEntityDescriptorType.STRING:
-                            exclude_keys.append(descriptor)
+                            exclude_keys.add(descriptor)
                 for descriptor in base_descriptors:
                     match var_type:
                         case XTEntityDescriptorManager.XTEntityDescriptorType.ENTITY:
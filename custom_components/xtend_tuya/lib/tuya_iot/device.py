@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import json
+import os
+import threading
 import time
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from typing import Any, Literal, Optional
 
@@ -22,6 +26,10 @@ BIZCODE_DPNAME_UPDATE = "dpNameUpdate"
 BIZCODE_BIND_USER = "bindUser"
 BIZCODE_DELETE = "delete"
 
+SPECIFICATION_CACHE_VERSION = 1
+SPECIFICATION_CACHE_TTL = 7 * 24 * 60 * 60
+SPECIFICATION_FETCH_WORKERS = 8
+
 
 class TuyaDeviceFunction(SimpleNamespace):
     """Tuya device's function.
@@ -140,6 +148,82 @@ class TuyaDeviceListener(metaclass=ABCMeta):
         pass
 
 
+class TuyaDeviceSpecificationCache:
+    """Cache of device specifications, shared by devices of the same product.
+
+    Entries are keyed by category and product id and are revalidated once
+    they are older than the ttl. When a path is given the cache is persisted
+    to disk so that restarts don't need to fetch every specification again.
+    """
+
+    def __init__(
+        self, path: str | None = None, ttl: int = SPECIFICATION_CACHE_TTL
+    ) -> None:
+        """Init TuyaDeviceSpecificationCache."""
+        self.path = path
+        self.ttl = ttl
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    @staticmethod
+    def get_key(device: TuyaDevice) -> str | None:
+        """Return the cache key of a device, None if it can't be shared."""
+        product_id = getattr(device, "product_id", None)
+        if not product_id:
+            return None
+        return f"{getattr(device, 'category', '')}/{product_id}"
+
+    def _load(self) -> None:
+        self._loaded = True
+        if self.path is None or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load device specification cache: {e}")
+            return
+        if data.get("version") != SPECIFICATION_CACHE_VERSION:
+            return
+        self._entries = data.get("entries", {})
+
+    def get(self, key: str, include_expired: bool = False) -> dict[str, Any] | None:
+        """Get a cached specification, None if missing or expired."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not include_expired and time.time() - entry["fetched_at"] > self.ttl:
+            return None
+        return entry["result"]
+
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        """Store a specification."""
+        with self._lock:
+            self._entries[key] = {"fetched_at": time.time(), "result": result}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            data = {"version": SPECIFICATION_CACHE_VERSION, "entries": self._entries}
+            temp_path = f"{self.path}.tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as file:
+                    json.dump(data, file)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Failed to save device specification cache: {e}")
+                return
+            self._dirty = False
+
+
 class TuyaDeviceManager:
     """Tuya Device Manager.
 
@@ -160,6 +244,7 @@ class TuyaDeviceManager:
         mq.add_message_listener(self.on_message)
         self.device_map: dict[str, TuyaDevice] = {}
         self.device_listeners = set()
+        self.specification_cache = TuyaDeviceSpecificationCache()
 
     def __del__(self):
         """Remove mqtt listener after object del."""
@@ -284,29 +369,82 @@ class TuyaDeviceManager:
                     device.status[code] = value
 
     def update_device_function_cache(self, devIds: list = []):
-        """Update device function cache."""
-        device_map = (
-            filter(lambda d: d.id in devIds, self.device_map.values())
-            if devIds
-            else self.device_map.values()
-        )
+        """Update device function cache.
 
-        for device in device_map:
-            response = self.get_device_specification(device.id)
+        Devices of the same product share their specification, which is only
+        fetched once and kept in the specification cache. Missing
+        specifications are fetched concurrently.
+        """
+        devices = [
+            device
+            for device in self.device_map.values()
+            if not devIds or device.id in devIds
+        ]
+
+        specifications: dict[str, dict[str, Any]] = {}
+        to_fetch: dict[str, str] = {}
+        for device in devices:
+            key = self.specification_cache.get_key(device) or device.id
+            if key in specifications or key in to_fetch:
+                continue
+            if (result := self.specification_cache.get(key)) is not None:
+                specifications[key] = result
+            else:
+                to_fetch[key] = device.id
+
+        fetched = self._fetch_device_specifications(list(to_fetch.values()))
+        for key, device_id in to_fetch.items():
+            if (result := fetched.get(device_id)) is not None:
+                specifications[key] = result
+                if key != device_id:
+                    self.specification_cache.set(key, result)
+            elif (
+                result := self.specification_cache.get(key, include_expired=True)
+            ) is not None:
+                # Keep using the expired specification until it can be refreshed
+                specifications[key] = result
+        self.specification_cache.save()
+
+        for device in devices:
+            key = self.specification_cache.get_key(device) or device.id
+            if (result := specifications.get(key)) is None:
+                continue
+            function_map = {}
+            for function in result["functions"]:
+                code = function["code"]
+                function_map[code] = TuyaDeviceFunction(**function)
+
+            status_range = {}
+            for status in result["status"]:
+                code = status["code"]
+                status_range[code] = TuyaDeviceStatusRange(**status)
+
+            device.function = function_map
+            device.status_range = status_range
+
+    def _fetch_device_specifications(
+        self, device_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch the specifications of the devices concurrently."""
+        if not device_ids:
+            return {}
+        workers = min(SPECIFICATION_FETCH_WORKERS, len(device_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                device_id: executor.submit(self.get_device_specification, device_id)
+                for device_id in device_ids
+            }
+
+        specifications: dict[str, dict[str, Any]] = {}
+        for device_id, future in futures.items():
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.warning(f"get_device_specification failed for {device_id}: {e}")
+                continue
             if response.get("success"):
-                result = response.get("result", {})
-                function_map = {}
-                for function in result["functions"]:
-                    code = function["code"]
-                    function_map[code] = TuyaDeviceFunction(**function)
-
-                status_range = {}
-                for status in result["status"]:
-                    code = status["code"]
-                    status_range[code] = TuyaDeviceStatusRange(**status)
-
-                device.function = function_map
-                device.status_range = status_range
+                specifications[device_id] = response.get("result", {})
+        return specifications
 
     def add_device_listener(self, listener: TuyaDeviceListener):
         """Add device listener."""
@@ -7,17 +7,20 @@ from __future__ import annotations
 import json
 import datetime
 import time
+from homeassistant.helpers.storage import STORAGE_DIR
 from ....lib.tuya_iot import (
     TuyaDeviceManager,
 )
 from ....lib.tuya_iot.device import (
     BIZCODE_BIND_USER,
+    TuyaDeviceSpecificationCache,
 )
 from ....lib.tuya_iot.tuya_enums import (
     AuthType,
 )
 from typing import Any, cast
 from ....const import (
+    DOMAIN,
     LOGGER,
     MESSAGE_SOURCE_TUYA_IOT,
     XTDeviceSourcePriority,
@@ -83,6 +86,11 @@ class XTIOTDeviceManager(TuyaDeviceManager):
         self.api = api
         self.mq = mq
         self.home_manager: TuyaHomeManager | None = None
+        self.specification_cache = TuyaDeviceSpecificationCache(
+            multi_manager.hass.config.path(
+                STORAGE_DIR, f"{DOMAIN}.device_specifications"
+            )
+        )
 
     def register_home_manager(self, home_manager: TuyaHomeManager):
         self.home_manager = home_manager
@@ -233,6 +241,10 @@ class XTIOTDeviceManager(TuyaDeviceManager):
     async def async_update_device_function_cache(self, devIds: list = []):
         concurrency_manager = XTConcurrencyManager(max_concurrency=9)
 
+        await XTEventLoopProtector.execute_out_of_event_loop_and_return(
+            super().update_device_function_cache, devIds
+        )
+
         device_map = (
             filter(lambda d: d.id in devIds, self.device_map.values())
             if devIds
@@ -241,7 +253,7 @@ class XTIOTDeviceManager(TuyaDeviceManager):
 
         async def update_single_device(device: XTDevice):
             await XTEventLoopProtector.execute_out_of_event_loop_and_return(
-                self.update_device_function_cache, [device.id]
+                self.merge_open_api_device, device
             )
 
         for device in device_map:
@@ -249,17 +261,15 @@ class XTIOTDeviceManager(TuyaDeviceManager):
         await concurrency_manager.gather()
 
     def update_device_function_cache(self, devIds: list = []):
+        super().update_device_function_cache(devIds)
         for device_id in self.device_map:
-            device = self.device_map[device_id]
             if device_id in devIds or not devIds:
-                super().update_device_function_cache(devIds=[device_id])
-                device_open_api = self.get_open_api_device(device)
-                XTMergingManager.merge_devices(
-                    device, device_open_api, self.multi_manager
-                )
-                self.multi_manager.virtual_state_handler.apply_init_virtual_states(
-                    device
-                )
+                self.merge_open_api_device(self.device_map[device_id])
+
+    def merge_open_api_device(self, device: XTDevice):
+        device_open_api = self.get_open_api_device(device)
+        XTMergingManager.merge_devices(device, device_open_api, self.multi_manager)
+        self.multi_manager.virtual_state_handler.apply_init_virtual_states(device)
 
     def on_message(self, msg: dict):
         super().on_message(msg)
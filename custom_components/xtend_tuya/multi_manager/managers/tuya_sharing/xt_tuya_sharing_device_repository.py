@@ -111,11 +111,11 @@ class XTSharingDeviceRepository(DeviceRepository):
             self.update_device_strategy_info(device)
             _devices.append(device)
 
-        thread_manager: XTThreadingManager = XTThreadingManager()
+        thread_manager: XTThreadingManager = XTThreadingManager(max_concurrency=9)
         if response["success"]:
             for item in response["result"]:
                 thread_manager.add_thread(_query_devices_thread, item=item)
-        thread_manager.start_and_wait(max_concurrency=9)
+        thread_manager.start_and_wait()
         return _devices
 
     def _update_device_strategy_info_mod(self, device: CustomerDevice):
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 import importlib
 import os
 import asyncio
@@ -25,6 +24,7 @@ from .shared.shared_classes import (
     XTConfigEntry,  # noqa: F811
     XTDeviceMap,
     XTDevice,
+    XTDeviceDPCodeLookup,
 )
 from .shared.threading import (
     XTConcurrencyManager,
@@ -95,6 +95,7 @@ class MultiManager:  # noqa: F811
             self.post_setup_callbacks[priority] = []
         self.loading_finalized: bool = False
         self._user_input_flows: dict[str, shared_data_entry.XTFlowDataBase] = {}
+        self._dpcode_lookups: dict[str, XTDeviceDPCodeLookup] = {}
 
     @property
     def device_map(self):
@@ -174,6 +175,7 @@ class MultiManager:  # noqa: F811
 
     async def update_device_cache(self):
         self.is_ready_for_messages = False
+        self._dpcode_lookups.clear()
         XTDeviceMap.clear_master_device_map()
         concurrency_manager = XTConcurrencyManager()
 
@@ -202,6 +204,7 @@ class MultiManager:  # noqa: F811
 
             #Don't allow changes to DPCodes after the global initialization
             device.force_compatibility = True
+            self._get_dpcode_lookup(device)
         self._enable_multi_map_device_alignment()
         self._process_pending_messages()
 
@@ -269,6 +272,16 @@ class MultiManager:  # noqa: F811
         for manager in self.accounts.values():
             manager.remove_device_listeners()
 
+    def _get_dpcode_lookup(self, device: XTDevice) -> XTDeviceDPCodeLookup | None:
+        # DPCodes can still be renamed until the device is fully initialized
+        if not device.force_compatibility or not hasattr(device, "local_strategy"):
+            return None
+        lookup = self._dpcode_lookups.get(device.id)
+        if lookup is None or not lookup.is_valid_for(device):
+            lookup = XTDeviceDPCodeLookup(device)
+            self._dpcode_lookups[device.id] = lookup
+        return lookup
+
     def _read_dpId_from_code(self, code: str, device: XTDevice) -> int | None:
         if not hasattr(device, "local_strategy"):
             return None
@@ -278,6 +291,8 @@ class MultiManager:  # noqa: F811
             and device.status_range[code].dp_id != 0
         ):
             return device.status_range[code].dp_id
+        if lookup := self._get_dpcode_lookup(device):
+            return lookup.code_to_dpid.get(code)
         for dpId in device.local_strategy:
             if device.local_strategy[dpId]["status_code"] == code:
                 return dpId
@@ -293,6 +308,8 @@ class MultiManager:  # noqa: F811
         return None
 
     def _read_code_from_dpId(self, dpId: int, device: XTDevice) -> str | None:
+        if lookup := self._get_dpcode_lookup(device):
+            return lookup.dpid_to_code.get(dpId)
         if dp_id_item := device.local_strategy.get(dpId, None):
             return dp_id_item["status_code"]
         return None
@@ -358,8 +375,11 @@ class MultiManager:  # noqa: F811
     def convert_device_report_status_list(
         self, device_id: str, status_in: list
     ) -> list[dict[str, Any]]:
-        status = copy.deepcopy(status_in)
-        for item in status:
+        # Only the items are rewritten, shallow copies are enough to keep
+        # the incoming message untouched
+        status: list[dict[str, Any]] = []
+        for item_in in status_in:
+            item = dict(item_in)
             code, dpId, value, result_ok = self._read_code_dpid_value_from_state(
                 device_id, item
             )
@@ -367,8 +387,7 @@ class MultiManager:  # noqa: F811
                 item["code"] = code
                 item["dpId"] = dpId
                 item["value"] = value
-            else:
-                pass
+            status.append(item)
         return status
 
     def on_message(self, source: str, msg: dict):
@@ -396,6 +415,7 @@ class MultiManager:  # noqa: F811
             self.accounts[source].on_message(new_message)
 
     def add_device_by_id(self, device_id: str):
+        self._dpcode_lookups.pop(device_id, None)
         for account in self.accounts.values():
             account.add_device_by_id(device_id)
         self.update_master_device_map()
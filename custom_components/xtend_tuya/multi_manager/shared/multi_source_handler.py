@@ -1,5 +1,4 @@
 from __future__ import annotations
-import copy
 from typing import Any
 import custom_components.xtend_tuya.multi_manager.multi_manager as mm
 
@@ -60,61 +59,50 @@ class MultiSourceHandler:
         if not device:
             return
 
-        virtual_states = (
-            self.multi_manager.virtual_state_handler.get_category_virtual_states(
+        virtual_state_keys = (
+            self.multi_manager.virtual_state_handler.get_category_virtual_state_keys(
                 device.category
             )
         )
-        if not virtual_states:
+        if not virtual_state_keys:
             return
 
         for item in status_in:
             code, _, _, result_ok = self.multi_manager._read_code_dpid_value_from_state(
                 dev_id, item, False, True
             )
-            if not result_ok or code is None:
+            if not result_ok or code not in virtual_state_keys:
                 continue
 
-            for virtual_state in virtual_states:
-                if code == virtual_state.key:
-                    self._prepare_structure_for_code(dev_id, code)
-                    self.device_map[dev_id][code].register_source_message(source)
+            self._prepare_structure_for_code(dev_id, code)
+            self.device_map[dev_id][code].register_source_message(source)
 
     def filter_status_list(
         self, dev_id: str, original_source: str, status_in: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        status_list = copy.deepcopy(status_in)
         device = self.multi_manager.device_map.get(dev_id, None)
         if not device:
-            return status_list
+            return list(status_in)
 
         # Only filter for devices that have a VirtualState in their status_list
-        virtual_states = (
-            self.multi_manager.virtual_state_handler.get_category_virtual_states(
+        virtual_state_keys = (
+            self.multi_manager.virtual_state_handler.get_category_virtual_state_keys(
                 device.category
             )
         )
-        if not virtual_states:
-            return status_list
+        if not virtual_state_keys:
+            return list(status_in)
 
-        i = 0
-        for item in status_list:
+        status_list: list[dict[str, Any]] = []
+        for item in status_in:
             code, _, _, result_ok = self.multi_manager._read_code_dpid_value_from_state(
                 dev_id, item, False, True
             )
-            if not result_ok or code is None:
-                continue
-
-            for virtual_state in virtual_states:
-                if code == virtual_state.key:
-                    self._prepare_structure_for_code(dev_id, code)
-                    if not self._is_allowed_source_for_code(
-                        dev_id, code, original_source
-                    ):
-                        status_list.pop(i)
-                        i -= 1
-                        break
-            i += 1
+            if result_ok and code in virtual_state_keys:
+                self._prepare_structure_for_code(dev_id, code)
+                if not self._is_allowed_source_for_code(dev_id, code, original_source):
+                    continue
+            status_list.append(item)
 
         return status_list
 
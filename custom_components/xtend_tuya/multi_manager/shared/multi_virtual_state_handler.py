@@ -13,6 +13,8 @@ class XTVirtualStateHandler:
     def __init__(self, multi_manager: mm.MultiManager) -> None:
         self.descriptors_with_virtual_state = {}
         self.multi_manager = multi_manager
+        self._category_virtual_states: dict[str, list[DescriptionVirtualState]] = {}
+        self._category_virtual_state_keys: dict[str, set[str]] = {}
 
     def register_device_descriptors(self, name: str, descriptors):
         descriptors_with_vs = {}
@@ -39,11 +41,30 @@ class XTVirtualStateHandler:
                 descriptors_with_vs[category] = tuple(description_list_vs)
         if len(descriptors_with_vs) > 0:
             self.descriptors_with_virtual_state[name] = descriptors_with_vs
+            self._category_virtual_states.clear()
+            self._category_virtual_state_keys.clear()
             for device in self.multi_manager.device_map.values():
                 self.apply_init_virtual_states(device)
 
     def get_category_virtual_states(
         self, category: str
+    ) -> list[DescriptionVirtualState]:
+        if (to_return := self._category_virtual_states.get(category)) is None:
+            to_return = self._compute_category_virtual_states(category)
+            self._category_virtual_states[category] = to_return
+        return to_return
+
+    def get_category_virtual_state_keys(self, category: str) -> set[str]:
+        if (keys := self._category_virtual_state_keys.get(category)) is None:
+            keys = {
+                virtual_state.key
+                for virtual_state in self.get_category_virtual_states(category)
+            }
+            self._category_virtual_state_keys[category] = keys
+        return keys
+
+    def _compute_category_virtual_states(
+        self, category: str
     ) -> list[DescriptionVirtualState]:
         to_return = []
         for virtual_state in VirtualStates:
@@ -205,7 +226,8 @@ class XTVirtualStateHandler:
         status_in: list[dict[str, Any]],
         source: str | None = None,
     ) -> list:
-        status = copy.deepcopy(status_in)
+        # Values are only ever replaced in the items, copying them is enough
+        status = [dict(item) for item in status_in]
         virtual_states = self.get_category_virtual_states(device.category)
         debug: bool = False
         for virtual_state in virtual_states:
@@ -453,6 +453,29 @@ class XTDevice(TuyaDevice):
         return dp_info
 
 
+class XTDeviceDPCodeLookup:
+    """Code <-> dpId lookup tables built from the local strategy of a device."""
+
+    def __init__(self, device: XTDevice) -> None:
+        self.local_strategy = device.local_strategy
+        self.local_strategy_size = len(device.local_strategy)
+        self.code_to_dpid: dict[str, int] = {}
+        self.dpid_to_code: dict[int, str] = {}
+        for dpId, dp_item in device.local_strategy.items():
+            if (status_code := dp_item.get("status_code")) is not None:
+                self.dpid_to_code[dpId] = status_code
+                self.code_to_dpid.setdefault(status_code, dpId)
+            for alias in dp_item.get("status_code_alias", []):
+                self.code_to_dpid.setdefault(alias, dpId)
+
+    def is_valid_for(self, device: XTDevice) -> bool:
+        # Local strategies only get new dpIds once the DPCodes are frozen
+        return (
+            self.local_strategy is device.local_strategy
+            and self.local_strategy_size == len(device.local_strategy)
+        )
+
+
 class XTDeviceMap(UserDict[str, XTDevice]):
     device_source_priority: XTDeviceSourcePriority | None = None
     master_device_map: list[XTDeviceMap] = []
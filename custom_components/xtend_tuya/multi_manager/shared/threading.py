@@ -2,6 +2,8 @@ from __future__ import annotations
 import threading
 import inspect
 import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from functools import partial
 from typing import Any
 from homeassistant.core import (
@@ -96,68 +98,79 @@ class XTEventLoopProtector:
                 )
 
 
-class XTThread(threading.Thread):
-    def __init__(self, callable, immediate_start: bool = False, *args, **kwargs):
-        self.callable = callable
-        self.immediate_start = immediate_start
-        self.exception: Exception | None = None
-        super().__init__(target=self.call_thread, args=args, kwargs=kwargs)
-
-    def call_thread(self, *args, **kwargs):
-        try:
-            self.callable(*args, **kwargs)
-        except Exception as e:
-            self.exception = e
-
-    def raise_exception_if_needed(self):
-        if self.exception:
-            raise self.exception
-
-
 class XTThreadingManager:
-    join_timeout: float = 0.05
+    """Run blocking jobs on a bounded thread pool.
+
+    Jobs are queued with add_thread and submitted to the pool by
+    start_all_threads, or submitted right away with submit. The worker
+    threads are reused between jobs and released once all jobs are done.
+    """
 
-    def __init__(self) -> None:
-        self.thread_queue: list[XTThread] = []
-        self.thread_active_list: list[XTThread] = []
-        self.thread_finished_list: list[XTThread] = []
-        self.max_concurrency: int | None = None
+    def __init__(self, max_concurrency: int | None = None) -> None:
+        self.max_concurrency = max_concurrency
+        self.thread_queue: list[tuple[Callable, tuple, dict[str, Any]]] = []
+        self.futures: list[Future] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="xt_threading_manager",
+                )
+            return self._executor
+
+    def submit(
+        self,
+        callable: Callable,
+        *args,
+        done_callback: Callable[[Future], Any] | None = None,
+        **kwargs,
+    ) -> Future:
+        future = self._get_executor().submit(callable, *args, **kwargs)
+        if done_callback is not None:
+            future.add_done_callback(done_callback)
+        self.futures.append(future)
+        return future
 
     def add_thread(self, callable, immediate_start: bool = False, *args, **kwargs):
-        thread = XTThread(callable=callable, *args, **kwargs)
-        self.thread_queue.append(thread)
         if immediate_start:
-            thread.start()
+            self.submit(callable, *args, **kwargs)
+        else:
+            self.thread_queue.append((callable, args, kwargs))
 
     def start_all_threads(self, max_concurrency: int | None = None) -> None:
-        self.max_concurrency = max_concurrency
-        while (
-            max_concurrency is None or len(self.thread_active_list) < max_concurrency
-        ) and len(self.thread_queue) > 0:
-            added_thread = self.thread_queue.pop(0)
-            added_thread.start()
-            self.thread_active_list.append(added_thread)
+        if max_concurrency is not None and self._executor is None:
+            self.max_concurrency = max_concurrency
+        while len(self.thread_queue) > 0:
+            callable, args, kwargs = self.thread_queue.pop(0)
+            self.submit(callable, *args, **kwargs)
 
     def start_and_wait(self, max_concurrency: int | None = None) -> None:
         self.start_all_threads(max_concurrency)
         self.wait_for_all_threads()
 
-    def clean_finished_threads(self):
-        thread_active_list = self.thread_active_list
-        at_least_one_thread_removed: bool = False
-        for thread in thread_active_list:
-            if thread.is_alive() is False:
-                thread.join()
-                self.thread_active_list.remove(thread)
-                self.thread_finished_list.append(thread)
-                at_least_one_thread_removed = True
-        if at_least_one_thread_removed:
-            self.start_all_threads(max_concurrency=self.max_concurrency)
-
     def wait_for_all_threads(self) -> None:
-        while len(self.thread_active_list) > 0:
-            self.clean_finished_threads()
-            if len(self.thread_active_list) > 0:
-                self.thread_active_list[0].join(timeout=self.join_timeout)
-        for thread in self.thread_finished_list:
-            thread.raise_exception_if_needed()
+        futures = self.futures
+        self.futures = []
+        wait(futures)
+        self._shutdown()
+        for future in futures:
+            if not future.cancelled() and (exception := future.exception()):
+                raise exception
+
+    def cancel(self) -> None:
+        """Drop the queued jobs and cancel the ones not started yet."""
+        self.thread_queue.clear()
+        for future in self.futures:
+            future.cancel()
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)